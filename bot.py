@@ -1,21 +1,9 @@
 import discord
 import os
-import aiohttp
-import random
-import urllib.parse
-import spotipy
-import yt_dlp
-from spotipy.oauth2 import SpotifyClientCredentials
 import asyncio
 from discord import app_commands
 from datetime import timedelta, datetime
 from discord.ext import commands, tasks
-import re
-from petpetgif import petpet
-import io
-import time
-from PIL import Image, ImageDraw, ImageFont
-import textwrap
 
 from config.settings import config
 from config.constants import *
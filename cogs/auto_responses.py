@@ -1,39 +1,65 @@
 import discord
 from discord.ext import commands
-import re
+import time
+from config.settings import config
 from utils.logging import BotLogger
+from utils.triggers import Trigger, AUTO_RESPONSE_HITS
+from core.message_pipeline import MessageContext
 
 class AutoResponses(commands.Cog):
+    """Keyword/regex auto-responses, configured from the dashboard trigger table"""
+
     def __init__(self, bot):
         self.bot = bot
+        # {(trigger_id, channel_id): last fired (monotonic)}; kept across config reloads
+        self._last_fired = {}
 
-    @commands.Cog.listener()
-    async def on_message(self, message):
-        if message.author == self.bot.user:
-            return
+    async def cog_load(self):
+        # Responds everywhere, including to other bots (the bot's own messages never reach a stage)
+        self.bot.message_pipeline.add_stage(
+            "auto_responses",
+            self.handle_message,
+            include_bots=True,
+            when=lambda ctx: config.index.auto_responses.has_triggers(ctx.guild_id)
+        )
 
-        content = message.content.lower()
+    def cog_unload(self):
+        self.bot.message_pipeline.remove_stage("auto_responses")
 
-        if 'faggot' in content:
-            try:
-                await message.channel.send('https://cdn.discordapp.com/attachments/1279123313519624212/1316546100617805904/attachment-3.gif')
-                await BotLogger.log(f"Auto-response triggered by keyword in message from {message.author}", "info", "output")
-            except Exception as e:
-                await BotLogger.log_error("Error sending gif", e)
+    def _on_cooldown(self, trigger: Trigger, channel_id: int) -> bool:
+        if not trigger.cooldown:
+            return False
+        key = (trigger.id, channel_id)
+        now = time.monotonic()
+        if now - self._last_fired.get(key, float("-inf")) < trigger.cooldown:
+            return True
+        self._last_fired[key] = now
+        return False
 
-        if re.search(r'\brape\b', content):
-            try:
-                await message.channel.send("https://i.postimg.cc/Z5G9xTvx/rape.webp")
-                await BotLogger.log(f"Auto-response triggered by keyword in message from {message.author}", "info", "output")
-            except Exception as e:
-                await BotLogger.log_error("Error sending rape message", e)
+    async def handle_message(self, ctx: MessageContext):
+        message = ctx.message
+
+        for trigger in config.index.auto_responses.scan(ctx.lowered, ctx.guild_id):
+            if self._on_cooldown(trigger, ctx.channel_id):
+                AUTO_RESPONSE_HITS.inc(trigger=trigger.id, result="cooldown")
+                continue
 
-        if re.search(r'\b(hi|hello|hey|wave)\b', content):
+            AUTO_RESPONSE_HITS.inc(trigger=trigger.id, result="fired")
             try:
-                await message.add_reaction('<a:wave:1166754943785500722>')
-                await BotLogger.log(f"Auto-reacted to greeting from {message.author}", "info", "output")
+                if trigger.action == "react":
+                    await message.add_reaction(trigger.response)
+                elif trigger.action == "reply":
+                    await message.reply(trigger.response, mention_author=False)
+                else:
+                    # "send" and "gif" both post the response (a GIF is just its URL)
+                    await message.channel.send(trigger.response)
+                await BotLogger.log(
+                    f"Auto-response {trigger.id} triggered by message from {message.author}",
+                    "info",
+                    "output"
+                )
             except Exception as e:
-                await BotLogger.log_error("Error reacting to message", e)
+                await BotLogger.log_error(f"Error running auto-response {trigger.id}", e)
 
 async def setup(bot):
     await bot.add_cog(AutoResponses(bot))
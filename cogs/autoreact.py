@@ -1,6 +1,7 @@
 import discord
 from discord.ext import commands
 from config.settings import config
+from core.message_pipeline import MessageContext
 
 
 class AutoReact(commands.Cog):
@@ -12,37 +13,29 @@ class AutoReact(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message):
-        """Handle auto-reactions for configured channels"""
-        # Ignore bot messages
-        if message.author.bot:
-            return
-
-        # Check if message is in a guild
-        if not message.guild:
-            return
+    async def cog_load(self):
+        # Only runs for human messages in channels that have an autoreact rule
+        self.bot.message_pipeline.add_stage(
+            "autoreact",
+            self.handle_message,
+            guild_only=True,
+            channels=lambda: config.index.autoreact_by_channel
+        )
 
-        # Get autoreact config from ConfigManager (fetched from dashboard)
-        guild_id = str(message.guild.id)
-        autoreact_config = config.autoreact_config.get(guild_id)
+    def cog_unload(self):
+        self.bot.message_pipeline.remove_stage("autoreact")
 
-        # Check if autoreact is configured for this guild
-        if not autoreact_config:
-            return
-
-        # Check if message is in the configured channel
-        raw_channel_id = autoreact_config.get("channel_id")
-        try:
-            config_channel_id = int(raw_channel_id) if raw_channel_id is not None else 0
-        except (ValueError, TypeError):
-            return
+    async def handle_message(self, ctx: MessageContext):
+        """Handle auto-reactions for configured channels"""
+        message = ctx.message
 
-        if not config_channel_id or message.channel.id != config_channel_id:
+        # Rules are pre-parsed and keyed by channel (built from the dashboard config)
+        rule = config.index.autoreact_by_channel.get(ctx.channel_id)
+        if rule is None or rule.guild_id != ctx.guild_id:
             return
 
         # Determine if we should react based on the type
-        react_type = autoreact_config.get("type", "all")
+        react_type = rule.react_type
         should_react = False
 
         if react_type == "all":
@@ -54,8 +47,7 @@ class AutoReact(commands.Cog):
 
         # Add reactions if conditions are met
         if should_react:
-            emojis = autoreact_config.get("emojis", [])
-            for emoji in emojis:
+            for emoji in rule.emojis:
                 try:
                     await message.add_reaction(emoji)
                 except discord.HTTPException as e:
@@ -5,6 +5,7 @@ import json
 import os
 from config.constants import ALLOWED_GUILD_ID
 from utils.logging import BotLogger
+from utils.metrics import timed_listener
 
 BOOST_CONFIG_FILE = "boost_config.json"
 
@@ -39,6 +40,7 @@ class Boost(commands.Cog):
             BotLogger.log_error("Error saving boost config file", e, "system")
 
     @commands.Cog.listener()
+    @timed_listener
     async def on_member_update(self, before: discord.Member, after: discord.Member):
         """Detect when a member boosts the server"""
         # Only process events from the allowed guild
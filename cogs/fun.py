@@ -4,12 +4,13 @@ from discord.ext import commands
 import random
 import asyncio
 import io
-from PIL import Image, ImageDraw
-import aiohttp
 from config.settings import config
+from config.constants import AVATAR_SIZES
 from utils.logging import BotLogger
 from utils.embed_builder import EmbedBuilder
 from services.google_search import GoogleSearchService
+from services.avatar_service import avatar_service
+from services.render_service import render_service, image_filename
 
 class Fun(commands.Cog):
     def __init__(self, bot):
@@ -167,13 +168,14 @@ class Fun(commands.Cog):
 
         try:
             buffer = await self._create_ship_image(user1, user2)
+            filename = image_filename("ship", buffer)
             embed = EmbedBuilder.create_embed(
                 title=f"{user1.name} ❤️ {user2.name}",
                 description=f"Ship Percentage: {percent}%\n{comment}",
-                image_url="attachment://ship.png"
+                image_url=f"attachment://{filename}"
             )
 
-            await interaction.followup.send(embed=embed, file=discord.File(buffer, filename="ship.png"))
+            await interaction.followup.send(embed=embed, file=discord.File(buffer, filename=filename))
             await BotLogger.log(f"{interaction.user} used /ship on {user1.name} and {user2.name}: {percent}%", "info", "output")
 
         except Exception as e:
@@ -188,29 +190,12 @@ class Fun(commands.Cog):
         return "Fuh naw there no love in this block."
 
     async def _create_ship_image(self, user1, user2):
-        async with aiohttp.ClientSession() as session:
-            async with session.get(user1.display_avatar.with_format("png").with_size(256).url) as resp1:
-                avatar1_bytes = await resp1.read()
-            async with session.get(user2.display_avatar.with_format("png").with_size(256).url) as resp2:
-                avatar2_bytes = await resp2.read()
-
-        avatar1 = Image.open(io.BytesIO(avatar1_bytes)).resize((256, 256)).convert("RGBA")
-        avatar2 = Image.open(io.BytesIO(avatar2_bytes)).resize((256, 256)).convert("RGBA")
-
-        img = Image.new("RGBA", (256 + 150 + 256, 256), color=(0, 0, 0, 0))
-        img.paste(avatar1, (0, 0), avatar1)
-        img.paste(avatar2, (256 + 150, 0), avatar2)
-
-        draw = ImageDraw.Draw(img)
-        plus_x, plus_y = 256 + 75, 128
-        pink = (255, 105, 180)
-        draw.rectangle([plus_x - 40, plus_y - 15, plus_x + 40, plus_y + 15], fill=pink)
-        draw.rectangle([plus_x - 15, plus_y - 40, plus_x + 15, plus_y + 40], fill=pink)
-
-        buffer = io.BytesIO()
-        img.save(buffer, format="PNG")
-        buffer.seek(0)
-        return buffer
+        avatar1_bytes, avatar2_bytes = await avatar_service.fetch_many((user1, user2), AVATAR_SIZES["ship"])
+        if avatar1_bytes is None or avatar2_bytes is None:
+            raise Exception("Failed to fetch avatars")
+
+        image_bytes = await render_service.render("ship", avatar1_bytes, avatar2_bytes)
+        return io.BytesIO(image_bytes)
 
 async def setup(bot):
     await bot.add_cog(Fun(bot))
\ No newline at end of file
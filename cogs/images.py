@@ -2,13 +2,14 @@ import discord
 from discord.ext import commands
 import random
 import io
-import aiohttp
-from petpetgif import petpet
 from config.settings import config
+from config.constants import AVATAR_SIZES
 from utils.logging import BotLogger
 from utils.embed_builder import EmbedBuilder
 from services.api_client import APIClient
 from services.google_search import GoogleSearchService
+from services.avatar_service import avatar_service
+from services.render_service import render_service, image_filename
 
 class Images(commands.Cog):
     def __init__(self, bot):
@@ -28,22 +29,18 @@ class Images(commands.Cog):
             target = ctx.message.mentions[0]
             author = ctx.author
 
-            avatar_url = target.display_avatar.with_format("png").with_size(512).url
-
-            async with aiohttp.ClientSession() as session:
-                async with session.get(avatar_url) as resp:
-                    avatar_bytes = await resp.read()
-
-            source = io.BytesIO(avatar_bytes)
-            dest = io.BytesIO()
+            avatar_bytes = await avatar_service.fetch(target, AVATAR_SIZES["petpet"])
+            if avatar_bytes is None:
+                await ctx.send("Couldn't fetch that user's avatar, try again!")
+                return
 
-            petpet.make(source, dest)
-            dest.seek(0)
+            dest = io.BytesIO(await render_service.render("petpet", avatar_bytes))
+            filename = image_filename("pet", dest)
 
             embed = EmbedBuilder.create_embed(title=f"{author.name} pets {target.name}")
-            embed.set_image(url="attachment://pet.gif")
+            embed.set_image(url=f"attachment://{filename}")
 
-            await ctx.send(embed=embed, file=discord.File(dest, filename="pet.gif"))
+            await ctx.send(embed=embed, file=discord.File(dest, filename=filename))
             await BotLogger.log(f"{author.name} used ,pet command on {target.name}", "info", "output")
 
         except Exception as e:
@@ -6,9 +6,9 @@ Handles Last.fm authentication, status checks, and settings management.
 import discord
 from discord.ext import commands
 from discord import app_commands
-import aiohttp
 from typing import Optional
 from config.settings import config
+from services.http_session import http_session
 
 
 class LastFm(commands.Cog):
@@ -29,19 +29,18 @@ class LastFm(commands.Cog):
             headers = config.get_api_headers()
             url = f"{self.api_base}{endpoint}"
 
-            async with aiohttp.ClientSession() as session:
-                async with session.request(
-                    method,
-                    url,
-                    headers=headers,
-                    json=json_data
-                ) as response:
-                    if response.status in [200, 201]:
-                        data = await response.json()
-                        return True, data
-                    else:
-                        error_text = await response.text()
-                        return False, error_text
+            async with http_session.request(
+                method,
+                url,
+                headers=headers,
+                json=json_data
+            ) as response:
+                if response.status in [200, 201]:
+                    data = await response.json()
+                    return True, data
+                else:
+                    error_text = await response.text()
+                    return False, error_text
         except Exception as e:
             return False, str(e)
 
@@ -1,109 +1,278 @@
 import discord
-from discord import app_commands
-from discord.ext import commands
+import asyncio
+import csv
+import io
 import json
-import os
-from config.constants import LEVEL_UP_CHANNEL_ID, LEVEL_FILE
+from typing import Dict, Tuple, Union
+from discord import app_commands, ui
+from discord.ext import commands
+from config.constants import LEVEL_UP_CHANNEL_ID, LEADERBOARD_PAGE_SIZE, LEADERBOARD_VIEW_TIMEOUT, LEVEL_UP_ANNOUNCE_LIMIT
 from config.settings import config
 from utils.logging import BotLogger
+from utils.permissions import PermissionChecker
 from utils.embed_builder import EmbedBuilder
 from utils.template_cache import template_cache
 from utils.variable_context import VariableContext
+from core.message_pipeline import MessageContext
+from models.level_store import XPResult, level_store
 
 class Levels(commands.Cog):
     """Handles XP tracking, leveling, and leaderboards"""
 
     def __init__(self, bot):
         self.bot = bot
-        self._ensure_level_file()
 
-    def _ensure_level_file(self):
-        """Create levels.json if it doesn't exist"""
-        if not os.path.exists(LEVEL_FILE):
-            with open(LEVEL_FILE, "w") as f:
-                json.dump({}, f)
+    def _get_xp_for_level(self, level):
+        """Calculate XP required for a given level"""
+        return level_store.curve.xp_for_level(level)
+
+    async def cog_load(self):
+        await level_store.start()
+        # XP is earned in every channel, by humans only
+        self.bot.message_pipeline.add_stage("levels", self.handle_message)
+
+    def cog_unload(self):
+        self.bot.message_pipeline.remove_stage("levels")
+        # Persist right away in case the cog is being reloaded
+        asyncio.create_task(level_store.flush())
+
+    async def handle_message(self, ctx: MessageContext):
+        """Award XP for messages and handle level ups"""
+        message = ctx.message
+        result = level_store.add_xp(message.author.id, 15)
+
+        # Check for level up
+        if result.leveled_up:
+            await self._announce_level_up(message.author, result)
+
+    async def _announce_level_up(self, user: Union[discord.User, discord.Member], result: XPResult):
+        """Send the level up notification for one user"""
+        channel = self.bot.get_channel(LEVEL_UP_CHANNEL_ID)
+        if not channel:
+            return
 
-    def _load_levels(self):
-        """Load levels data from JSON file"""
         try:
-            with open(LEVEL_FILE, "r") as f:
-                return json.load(f)
+            # Try to get template from API
+            template_data = await template_cache.get_template("levels.level_up", "notification")
+
+            if template_data and "template_data" in template_data:
+                # Use template system
+                variables = VariableContext.from_level_data(
+                    user=user,
+                    level=result.level,
+                    xp=result.xp,
+                    xp_needed=self._get_xp_for_level(result.level)
+                )
+                embed = EmbedBuilder.create_from_template(template_data['compiled'], variables)
+            else:
+                # Fallback to original style
+                embed = EmbedBuilder.create_embed(
+                    title="Level Up!",
+                    color=0x9b59b6
+                )
+                embed.description = f"{user.mention} reached **Level {result.level}**"
+                embed.set_thumbnail(url=user.display_avatar.url)
+
+            await channel.send(embed=embed)
+            await BotLogger.log(
+                f"{user.name} leveled up to {result.level}",
+                "info",
+                "system"
+            )
         except Exception as e:
-            BotLogger.log_error("Error loading levels file", e, "system")
-            return {}
+            await BotLogger.log_error("Error sending level up message", e, "system")
+
+    async def _announce_bulk_level_ups(self, results: Dict[int, XPResult], reason: str):
+        """
+        Send one aggregated notification for a bulk XP change
+
+        Args:
+            results: Per-user results from the level store
+            reason: What caused the change (shown in the footer)
+        """
+        leveled = sorted(
+            ((user_id, result) for user_id, result in results.items() if result.leveled_up),
+            key=lambda item: (-item[1].level, item[0])
+        )
+        channel = self.bot.get_channel(LEVEL_UP_CHANNEL_ID)
+        if not leveled or not channel:
+            return
 
-    def _save_levels(self, data):
-        """Save levels data to JSON file"""
+        lines = [
+            f"<@{user_id}> reached **Level {result.level}** (from {result.previous_level})"
+            for user_id, result in leveled[:LEVEL_UP_ANNOUNCE_LIMIT]
+        ]
+        if len(leveled) > LEVEL_UP_ANNOUNCE_LIMIT:
+            lines.append(f"...and {len(leveled) - LEVEL_UP_ANNOUNCE_LIMIT} more")
+
+        embed = EmbedBuilder.create_embed(
+            title=f"Level Up! ({len(leveled)} users)",
+            description="\n".join(lines),
+            color=0x9b59b6
+        )
+        embed.set_footer(text=reason)
         try:
-            with open(LEVEL_FILE, "w") as f:
-                json.dump(data, f, indent=4)
+            await channel.send(embed=embed, allowed_mentions=discord.AllowedMentions.none())
         except Exception as e:
-            BotLogger.log_error("Error saving levels file", e, "system")
+            await BotLogger.log_error("Error sending bulk level up message", e, "system")
+
+    async def _require_admin(self, ctx) -> bool:
+        if PermissionChecker.is_admin(ctx.author.id):
+            return True
+        await ctx.send("You are not allowed to use this command.")
+        await BotLogger.log(
+            f"Unauthorized ,{ctx.command.name} attempt by {ctx.author}",
+            "warning",
+            "command"
+        )
+        return False
+
+    @commands.command(name="xpgrant")
+    async def xp_grant(self, ctx, amount: int, targets: commands.Greedy[Union[discord.Member, discord.Role]]):
+        """Give (or with a negative amount, take) XP from users and roles (admin only)
+
+        Usage:
+            ,xpgrant 500 @user1 @user2 @Role
+        """
+        if not await self._require_admin(ctx):
+            return
 
-    def _get_xp_for_level(self, level):
-        """Calculate XP required for a given level"""
-        return 100 * (level ** 2) + 100 * level
+        user_ids = set()
+        for target in targets:
+            members = target.members if isinstance(target, discord.Role) else [target]
+            user_ids.update(member.id for member in members if not member.bot)
 
-    @commands.Cog.listener()
-    async def on_message(self, message):
-        """Award XP for messages and handle level ups"""
-        # Ignore bot messages
-        if message.author.bot:
+        if not user_ids:
+            await ctx.send("Usage: ,xpgrant <amount> @user/@role ...")
+            return
+
+        results = level_store.grant(user_ids, amount)
+        leveled = sum(1 for result in results.values() if result.leveled_up)
+        await ctx.send(f"{'Granted' if amount >= 0 else 'Removed'} {abs(amount)} XP for {len(results)} users ({leveled} leveled up).")
+        await self._announce_bulk_level_ups(results, f"{amount:+} XP granted by {ctx.author.name}")
+        await BotLogger.log(f"{ctx.author} granted {amount} XP to {len(results)} users", "info", "command")
+
+    @commands.command(name="xpreset")
+    async def xp_reset(self, ctx, *targets: Union[discord.Member, discord.Role, str]):
+        """Reset XP for users and roles, or everyone with "all" (admin only)
+
+        Usage:
+            ,xpreset @user1 @Role
+            ,xpreset all
+        """
+        if not await self._require_admin(ctx):
             return
 
-        levels = self._load_levels()
-        user_id = str(message.author.id)
+        if targets == ("all",):
+            removed = level_store.reset()
+        else:
+            user_ids = set()
+            for target in targets:
+                if isinstance(target, discord.Role):
+                    user_ids.update(member.id for member in target.members)
+                elif isinstance(target, discord.Member):
+                    user_ids.add(target.id)
+            if not user_ids:
+                await ctx.send("Usage: ,xpreset @user/@role ... or ,xpreset all")
+                return
+            removed = level_store.reset(user_ids)
+
+        await ctx.send(f"Reset XP for {removed} users.")
+        await BotLogger.log(f"{ctx.author} reset XP for {removed} users", "info", "command")
+
+    @commands.command(name="xpdecay")
+    async def xp_decay(self, ctx, percent: float):
+        """Take a percentage of everyone's XP away, e.g. for a new season (admin only)
+
+        Usage:
+            ,xpdecay 25   (everyone keeps 75% of their XP)
+            ,xpdecay 100  (seasonal reset: everyone back to level 1, still listed)
+        """
+        if not await self._require_admin(ctx):
+            return
 
-        # Initialize user if not in database
-        if user_id not in levels:
-            levels[user_id] = {"xp": 0, "level": 1}
+        if not 0 < percent <= 100:
+            await ctx.send("Usage: ,xpdecay <percent between 0 and 100>")
+            return
 
-        # Award XP
-        levels[user_id]["xp"] += 15
+        affected = level_store.decay(percent)
+        await ctx.send(f"Removed {percent:g}% of XP from {affected} users.")
+        await BotLogger.log(f"{ctx.author} decayed XP by {percent:g}% for {affected} users", "info", "command")
 
-        current_level = levels[user_id]["level"]
-        required_xp = self._get_xp_for_level(current_level)
+    levels_group = app_commands.Group(name="levels", description="Level system administration")
 
-        # Check for level up
-        if levels[user_id]["xp"] >= required_xp:
-            levels[user_id]["level"] += 1
-            levels[user_id]["xp"] -= required_xp
-
-            # Send level up notification
-            channel = self.bot.get_channel(LEVEL_UP_CHANNEL_ID)
-            if channel:
-                try:
-                    # Try to get template from API
-                    template_data = await template_cache.get_template("levels.level_up", "notification")
-
-                    if template_data and "template_data" in template_data:
-                        # Use template system
-                        variables = VariableContext.from_level_data(
-                            user=message.author,
-                            level=levels[user_id]['level'],
-                            xp=levels[user_id]['xp'],
-                            xp_needed=self._get_xp_for_level(levels[user_id]['level'])
-                        )
-                        embed = EmbedBuilder.create_from_template(template_data['template_data'], variables)
-                    else:
-                        # Fallback to original style
-                        embed = EmbedBuilder.create_embed(
-                            title="Level Up!",
-                            color=0x9b59b6
-                        )
-                        embed.description = f"{message.author.mention} reached **Level {levels[user_id]['level']}**"
-                        embed.set_thumbnail(url=message.author.display_avatar.url)
-
-                    await channel.send(embed=embed)
-                    await BotLogger.log(
-                        f"{message.author.name} leveled up to {levels[user_id]['level']}",
-                        "info",
-                        "system"
-                    )
-                except Exception as e:
-                    await BotLogger.log_error("Error sending level up message", e, "system")
-
-        self._save_levels(levels)
+    @levels_group.command(name="stats", description="Show how levels and XP are distributed (admin only)")
+    async def levels_stats(self, interaction: discord.Interaction):
+        """Show level/XP distribution statistics (slash command)"""
+        if not PermissionChecker.is_admin(interaction.user.id):
+            await interaction.response.send_message("You are not allowed to use this command.", ephemeral=True)
+            return
+
+        stats = level_store.stats()
+        embed = EmbedBuilder.create_embed(
+            title="Level Stats",
+            color=0x9b59b6
+        )
+        embed.add_field(name="Users", value=str(stats.users), inline=True)
+        embed.add_field(name="Total XP", value=f"{stats.total_xp:,}", inline=True)
+        embed.add_field(name="Max Level", value=str(stats.max_level), inline=True)
+        embed.add_field(name="Mean / Median Level", value=f"{stats.mean_level:.1f} / {stats.median_level}", inline=True)
+        embed.add_field(name="90th / 99th pct XP", value=f"{stats.p90_xp:,} / {stats.p99_xp:,}", inline=True)
+
+        widest = max((count for _, count in stats.histogram), default=0) or 1
+        edges = [edge for edge, _ in stats.histogram]
+        lines = []
+        for i, (edge, count) in enumerate(stats.histogram):
+            upper = edges[i + 1] - 1 if i + 1 < len(edges) else None
+            label = f"{edge}+" if upper is None else (str(edge) if upper == edge else f"{edge}-{upper}")
+            lines.append(f"{label:>7} {'█' * round(20 * count / widest):<20} {count}")
+        embed.add_field(name="Users by Level", value="```\n" + "\n".join(lines) + "\n```", inline=False)
+        embed.set_footer(text=f"Engine: {type(level_store).__name__}")
+
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await BotLogger.log(f"{interaction.user} viewed level stats", "info", "command")
+
+    @commands.command(name="xpimport")
+    async def xp_import(self, ctx, mode: str = "replace"):
+        """Import lifetime XP from an attached JSON or CSV file (admin only)
+
+        Usage:
+            ,xpimport [replace|add]  (with the export attached)
+
+        Accepted files:
+            JSON {"user_id": total_xp, ...}
+            JSON [{"id"/"user_id": ..., "xp"/"total_xp": ...}, ...]
+            JSON in this bot's levels.json shape {"user_id": {"level": ..., "xp": ...}}
+            CSV with user_id/id and xp/total_xp columns
+        """
+        if not await self._require_admin(ctx):
+            return
+
+        mode = mode.lower()
+        if mode not in ("replace", "add") or not ctx.message.attachments:
+            await ctx.send("Usage: ,xpimport [replace|add] with a JSON or CSV export attached")
+            return
+
+        attachment = ctx.message.attachments[0]
+        try:
+            data = await attachment.read()
+            imported = await asyncio.to_thread(_parse_xp_import, data, attachment.filename)
+        except Exception as e:
+            await ctx.send(f"Could not read `{attachment.filename}`: {e}")
+            return
+
+        imported = {
+            user_id: level_store.curve.to_total(*value) if isinstance(value, tuple) else value
+            for user_id, value in imported.items()
+        }
+        if mode == "add":
+            imported = {user_id: level_store.total_xp(user_id) + total for user_id, total in imported.items()}
+        results = level_store.set_totals(imported)
+
+        leveled = sum(1 for result in results.values() if result.leveled_up)
+        await ctx.send(f"Imported XP for {len(results)} users ({mode}, {leveled} leveled up).")
+        await self._announce_bulk_level_ups(results, f"XP import by {ctx.author.name}")
+        await BotLogger.log(f"{ctx.author} imported XP for {len(results)} users ({mode})", "info", "command")
 
     @commands.command(name="rank")
     async def rank_prefix(self, ctx, member: discord.Member = None):
@@ -113,15 +282,13 @@ class Levels(commands.Cog):
             return
 
         member = member or ctx.author
-        levels = self._load_levels()
-        user_id = str(member.id)
+        entry = level_store.get(member.id)
 
-        if user_id not in levels:
+        if entry is None:
             await ctx.send(f"{member.mention} has no XP yet.")
             return
 
-        level = levels[user_id]["level"]
-        xp = levels[user_id]["xp"]
+        level, xp = entry
         next_level_xp = self._get_xp_for_level(level)
         xp_needed = next_level_xp - xp
 
@@ -136,7 +303,9 @@ class Levels(commands.Cog):
                 xp=xp,
                 xp_needed=xp_needed
             )
-            embed = EmbedBuilder.create_from_template(template_data['template_data'], variables)
+            # Only computed if the template shows it
+            variables.provide("rank", lambda: str(level_store.rank_of(member.id)))
+            embed = EmbedBuilder.create_from_template(template_data['compiled'], variables)
         else:
             # Fallback to original style
             embed = EmbedBuilder.create_embed(
@@ -147,6 +316,7 @@ class Levels(commands.Cog):
             embed.add_field(name="Level", value=str(level), inline=True)
             embed.add_field(name="Current XP", value=str(xp), inline=True)
             embed.add_field(name="XP to Next Level", value=str(xp_needed), inline=True)
+            embed.add_field(name="Rank", value=f"#{level_store.rank_of(member.id)} of {len(level_store)}", inline=True)
 
         await ctx.send(embed=embed)
         await BotLogger.log(f"{ctx.author} checked rank for {member.name}", "info", "command")
@@ -162,15 +332,13 @@ class Levels(commands.Cog):
             return
 
         member = member or interaction.user
-        levels = self._load_levels()
-        user_id = str(member.id)
+        entry = level_store.get(member.id)
 
-        if user_id not in levels:
+        if entry is None:
             await interaction.followup.send(f"{member.mention} has no XP yet.")
             return
 
-        level = levels[user_id]["level"]
-        xp = levels[user_id]["xp"]
+        level, xp = entry
         next_level_xp = self._get_xp_for_level(level)
         xp_needed = next_level_xp - xp
 
@@ -185,7 +353,9 @@ class Levels(commands.Cog):
                 xp=xp,
                 xp_needed=xp_needed
             )
-            embed = EmbedBuilder.create_from_template(template_data['template_data'], variables)
+            # Only computed if the template shows it
+            variables.provide("rank", lambda: str(level_store.rank_of(member.id)))
+            embed = EmbedBuilder.create_from_template(template_data['compiled'], variables)
         else:
             # Fallback to original style
             embed = EmbedBuilder.create_embed(
@@ -196,101 +366,183 @@ class Levels(commands.Cog):
             embed.add_field(name="Level", value=str(level), inline=True)
             embed.add_field(name="Current XP", value=str(xp), inline=True)
             embed.add_field(name="XP to Next Level", value=str(xp_needed), inline=True)
+            embed.add_field(name="Rank", value=f"#{level_store.rank_of(member.id)} of {len(level_store)}", inline=True)
 
         await interaction.followup.send(embed=embed)
         await BotLogger.log(f"{interaction.user} checked rank for {member.name}", "info", "command")
 
-    @commands.command(name="leaderboard")
-    async def leaderboard_prefix(self, ctx):
-        """Show the top 10 users by level (prefix command)"""
-        if config.is_command_disabled("leaderboard"):
-            await ctx.send("The `leaderboard` command is currently disabled.")
-            return
-
-        levels = self._load_levels()
-        if not levels:
-            await ctx.send("Leaderboard is empty.")
-            return
-
-        # Sort by level (descending), then by XP (descending)
-        sorted_users = sorted(
-            levels.items(),
-            key=lambda x: (x[1]["level"], x[1]["xp"]),
-            reverse=True
-        )[:10]
+    async def _build_leaderboard_embed(self, page: int, highlight_id: int = None) -> discord.Embed:
+        """Build one leaderboard page (0-based) straight from the rank index"""
+        total = len(level_store)
+        pages = max(1, -(-total // LEADERBOARD_PAGE_SIZE))
+        page = min(max(page, 0), pages - 1)
+        offset = page * LEADERBOARD_PAGE_SIZE
 
         # Try to get template from API
         template_data = await template_cache.get_template("levels.leaderboard", "default")
 
         if template_data and "template_data" in template_data:
             # Use template system for base structure
-            embed = EmbedBuilder.create_from_template(template_data['template_data'], {})
+            embed = EmbedBuilder.create_from_template(template_data['compiled'], {})
         else:
             # Fallback to original style
             embed = EmbedBuilder.create_embed(
-                title="Leaderboard - Top 10",
+                title="Leaderboard",
                 color=0x9b59b6
             )
 
         # Add dynamic fields (always done regardless of template)
-        for i, (user_id, data) in enumerate(sorted_users, 1):
-            user = self.bot.get_user(int(user_id))
+        for i, (user_id, entry) in enumerate(level_store.page(offset, LEADERBOARD_PAGE_SIZE), offset + 1):
+            user = self.bot.get_user(user_id)
             name = user.name if user else "Unknown User"
+            marker = " ◀" if user_id == highlight_id else ""
             embed.add_field(
-                name=f"{i}. {name}",
-                value=f"Level {data['level']} ({data['xp']} XP)",
+                name=f"{i}. {name}{marker}",
+                value=f"Level {entry.level} ({entry.xp} XP)",
                 inline=False
             )
 
-        await ctx.send(embed=embed)
+        embed.set_footer(text=f"Page {page + 1}/{pages} • {total} ranked users")
+        return embed
+
+    @commands.command(name="leaderboard")
+    async def leaderboard_prefix(self, ctx):
+        """Show the leaderboard, 10 users per page (prefix command)"""
+        if config.is_command_disabled("leaderboard"):
+            await ctx.send("The `leaderboard` command is currently disabled.")
+            return
+
+        if not len(level_store):
+            await ctx.send("Leaderboard is empty.")
+            return
+
+        view = LeaderboardView(self, ctx.author.id)
+        view.message = await ctx.send(embed=await self._build_leaderboard_embed(0), view=view)
         await BotLogger.log(f"{ctx.author} viewed leaderboard", "info", "command")
 
-    @app_commands.command(name="leaderboard", description="View the top 10 users by level")
+    @app_commands.command(name="leaderboard", description="Browse the leaderboard by level")
     async def leaderboard_slash(self, interaction: discord.Interaction):
-        """Show the top 10 users by level (slash command)"""
+        """Show the leaderboard, 10 users per page (slash command)"""
         await interaction.response.defer()
 
         if config.is_command_disabled("leaderboard"):
             await interaction.followup.send("The `leaderboard` command is currently disabled.")
             return
 
-        levels = self._load_levels()
-        if not levels:
+        if not len(level_store):
             await interaction.followup.send("Leaderboard is empty.")
             return
 
-        # Sort by level (descending), then by XP (descending)
-        sorted_users = sorted(
-            levels.items(),
-            key=lambda x: (x[1]["level"], x[1]["xp"]),
-            reverse=True
-        )[:10]
-
-        # Try to get template from API
-        template_data = await template_cache.get_template("levels.leaderboard", "default")
+        view = LeaderboardView(self, interaction.user.id)
+        view.message = await interaction.followup.send(embed=await self._build_leaderboard_embed(0), view=view, wait=True)
+        await BotLogger.log(f"{interaction.user} viewed leaderboard", "info", "command")
 
-        if template_data and "template_data" in template_data:
-            # Use template system for base structure
-            embed = EmbedBuilder.create_from_template(template_data['template_data'], {})
+class LeaderboardView(ui.View):
+    """Page through the full leaderboard; only the user who opened it can use the buttons"""
+
+    def __init__(self, cog: Levels, owner_id: int):
+        super().__init__(timeout=LEADERBOARD_VIEW_TIMEOUT)
+        self.cog = cog
+        self.owner_id = owner_id
+        self.page = 0
+        self.highlight_id = None
+        self.message = None
+
+    def _page_count(self) -> int:
+        return max(1, -(-len(level_store) // LEADERBOARD_PAGE_SIZE))
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.owner_id:
+            await interaction.response.send_message("Run the leaderboard command yourself to browse it.", ephemeral=True)
+            return False
+        return True
+
+    async def _show(self, interaction: discord.Interaction, page: int):
+        self.page = min(max(page, 0), self._page_count() - 1)
+        embed = await self.cog._build_leaderboard_embed(self.page, self.highlight_id)
+        await interaction.response.edit_message(embed=embed, view=self)
+
+    async def on_timeout(self):
+        if self.message is not None:
+            try:
+                await self.message.edit(view=None)
+            except discord.HTTPException:
+                pass
+
+    @ui.button(label="⏮", style=discord.ButtonStyle.secondary)
+    async def first(self, interaction: discord.Interaction, button: ui.Button):
+        await self._show(interaction, 0)
+
+    @ui.button(label="◀ Prev", style=discord.ButtonStyle.primary)
+    async def previous(self, interaction: discord.Interaction, button: ui.Button):
+        await self._show(interaction, self.page - 1)
+
+    @ui.button(label="Next ▶", style=discord.ButtonStyle.primary)
+    async def next(self, interaction: discord.Interaction, button: ui.Button):
+        await self._show(interaction, self.page + 1)
+
+    @ui.button(label="⏭", style=discord.ButtonStyle.secondary)
+    async def last(self, interaction: discord.Interaction, button: ui.Button):
+        await self._show(interaction, self._page_count() - 1)
+
+    @ui.button(label="📍 My position", style=discord.ButtonStyle.success)
+    async def my_position(self, interaction: discord.Interaction, button: ui.Button):
+        rank = level_store.rank_of(interaction.user.id)
+        if rank is None:
+            await interaction.response.send_message("You have no XP yet.", ephemeral=True)
+            return
+        self.highlight_id = interaction.user.id
+        await self._show(interaction, (rank - 1) // LEADERBOARD_PAGE_SIZE)
+
+def _parse_xp_import(data: bytes, filename: str) -> Dict[int, Union[int, Tuple[int, int]]]:
+    """
+    Parse an XP export into lifetime XP per user
+
+    Args:
+        data: Raw file contents
+        filename: Attachment name (.csv is read as CSV, anything else as JSON)
+
+    Returns:
+        {user_id: lifetime XP, or a (level, xp) pair for levels.json entries};
+        rows without a usable ID or XP are skipped
+    """
+    text = data.decode("utf-8-sig")
+    totals = {}
+
+    if filename.lower().endswith(".csv"):
+        rows = csv.DictReader(io.StringIO(text))
+    else:
+        raw = json.loads(text)
+        if isinstance(raw, dict):
+            rows = []
+            for user_id, value in raw.items():
+                if isinstance(value, dict):
+                    # levels.json shape: XP is counted from the start of the level,
+                    # converted to a total on the event loop (the curve isn't thread-safe)
+                    try:
+                        totals[int(user_id)] = (int(value["level"]), int(value["xp"]))
+                    except (KeyError, ValueError, TypeError):
+                        continue
+                else:
+                    rows.append({"id": user_id, "xp": value})
+        elif isinstance(raw, list):
+            rows = raw
         else:
-            # Fallback to original style
-            embed = EmbedBuilder.create_embed(
-                title="Leaderboard - Top 10",
-                color=0x9b59b6
-            )
+            raise ValueError("expected a JSON object or list")
 
-        # Add dynamic fields (always done regardless of template)
-        for i, (user_id, data) in enumerate(sorted_users, 1):
-            user = self.bot.get_user(int(user_id))
-            name = user.name if user else "Unknown User"
-            embed.add_field(
-                name=f"{i}. {name}",
-                value=f"Level {data['level']} ({data['xp']} XP)",
-                inline=False
-            )
-
-        await interaction.followup.send(embed=embed)
-        await BotLogger.log(f"{interaction.user} viewed leaderboard", "info", "command")
+    for row in rows:
+        if not isinstance(row, dict):
+            continue
+        try:
+            user_id = int(row.get("user_id") or row.get("id"))
+            total = int(float(row.get("total_xp") or row.get("xp") or 0))
+        except (ValueError, TypeError):
+            continue
+        totals[user_id] = total
+
+    if not totals:
+        raise ValueError("no user XP entries found")
+    return totals
 
 async def setup(bot):
     await bot.add_cog(Levels(bot))
@@ -6,6 +6,7 @@ from utils.logging import BotLogger
 from utils.embed_builder import EmbedBuilder
 from services.google_search import GoogleSearchService
 from services.image_processor import ImageProcessor
+from services.render_service import image_filename
 
 class Memes(commands.Cog):
     def __init__(self, bot):
@@ -28,15 +29,14 @@ class Memes(commands.Cog):
                 await ctx.send("The replied message could not be quoted, try again!")
                 return
 
-            avatar_url = str(author.display_avatar.url)
-
             # Create quote image
-            buffer = await ImageProcessor.create_quote_image(avatar_url, content, author.name)
+            buffer = await ImageProcessor.create_quote_image(author, content, author.name)
 
+            filename = image_filename("quote", buffer)
             embed = EmbedBuilder.create_embed()
-            embed.set_image(url="attachment://quote.png")
+            embed.set_image(url=f"attachment://{filename}")
 
-            await ctx.send(embed=embed, file=discord.File(buffer, filename="quote.png"))
+            await ctx.send(embed=embed, file=discord.File(buffer, filename=filename))
             await BotLogger.log(
                 f"{ctx.author} used ,quote command on message by {author.name}",
                 "info",
@@ -80,10 +80,11 @@ class Memes(commands.Cog):
             # Create meme with text overlay
             buffer = await ImageProcessor.create_meme(template_url, top, bottom)
 
+            filename = image_filename("meme", buffer)
             embed = EmbedBuilder.create_embed()
-            embed.set_image(url="attachment://meme.png")
+            embed.set_image(url=f"attachment://{filename}")
 
-            await interaction.followup.send(embed=embed, file=discord.File(buffer, filename="meme.png"))
+            await interaction.followup.send(embed=embed, file=discord.File(buffer, filename=filename))
             await BotLogger.log(
                 f"{interaction.user} used /meme command with query='{query[:50]}' top='{top[:50]}' bottom='{bottom[:50]}'",
                 "info",
@@ -1,46 +1,51 @@
 import discord
 from discord import app_commands, ui
 from discord.ext import commands, tasks
-import aiohttp
 import asyncio
 import wavelink
-import spotipy
-from spotipy.oauth2 import SpotifyClientCredentials
 import urllib.parse
 import os
-import yt_dlp
 import time
 from datetime import datetime
 from config.settings import config
 from config.constants import LAVALINK_URI
 from utils.logging import BotLogger
 from utils.embed_builder import EmbedBuilder
+from utils.metrics import timed_listener
+from services.http_session import http_session
+from services.sdk_executor import spotify_executor
 
 # Spotify setup
 SPOTIFY_CLIENT_ID = os.getenv('SPOTIFY_CLIENT_ID')
 SPOTIFY_CLIENT_SECRET = os.getenv('SPOTIFY_CLIENT_SECRET')
 
-sp = None
-if SPOTIFY_CLIENT_ID and SPOTIFY_CLIENT_SECRET:
-    try:
-        sp = spotipy.Spotify(auth_manager=SpotifyClientCredentials(
-            client_id=SPOTIFY_CLIENT_ID, client_secret=SPOTIFY_CLIENT_SECRET))
-    except Exception as e:
-        print(f"Failed to initialize Spotify: {e}")
+_spotify = None
+
+def get_spotify():
+    """
+    Build the Spotify client on first use
+
+    spotipy is only imported once a Spotify link is actually played, so a bot
+    that never sees one never pays for it. Blocking; call it through
+    spotify_executor.
+
+    Returns:
+        The shared spotipy client, or None if Spotify is not configured
+    """
+    global _spotify
+    if _spotify is None and SPOTIFY_CLIENT_ID and SPOTIFY_CLIENT_SECRET:
+        try:
+            import spotipy
+            from spotipy.oauth2 import SpotifyClientCredentials
+            _spotify = spotipy.Spotify(auth_manager=SpotifyClientCredentials(
+                client_id=SPOTIFY_CLIENT_ID, client_secret=SPOTIFY_CLIENT_SECRET))
+        except Exception as e:
+            print(f"Failed to initialize Spotify: {e}")
+    return _spotify
 
 # Lavalink config
 LAVALINK_PASSWORD = os.getenv('LAVALINK_SERVER_PASSWORD', '')
 
-# yt-dlp config
-ytdl_options = {
-    'format': 'bestaudio/best',
-    'noplaylist': True,
-    'quiet': True,
-    'no_warnings': True,
-    'default_search': 'ytsearch',
-}
-ytdl = yt_dlp.YoutubeDL(ytdl_options)
-
 
 class QueueView(ui.View):
     """Interactive buttons for queue management"""
@@ -176,13 +181,12 @@ class Music(commands.Cog):
             headers = config.get_api_headers()
             url = f"{self.api_base}{endpoint}"
 
-            async with aiohttp.ClientSession() as session:
-                async with session.request(method, url, headers=headers, json=json_data) as response:
-                    if response.status in [200, 201]:
-                        data = await response.json()
-                        return True, data
-                    else:
-                        return False, await response.text()
+            async with http_session.request(method, url, headers=headers, json=json_data) as response:
+                if response.status in [200, 201]:
+                    data = await response.json()
+                    return True, data
+                else:
+                    return False, await response.text()
         except Exception as e:
             print(f"[Music] API request error: {e}")
             return False, str(e)
@@ -321,10 +325,12 @@ class Music(commands.Cog):
         await self.bot.wait_until_ready()
 
     @commands.Cog.listener()
+    @timed_listener
     async def on_wavelink_node_ready(self, payload: wavelink.NodeReadyEventPayload):
         print(f"[Music] Wavelink node ready: {payload.node.identifier}")
 
     @commands.Cog.listener()
+    @timed_listener
     async def on_wavelink_track_start(self, payload: wavelink.TrackStartEventPayload):
         print(f"[Music] Track started: {payload.track.title} (duration: {payload.track.length}ms)")
 
@@ -351,6 +357,7 @@ class Music(commands.Cog):
             self.scrobble_tasks[guild_id] = task
 
     @commands.Cog.listener()
+    @timed_listener
     async def on_wavelink_track_end(self, payload: wavelink.TrackEndEventPayload):
         print(f"[Music] Track ended: {payload.track.title} (reason: {payload.reason})")
 
@@ -376,10 +383,12 @@ class Music(commands.Cog):
             print(f"[Music] Auto-playing next: {next_track.title}")
 
     @commands.Cog.listener()
+    @timed_listener
     async def on_wavelink_track_exception(self, payload: wavelink.TrackExceptionEventPayload):
         print(f"[Music] Track exception: {payload.track.title} - {payload.exception}")
 
     @commands.Cog.listener()
+    @timed_listener
     async def on_wavelink_track_stuck(self, payload: wavelink.TrackStuckEventPayload):
         print(f"[Music] Track stuck: {payload.track.title} (threshold: {payload.threshold_ms}ms)")
 
@@ -475,11 +484,14 @@ class Music(commands.Cog):
         search = query
         if "spotify" in query:
             print(f"[playspotify] Detected Spotify link, parsing...")
-            if not sp:
-                print("[playspotify] Spotify client not configured")
-                await interaction.followup.send("Spotify is not configured.")
-                return
             try:
+                # Inside the try: the executor can time out before the client is even built
+                sp = await spotify_executor.run(get_spotify)
+                if not sp:
+                    print("[playspotify] Spotify client not configured")
+                    await interaction.followup.send("Spotify is not configured.")
+                    return
+
                 track_id = None
                 if "spotify:track:" in query:
                     track_id = query.split("spotify:track:")[1].split("?")[0]
@@ -492,7 +504,7 @@ class Music(commands.Cog):
                     return
 
                 print(f"[playspotify] Fetching Spotify track: {track_id}")
-                track = sp.track(track_id)
+                track = await spotify_executor.run(sp.track, track_id)
                 search = f"{track['name']} {track['artists'][0]['name']}"
                 print(f"[playspotify] Spotify track resolved to search: {search}")
             except Exception as e:
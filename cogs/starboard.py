@@ -4,6 +4,7 @@ import json
 import os
 from typing import Dict, Set
 from config.settings import config
+from utils.metrics import timed_listener
 
 
 STARRED_MESSAGES_FILE = "data/starred_messages.json"
@@ -57,32 +58,18 @@ class Starboard(commands.Cog):
             self._save_starred_messages()
 
     @commands.Cog.listener()
+    @timed_listener
     async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
         """Handle reaction additions for starboard"""
-        # Get guild ID as string for consistency with config structure
-        guild_id = str(payload.guild_id)
-
-        # Get starboard config from ConfigManager (fetched from dashboard)
-        starboard_config = config.starboard_config.get(guild_id)
-
-        # Check if starboard is configured for this guild
-        if not starboard_config:
+        # Rules are pre-parsed and keyed by (channel, emoji) from the dashboard config
+        emoji = payload.emoji
+        rule = config.index.starboard_by_channel_emoji.get((payload.channel_id, emoji.id or emoji.name))
+        if rule is None or rule.guild_id != payload.guild_id:
             return
 
-        # Check if reaction is in monitored channel
-        monitored_channel_id = starboard_config.get("monitored_channel_id")
-        try:
-            monitored_channel_id = int(monitored_channel_id)
-        except (ValueError, TypeError):
-            return
-
-        if payload.channel_id != monitored_channel_id:
-            return
-
-        # Check if reaction is the configured emoji
-        configured_emoji = starboard_config.get("emoji")
-        if not configured_emoji or str(payload.emoji) != configured_emoji:
-            return
+        configured_emoji = rule.emoji
+        # Guild ID as string for consistency with the starred messages file
+        guild_id = str(payload.guild_id)
 
         # Get guild and channel
         guild = self.bot.get_guild(payload.guild_id)
@@ -108,10 +95,7 @@ class Starboard(commands.Cog):
             return
 
         # Get the reaction and check if threshold is met
-        try:
-            threshold = int(starboard_config.get("threshold", 5))
-        except (ValueError, TypeError):
-            threshold = 5
+        threshold = rule.threshold
             
         reaction = discord.utils.get(message.reactions, emoji=configured_emoji)
         
@@ -121,11 +105,7 @@ class Starboard(commands.Cog):
             return
 
         # Get starboard channel
-        starboard_channel_id = starboard_config.get("starboard_channel_id")
-        try:
-            starboard_channel_id = int(starboard_channel_id)
-        except (ValueError, TypeError):
-            return
+        starboard_channel_id = rule.starboard_channel_id
 
         starboard_channel = guild.get_channel(starboard_channel_id)
         if not starboard_channel:
@@ -1,7 +1,6 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-import aiohttp
 import asyncio
 from datetime import datetime, timedelta
 from config.settings import config
@@ -9,6 +8,7 @@ from utils.logging import BotLogger
 from utils.embed_builder import EmbedBuilder
 from utils.formatters import Formatters
 from models.reminder import reminder_manager
+from services.http_session import http_session
 
 class Utility(commands.Cog):
     def __init__(self, bot):
@@ -118,52 +118,51 @@ class Utility(commands.Cog):
             return
 
         try:
-            async with aiohttp.ClientSession() as session:
-                # First, geocode the location to get coordinates
-                geocode_params = {
-                    "name": location,
-                    "count": 1,
-                    "language": "en",
-                    "format": "json"
-                }
-                async with session.get(
-                    "https://geocoding-api.open-meteo.com/v1/search",
-                    params=geocode_params
-                ) as geo_resp:
-                    if geo_resp.status != 200:
-                        await interaction.followup.send("Failed to find location.")
-                        await BotLogger.log(f"Weather geocoding error: {geo_resp.status}", "error", "command")
-                        return
-                    geo_data = await geo_resp.json()
-
-                if not geo_data.get("results"):
-                    await interaction.followup.send(f"Location '{location}' not found.")
+            # First, geocode the location to get coordinates
+            geocode_params = {
+                "name": location,
+                "count": 1,
+                "language": "en",
+                "format": "json"
+            }
+            async with http_session.get(
+                "https://geocoding-api.open-meteo.com/v1/search",
+                params=geocode_params
+            ) as geo_resp:
+                if geo_resp.status != 200:
+                    await interaction.followup.send("Failed to find location.")
+                    await BotLogger.log(f"Weather geocoding error: {geo_resp.status}", "error", "command")
                     return
+                geo_data = await geo_resp.json()
+
+            if not geo_data.get("results"):
+                await interaction.followup.send(f"Location '{location}' not found.")
+                return
 
-                result = geo_data["results"][0]
-                lat = result["latitude"]
-                lon = result["longitude"]
-                city_name = result["name"]
-                country = result.get("country", "")
-
-                # Now get weather data
-                weather_params = {
-                    "latitude": lat,
-                    "longitude": lon,
-                    "current": "temperature_2m,weather_code,wind_speed_10m,relative_humidity_2m",
-                    "temperature_unit": "celsius",
-                    "wind_speed_unit": "kmh",
-                    "timezone": "auto"
-                }
-                async with session.get(
-                    "https://api.open-meteo.com/v1/forecast",
-                    params=weather_params
-                ) as weather_resp:
-                    if weather_resp.status != 200:
-                        await interaction.followup.send("Failed to fetch weather data.")
-                        await BotLogger.log(f"Weather API error: {weather_resp.status}", "error", "command")
-                        return
-                    data = await weather_resp.json()
+            result = geo_data["results"][0]
+            lat = result["latitude"]
+            lon = result["longitude"]
+            city_name = result["name"]
+            country = result.get("country", "")
+
+            # Now get weather data
+            weather_params = {
+                "latitude": lat,
+                "longitude": lon,
+                "current": "temperature_2m,weather_code,wind_speed_10m,relative_humidity_2m",
+                "temperature_unit": "celsius",
+                "wind_speed_unit": "kmh",
+                "timezone": "auto"
+            }
+            async with http_session.get(
+                "https://api.open-meteo.com/v1/forecast",
+                params=weather_params
+            ) as weather_resp:
+                if weather_resp.status != 200:
+                    await interaction.followup.send("Failed to fetch weather data.")
+                    await BotLogger.log(f"Weather API error: {weather_resp.status}", "error", "command")
+                    return
+                data = await weather_resp.json()
 
             current = data["current"]
             temp = current["temperature_2m"]
@@ -1,7 +1,6 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-from PIL import Image, ImageDraw, ImageFont
 import io
 import random
 import string
@@ -12,6 +11,7 @@ from typing import Optional, Dict
 
 from utils.logging import BotLogger
 from utils.permissions import PermissionChecker
+from services.render_service import render_service, image_filename
 
 # Constants
 VERIFICATION_EMBED_COLOR = 0x9b59b6
@@ -60,45 +60,12 @@ class VerificationConfig:
 # Global config instance
 verification_config = VerificationConfig()
 
-def generate_captcha_image(text: str) -> io.BytesIO:
+async def generate_captcha_image(text: str) -> io.BytesIO:
     try:
-        # Create image
-        img = Image.new("RGB", (CAPTCHA_WIDTH, CAPTCHA_HEIGHT), (30, 30, 46))
-        draw = ImageDraw.Draw(img)
-
-        # Try to load a font, fall back to default
-        try:
-            # Try common system fonts or project fonts if available
-            font = ImageFont.truetype("fonts/Roboto-Bold.ttf", CAPTCHA_FONT_SIZE)
-        except:
-            try:
-                font = ImageFont.truetype("arial.ttf", CAPTCHA_FONT_SIZE)
-            except:
-                font = ImageFont.load_default()
-
-        # Add noise (lines/dots) to make it harder for OCR but readable for humans
-        for _ in range(30):
-            x1 = random.randint(0, CAPTCHA_WIDTH)
-            y1 = random.randint(0, CAPTCHA_HEIGHT)
-            x2 = random.randint(0, CAPTCHA_WIDTH)
-            y2 = random.randint(0, CAPTCHA_HEIGHT)
-            draw.line([(x1, y1), (x2, y2)], fill=(50, 50, 70), width=1)
-
-        # Draw text
-        # Center the text roughly
-        text_bbox = draw.textbbox((0, 0), text, font=font)
-        text_width = text_bbox[2] - text_bbox[0]
-        text_height = text_bbox[3] - text_bbox[1]
-        
-        x = (CAPTCHA_WIDTH - text_width) / 2
-        y = (CAPTCHA_HEIGHT - text_height) / 2
-        
-        draw.text((x, y), text, font=font, fill=(255, 255, 255))
-
-        buffer = io.BytesIO()
-        img.save(buffer, format="PNG")
-        buffer.seek(0)
-        return buffer
+        image_bytes = await render_service.render(
+            "captcha", text, CAPTCHA_WIDTH, CAPTCHA_HEIGHT, CAPTCHA_FONT_SIZE
+        )
+        return io.BytesIO(image_bytes)
     except Exception as e:
         print(f"Error generating captcha: {e}")
         # Return empty buffer or fallback
@@ -181,13 +148,13 @@ class VerificationView(discord.ui.View):
         await interaction.response.defer(ephemeral=True)
         
         captcha_text = ''.join(random.choices(string.ascii_uppercase + string.digits, k=CAPTCHA_LENGTH))
-        captcha_image = generate_captcha_image(captcha_text)
+        captcha_image = await generate_captcha_image(captcha_text)
         
         if not captcha_image.getvalue():
              await interaction.followup.send("Error generating captcha. Please contact an admin.", ephemeral=True)
              return
 
-        file = discord.File(captcha_image, filename="captcha.png")
+        file = discord.File(captcha_image, filename=image_filename("captcha", captcha_image))
         
         view = EnterCaptchaView(captcha_text, role_id)
         
@@ -9,6 +9,7 @@ from config.constants import (
     CUSTOM_VC_CATEGORY_ID
 )
 from utils.logging import BotLogger
+from utils.metrics import timed_listener
 
 TRACKING_FILE = "data/temp_channels.json"
 
@@ -43,6 +44,7 @@ class Voice(commands.Cog):
             self.save_temp_channels()
 
     @commands.Cog.listener()
+    @timed_listener
     async def on_voice_state_update(
         self,
         member: discord.Member,
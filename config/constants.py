@@ -23,4 +23,141 @@ WELCOME_CHANNEL_ID = 1456996668569288769
 
 # Defaults
 DEFAULT_PREFIX = ","
-DEFAULT_ALLOWED_CHANNELS = [TESTING_CHANNEL_ID]
\ No newline at end of file
+DEFAULT_ALLOWED_CHANNELS = [TESTING_CHANNEL_ID]
+
+# HTTP Session Pool
+HTTP_POOL_LIMIT = 100
+HTTP_POOL_LIMIT_PER_HOST = 10
+HTTP_DNS_CACHE_TTL = 300
+HTTP_KEEPALIVE_TIMEOUT = 30
+HTTP_DEFAULT_TIMEOUT = 10
+
+
+# Log Shipping
+LOG_QUEUE_SIZE = 5000
+LOG_BATCH_SIZE = 100
+LOG_FLUSH_INTERVAL = 2.0
+
+# Event Loop Watchdog (seconds)
+LOOP_WATCHDOG_INTERVAL = 0.1
+LOOP_STALL_THRESHOLD = 0.5
+
+# Config Refresh (seconds)
+CONFIG_POLL_INTERVAL = 300
+CONFIG_STREAM_READ_TIMEOUT = 60  # Server sends a keep-alive every 25s
+CONFIG_STREAM_MAX_BACKOFF = 60
+
+# Slash command sync state (fingerprint of the last synced tree per target)
+COMMAND_SYNC_FILE = "data/command_sync.json"
+
+# Image Rendering Pool
+RENDER_MAX_WORKERS = 2
+RENDER_JOB_TIMEOUT = 20
+
+# Rendered-output cache: renderers whose output is cached, with a version to bump whenever a
+# renderer's drawing changes (captcha is random per call and never cached), plus the entry
+# lifetime in seconds and the byte budget
+RENDERER_VERSIONS = {"quote": 2, "meme": 2, "welcome": 2, "ship": 2, "petpet": 2}
+RENDER_CACHE_TTL = 6 * 3600
+RENDER_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Render output encoding: encoder profile per renderer ("photo" = WebP, "flat" = palette PNG,
+# "animation" = optimized GIF) and the byte budget each profile aims to stay under
+RENDER_OUTPUT_PROFILES = {
+    "quote": "photo", "meme": "photo", "ship": "photo",
+    "welcome": "flat", "captcha": "flat",
+    "petpet": "animation",
+}
+RENDER_BYTE_BUDGETS = {"photo": 200 * 1024, "flat": 96 * 1024, "animation": 1024 * 1024}
+
+# Blocking SDK Thread Pools (timeouts in seconds)
+SPOTIFY_SDK_WORKERS = 4
+SPOTIFY_SDK_TIMEOUT = 10
+LASTFM_SDK_WORKERS = 2
+LASTFM_SDK_TIMEOUT = 15
+
+# Extension manifest: loaded concurrently in setup_hook, in no guaranteed order.
+# Set a feature to False (or list it in DISABLED_EXTENSIONS) to skip importing it entirely.
+EXTENSIONS = {
+    "core.events": True,
+    "cogs.media": True,
+    "cogs.images": True,
+    "cogs.utility": True,
+    "cogs.search": True,
+    "cogs.fun": True,
+    "cogs.auto_responses": True,
+    "cogs.ai": True,
+    "cogs.memes": True,
+    "cogs.admin": True,
+    "cogs.music": True,
+    "cogs.voice": True,
+    "cogs.levels": True,
+    "cogs.welcome": True,
+    "cogs.starboard": True,
+    "cogs.autoreact": True,
+    "cogs.verification": True,
+    "cogs.lastfm": True,
+    "cogs.boost": False,
+}
+
+# Built-in auto-responses, used until the dashboard defines its own triggers
+DEFAULT_AUTO_RESPONSES = [
+    {
+        "id": "default-gif",
+        "pattern": "faggot",
+        "match_type": "keyword",
+        "action": "gif",
+        "response": "https://cdn.discordapp.com/attachments/1279123313519624212/1316546100617805904/attachment-3.gif",
+    },
+    {
+        "id": "default-rape",
+        "pattern": "rape",
+        "match_type": "word",
+        "action": "send",
+        "response": "https://i.postimg.cc/Z5G9xTvx/rape.webp",
+    },
+    {
+        "id": "default-greeting",
+        "pattern": r"\b(?:hi|hello|hey|wave)\b",
+        "match_type": "regex",
+        "action": "react",
+        "response": "<a:wave:1166754943785500722>",
+    },
+]
+
+# Level store: seconds between debounced levels.json snapshots
+LEVEL_SNAPSHOT_INTERVAL = 10
+
+# Leaderboard pagination
+LEADERBOARD_PAGE_SIZE = 10
+LEADERBOARD_VIEW_TIMEOUT = 180
+
+# XP curve: levels precomputed at startup (the table grows on demand past this)
+XP_CURVE_PRECOMPUTED_LEVELS = 1000
+# Upper bound on anyone's lifetime XP, so a bad grant or import can't explode the table
+XP_MAX_TOTAL = 10 ** 12
+# Level-up announcements: users listed by name in one aggregated bulk announcement
+LEVEL_UP_ANNOUNCE_LIMIT = 20
+
+# Columnar level engine (LEVEL_ENGINE=numpy): memory-mapped snapshot file, and how many
+# users may join before the id index is re-sorted
+LEVEL_ARRAY_FILE = "data/levels.npy"
+LEVEL_ARRAY_TAIL_LIMIT = 8192
+# /levels stats: lower edges of the level histogram buckets
+LEVEL_STATS_BINS = (1, 2, 5, 10, 20, 50, 100)
+
+# Template cache (seconds): fresh lifetime of found templates and of "no template" answers,
+# how long past expiry an entry may still be served while it refreshes, retry delay after
+# a failed fetch, and the LRU size bound
+TEMPLATE_CACHE_TTL = 300
+TEMPLATE_NEGATIVE_TTL = 120
+TEMPLATE_STALE_TTL = 3600
+TEMPLATE_ERROR_TTL = 15
+TEMPLATE_CACHE_MAX_ENTRIES = 256
+
+# Avatar service: CDN size requested per renderer (Discord serves powers of two), the
+# in-memory byte budget, and the on-disk cache directory and its byte budget
+AVATAR_SIZES = {"ship": 256, "petpet": 512, "quote": 256, "welcome": 256}
+AVATAR_MEMORY_MAX_BYTES = 32 * 1024 * 1024
+AVATAR_CACHE_DIR = "data/avatars"
+AVATAR_DISK_MAX_BYTES = 256 * 1024 * 1024
@@ -0,0 +1,119 @@
+import re
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterable, Mapping, Optional, Tuple, Union
+from utils.triggers import TriggerEngine
+from .constants import DEFAULT_AUTO_RESPONSES
+
+# Custom emoji as the dashboard stores them: <:name:id> or <a:name:id>
+CUSTOM_EMOJI_PATTERN = re.compile(r"^<a?:\w+:(\d+)>$")
+
+EmojiKey = Union[int, str]
+
+def emoji_key(emoji: str) -> EmojiKey:
+    """
+    Normalize an emoji string to the key used by the starboard index
+
+    Custom emoji are keyed by ID (so a renamed or animated emoji still
+    matches); unicode emoji by the character itself.
+    """
+    match = CUSTOM_EMOJI_PATTERN.match(emoji)
+    return int(match.group(1)) if match else emoji
+
+def _to_int(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+@dataclass(frozen=True)
+class StarboardRule:
+    guild_id: int
+    monitored_channel_id: int
+    emoji: str
+    threshold: int
+    starboard_channel_id: int
+
+@dataclass(frozen=True)
+class AutoReactRule:
+    guild_id: int
+    channel_id: int
+    react_type: str
+    emojis: Tuple[str, ...]
+
+@dataclass(frozen=True)
+class ConfigIndex:
+    """
+    Immutable, pre-validated lookups built once per dashboard config
+
+    Everything is parsed and type-checked here so per-event checks are plain
+    hash lookups. ConfigManager swaps in a whole new index on each update, so
+    a handler never sees a half-applied config.
+    """
+
+    # Empty means every channel is allowed
+    allowed_channels: FrozenSet[int] = frozenset()
+    disabled_commands: FrozenSet[str] = frozenset()
+    autoreact_by_channel: Mapping[int, AutoReactRule] = field(default_factory=lambda: MappingProxyType({}))
+    starboard_by_channel_emoji: Mapping[Tuple[int, EmojiKey], StarboardRule] = field(default_factory=lambda: MappingProxyType({}))
+    auto_responses: TriggerEngine = field(default_factory=TriggerEngine)
+
+    @classmethod
+    def build(cls, config_data: Dict[str, Any], default_channels: Iterable[int] = ()) -> "ConfigIndex":
+        """
+        Build an index from a dashboard config payload
+
+        Args:
+            config_data: Payload from /api/bot/config
+            default_channels: Channels to allow when the dashboard allows none
+
+        Returns:
+            The new index; malformed entries are skipped
+        """
+        allowed = {_to_int(c) for c in config_data.get("allowedChannels") or ()}
+        allowed.discard(None)
+
+        disabled = frozenset(str(name).lower() for name in config_data.get("disabledCommands") or ())
+
+        autoreact = {}
+        for guild_id, raw in (config_data.get("autoreact") or {}).items():
+            channel_id = _to_int(raw.get("channel_id"))
+            if not channel_id or _to_int(guild_id) is None:
+                print(f"Skipping invalid autoreact config for guild {guild_id}")
+                continue
+            autoreact[channel_id] = AutoReactRule(
+                guild_id=int(guild_id),
+                channel_id=channel_id,
+                react_type=raw.get("type") or "all",
+                emojis=tuple(raw.get("emojis") or ())
+            )
+
+        starboard = {}
+        for guild_id, raw in (config_data.get("starboard") or {}).items():
+            monitored = _to_int(raw.get("monitored_channel_id"))
+            target = _to_int(raw.get("starboard_channel_id"))
+            emoji = raw.get("emoji")
+            if not monitored or not target or not emoji or _to_int(guild_id) is None:
+                print(f"Skipping invalid starboard config for guild {guild_id}")
+                continue
+            threshold = _to_int(raw.get("threshold", 5))
+            starboard[(monitored, emoji_key(emoji))] = StarboardRule(
+                guild_id=int(guild_id),
+                monitored_channel_id=monitored,
+                emoji=emoji,
+                threshold=threshold if threshold is not None else 5,
+                starboard_channel_id=target
+            )
+
+        # The built-in triggers apply until the dashboard sends its own list (an empty list means none);
+        # the server leaves autoResponses out until an admin has saved a trigger
+        entries = config_data["autoResponses"] if "autoResponses" in config_data else DEFAULT_AUTO_RESPONSES
+        auto_responses = TriggerEngine.from_config(entries or ())
+
+        return cls(
+            allowed_channels=frozenset(allowed or default_channels),
+            disabled_commands=disabled,
+            autoreact_by_channel=MappingProxyType(autoreact),
+            starboard_by_channel_emoji=MappingProxyType(starboard),
+            auto_responses=auto_responses
+        )
@@ -1,6 +1,7 @@
 import os
 from typing import Dict, List, Any
 from .constants import DEFAULT_PREFIX, DEFAULT_ALLOWED_CHANNELS
+from .indexes import ConfigIndex
 
 class ConfigManager:
     _instance = None
@@ -30,6 +31,31 @@ class ConfigManager:
         self.SPOTIFY_CLIENT_ID = os.getenv('SPOTIFY_CLIENT_ID')
         self.SPOTIFY_CLIENT_SECRET = os.getenv('SPOTIFY_CLIENT_SECRET')
 
+        # Log shipping: "drop_oldest" or "drop_level" when the queue is full
+        self.LOG_OVERFLOW_POLICY = os.getenv('LOG_OVERFLOW_POLICY', 'drop_oldest')
+
+        # Local metrics endpoint (/metrics, /healthz); port 0 disables it
+        self.METRICS_HOST = os.getenv('METRICS_HOST', '127.0.0.1')
+        self.METRICS_PORT = int(os.getenv('METRICS_PORT', '9090'))
+
+        # Slash command sync: comma-separated guild IDs sync only to those guilds (instant, for dev);
+        # FORCE_COMMAND_SYNC=1 syncs even when the command tree is unchanged
+        self.COMMAND_SYNC_GUILDS = [
+            int(guild_id) for guild_id in os.getenv('COMMAND_SYNC_GUILDS', '').split(',') if guild_id.strip()
+        ]
+        self.FORCE_COMMAND_SYNC = os.getenv('FORCE_COMMAND_SYNC', '').lower() in ('1', 'true', 'yes')
+
+        # Push config changes from the dashboard over server-sent events (polling still runs as a fallback)
+        self.CONFIG_PUSH_ENABLED = os.getenv('CONFIG_PUSH_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+
+        # Comma-separated extensions to skip on top of the manifest, e.g. "cogs.music,cogs.lastfm"
+        self.DISABLED_EXTENSIONS = {
+            name.strip() for name in os.getenv('DISABLED_EXTENSIONS', '').split(',') if name.strip()
+        }
+
+        # Levels storage engine: "json" (levels.json) or "numpy" (columnar arrays in data/levels.npy)
+        self.LEVEL_ENGINE = os.getenv('LEVEL_ENGINE', 'json').lower()
+
         # API Configuration (Internal)
         raw_api = os.getenv('API_URL', 'http://localhost:5000/api').rstrip('/')
         if raw_api.endswith('/api'):
@@ -56,10 +82,13 @@ class ConfigManager:
 
         # Derived API URLs
         self.LOGS_URL = f"{self.API_BASE_URL}/logs"
+        self.LOGS_BATCH_URL = f"{self.API_BASE_URL}/logs/batch"
         self.WARNS_URL = f"{self.API_BASE_URL}/warns"
         self.LFM_URL = f"{self.API_BASE_URL}/lfm"
         self.HEARTBEAT_URL = f"{self.API_BASE_URL}/bot/heartbeat"
         self.CONFIG_URL = f"{self.API_BASE_URL}/bot/config"
+        self.CONFIG_STREAM_URL = f"{self.API_BASE_URL}/bot/config/stream"
+        self.TEMPLATES_URL = f"{self.API_BASE_URL}/bot/templates"
 
         # Dynamic Config
         self.prefix = DEFAULT_PREFIX
@@ -68,37 +97,30 @@ class ConfigManager:
         self.starboard_config: Dict[str, Dict[str, Any]] = {}  # {guild_id: {config}}
         self.autoreact_config: Dict[str, Dict[str, Any]] = {}  # {guild_id: {config}}
 
+        # Precompiled lookups used on the hot path, replaced as a whole on every update
+        self.index = ConfigIndex.build({}, DEFAULT_ALLOWED_CHANNELS)
+
         # Runtime Flags
         self.rape_enabled = False
         self.start_time = None
 
     def update_config(self, config_data: Dict[str, Any]):
         """Update dynamic configuration from API response"""
-        self.prefix = config_data.get("prefix", DEFAULT_PREFIX)
-        self.disabled_commands = config_data.get("disabledCommands") or []
-
-        channels = config_data.get("allowedChannels")
-        if channels:
-            self.allowed_channels = [int(c) for c in channels]
-        else:
-            self.allowed_channels = []
+        # Validate and index everything before touching any state
+        index = ConfigIndex.build(config_data, DEFAULT_ALLOWED_CHANNELS)
 
-        # Update starboard configuration
-        starboard_data = config_data.get("starboard")
-        if starboard_data:
-            self.starboard_config = starboard_data
-        else:
-            self.starboard_config = {}
+        self.prefix = config_data.get("prefix", DEFAULT_PREFIX)
+        self.disabled_commands = sorted(index.disabled_commands)
+        self.allowed_channels = sorted(index.allowed_channels) if config_data.get("allowedChannels") else []
+        self.starboard_config = config_data.get("starboard") or {}
+        self.autoreact_config = config_data.get("autoreact") or {}
 
-        # Update autoreact configuration
-        autoreact_data = config_data.get("autoreact")
-        if autoreact_data:
-            self.autoreact_config = autoreact_data
-        else:
-            self.autoreact_config = {}
+        # Single reference swap: handlers see either the old index or the new one
+        self.index = index
 
     def is_command_disabled(self, command_name: str) -> bool:
-        return command_name in self.disabled_commands
+        # The index stores names lower-cased
+        return command_name.lower() in self.index.disabled_commands
 
     def get_api_headers(self) -> Dict[str, str]:
         """Get headers for API requests including authentication"""
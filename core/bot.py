@@ -1,8 +1,22 @@
 import discord
 from discord.ext import commands
+import asyncio
 import os
+import time
 from config.settings import config
+from config.constants import EXTENSIONS
 from utils.logging import BotLogger
+from services.http_session import http_session
+from services.render_service import render_service
+from services.sdk_executor import spotify_executor, lastfm_executor
+from models.level_store import level_store
+from core.metrics_server import MetricsServer
+from core.watchdog import LoopWatchdog
+from core.command_sync import CommandSyncer
+from core.message_pipeline import MessagePipeline, MessageContext
+from utils.metrics import metrics
+
+EXTENSION_LOAD_SECONDS = metrics.gauge("bot_extension_load_seconds", "Time spent loading each extension at startup", ("extension", "phase"))
 
 class DiscordBot(commands.Bot):
     def __init__(self):
@@ -19,66 +33,121 @@ class DiscordBot(commands.Bot):
             help_command=None
         )
 
+        # Pooled HTTP session shared by every outbound caller
+        self.http_session = http_session
+        self.metrics_server = MetricsServer(self)
+        self.watchdog = LoopWatchdog()
+        self.extension_timings = {}
+        self.command_syncer = CommandSyncer(self)
+
+        # Every on_message feature registers a stage here instead of its own listener
+        self.message_pipeline = MessagePipeline()
+        self.message_pipeline.add_stage("commands", self._handle_commands, include_bots=True, allowed_channels_only=True)
+
     def _get_prefix(self, bot, message):
         return config.prefix
 
     async def setup_hook(self):
-        # Load core events
-        await self.load_extension('core.events')
-
-        # Load cogs
-        await self.load_extension('cogs.media')
-        await self.load_extension('cogs.images')
-        await self.load_extension('cogs.utility')
-        await self.load_extension('cogs.search')
-        await self.load_extension('cogs.fun')
-        await self.load_extension('cogs.auto_responses')
-        await self.load_extension('cogs.ai')
-        await self.load_extension('cogs.memes')
-        await self.load_extension('cogs.admin')
-        await self.load_extension('cogs.music')
-        await self.load_extension('cogs.voice')
-        await self.load_extension('cogs.levels')
-        await self.load_extension('cogs.welcome')
-        await self.load_extension('cogs.starboard')
-        await self.load_extension('cogs.autoreact')
-        await self.load_extension('cogs.verification')
-        await self.load_extension('cogs.lastfm')
-
-        # Sync slash commands
+        # Open the shared HTTP session before anything starts making requests
+        await self.http_session.start()
+        BotLogger.shipper.start()
+        self.watchdog.start()
+        render_service.start()
+
+        try:
+            await self.metrics_server.start()
+        except OSError as e:
+            await BotLogger.log_error("Metrics endpoint failed to start", e, "system")
+
+        await self.load_extensions()
+
+        # Sync slash commands only if the tree changed since the last successful sync
+        await self.command_syncer.sync(config.COMMAND_SYNC_GUILDS, force=config.FORCE_COMMAND_SYNC)
+
+    async def load_extensions(self):
+        """Load every enabled extension from the manifest concurrently and log a timing report"""
+        enabled = [
+            name for name, is_enabled in EXTENSIONS.items()
+            if is_enabled and name not in config.DISABLED_EXTENSIONS
+        ]
+        skipped = [name for name in EXTENSIONS if name not in enabled]
+
+        start = time.perf_counter()
+        await asyncio.gather(*(self._load_extension_timed(name) for name in enabled))
+        elapsed = time.perf_counter() - start
+
+        await BotLogger.log(self._format_startup_report(enabled, skipped, elapsed), "info", "system")
+
+    async def _load_extension_timed(self, name: str):
+        timing = self.extension_timings[name] = {"start": time.perf_counter(), "status": "ok"}
         try:
-            synced = await self.tree.sync()
-            await BotLogger.log(f"Synced {len(synced)} slash commands", "info", "system")
+            await self.load_extension(name)
         except Exception as e:
-            await BotLogger.log_error("Slash command sync failed", e, "system")
+            # One broken feature should not keep the rest of the bot from starting
+            timing["status"] = "failed"
+            await BotLogger.log_error(f"Failed to load extension {name}", e, "system")
+
+        timing["total"] = time.perf_counter() - timing["start"]
+        # Extensions that never add a cog spend all their time importing
+        timing.setdefault("import", timing["total"])
+        timing["setup"] = timing["total"] - timing["import"]
+
+        EXTENSION_LOAD_SECONDS.set(timing["import"], extension=name, phase="import")
+        EXTENSION_LOAD_SECONDS.set(timing["setup"], extension=name, phase="setup")
+
+    def _format_startup_report(self, enabled: list, skipped: list, elapsed: float) -> str:
+        lines = [f"Loaded {len(enabled)} extensions in {elapsed * 1000:.0f}ms"]
+        by_cost = sorted(enabled, key=lambda name: self.extension_timings[name]["total"], reverse=True)
+        for name in by_cost:
+            timing = self.extension_timings[name]
+            lines.append(
+                f"  {name:<24} import {timing['import'] * 1000:7.1f}ms  "
+                f"setup {timing['setup'] * 1000:7.1f}ms  {timing['status']}"
+            )
+        if skipped:
+            lines.append(f"  disabled: {', '.join(skipped)}")
+        return "\n".join(lines)
+
+    async def add_cog(self, cog, /, **kwargs):
+        # Everything before an extension's first add_cog is module import plus cog construction;
+        # add_cog itself (including cog_load) is counted as setup
+        timing = self.extension_timings.get(type(cog).__module__)
+        if timing is not None and "import" not in timing:
+            timing["import"] = time.perf_counter() - timing["start"]
+        await super().add_cog(cog, **kwargs)
+
+    async def close(self):
+        await super().close()
+        self.watchdog.stop()
+        render_service.shutdown()
+        spotify_executor.shutdown()
+        lastfm_executor.shutdown()
+        await self.metrics_server.stop()
+        # Final levels snapshot (no-op if the levels cog never started the store)
+        await level_store.close()
+        # Flush queued logs while the HTTP session is still open
+        await BotLogger.shutdown()
+        await self.http_session.close()
 
     async def on_connect(self):
         print(f"{self.user} has connected to Discord!")
 
     async def on_message(self, message):
-        if message.author == self.user:
-            return
+        await self.message_pipeline.dispatch(message, self.user)
 
-        # Check allowed channels
-        from utils.permissions import PermissionChecker
-        if not PermissionChecker.is_in_allowed_channel(message.channel.id):
-            # We don't log ignored messages to server to avoid spam? 
-            # bot.py printed: "Ignored message in non-allowed channel: ..."
-            return
+    async def _handle_commands(self, ctx: MessageContext):
+        """Core pipeline stage: disabled-command check, message logging and prefix commands"""
+        message = ctx.message
 
         # Check disabled commands (for prefix commands)
-        if message.content.startswith(config.prefix):
-            parts = message.content[len(config.prefix):].split()
-            if parts:
-                command_name = parts[0].lower()
-                if config.is_command_disabled(command_name):
-                    await message.channel.send(f"The `{command_name}` command is currently disabled.")
-                    return
-
-        # Log message
-        msg = f"Received message from {message.author}: {message.content}"
-        # print(msg) # BotLogger prints
-        await BotLogger.log(msg, "info", "message")
+        if ctx.command_name and config.is_command_disabled(ctx.command_name):
+            await message.channel.send(f"The `{ctx.command_name}` command is currently disabled.")
+            return
+
+        # Log message (policy is checked first so sampled-out messages are never formatted)
+        if BotLogger.should_log("info", "message"):
+            msg = f"Received message from {message.author}: {message.content}"
+            await BotLogger.log(msg, "info", "message", checked=True)
 
         # Process commands
         await self.process_commands(message)
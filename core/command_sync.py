@@ -0,0 +1,114 @@
+import hashlib
+import json
+import os
+import time
+from typing import Dict, List, Optional
+import discord
+from config.settings import config
+from config.constants import COMMAND_SYNC_FILE
+from utils.logging import BotLogger
+
+class CommandSyncer:
+    """
+    Syncs the app-command tree only when it has changed
+
+    The local tree is serialized to the same payloads Discord receives and
+    hashed. The hash of the last successful sync per target (global or a
+    guild) is stored in COMMAND_SYNC_FILE, so restarts with an unchanged tree
+    skip the rate-limited sync request entirely.
+    """
+
+    def __init__(self, bot, state_file: str = COMMAND_SYNC_FILE):
+        self.bot = bot
+        self.state_file = state_file
+        self.state = self._load_state()
+
+    def _load_state(self) -> Dict[str, dict]:
+        try:
+            with open(self.state_file, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"Error loading command sync state: {e}")
+            return {}
+
+    def _save_state(self):
+        try:
+            os.makedirs(os.path.dirname(self.state_file) or ".", exist_ok=True)
+            tmp_path = f"{self.state_file}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(self.state, f, indent=4)
+            os.replace(tmp_path, self.state_file)
+        except Exception as e:
+            print(f"Error saving command sync state: {e}")
+
+    def fingerprint(self, guild: Optional[discord.abc.Snowflake] = None) -> str:
+        """
+        Stable hash of the commands that would be synced to a target
+
+        Args:
+            guild: Guild to fingerprint, or None for the global commands
+
+        Returns:
+            Hex SHA-256 of the sorted, canonical command payloads
+        """
+        tree = self.bot.tree
+        payloads = [command.to_dict(tree) for command in tree.get_commands(guild=guild)]
+        payloads.sort(key=lambda payload: (payload.get("type", 1), payload["name"]))
+        canonical = json.dumps(payloads, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    async def sync(self, guild_ids: Optional[List[int]] = None, force: bool = False):
+        """
+        Sync the tree to each target whose fingerprint differs from the last sync
+
+        Args:
+            guild_ids: Sync to these guilds only, with the global commands copied in
+                so changes show up instantly. None syncs globally.
+            force: Sync even if the fingerprint is unchanged
+        """
+        if guild_ids:
+            targets = []
+            for guild_id in guild_ids:
+                guild = discord.Object(id=guild_id)
+                self.bot.tree.copy_global_to(guild=guild)
+                targets.append((str(guild_id), guild))
+        else:
+            targets = [("global", None)]
+
+        for key, guild in targets:
+            await self._sync_target(key, guild, force)
+
+    async def _sync_target(self, key: str, guild: Optional[discord.abc.Snowflake], force: bool):
+        fingerprint = self.fingerprint(guild)
+        previous = self.state.get(key, {})
+        # A different application has a different remote tree, whatever the local hash says
+        unchanged = (
+            previous.get("fingerprint") == fingerprint
+            and previous.get("application_id") == self.bot.application_id
+        )
+        label = "global" if guild is None else f"guild {key}"
+
+        if unchanged and not force:
+            await BotLogger.log(
+                f"Slash commands unchanged for {label} ({previous.get('count', 0)} commands), skipping sync",
+                "info",
+                "system"
+            )
+            return
+
+        try:
+            synced = await self.bot.tree.sync(guild=guild)
+        except Exception as e:
+            await BotLogger.log_error(f"Slash command sync failed for {label}", e, "system")
+            return
+
+        self.state[key] = {
+            "fingerprint": fingerprint,
+            "application_id": self.bot.application_id,
+            "count": len(synced),
+            "synced_at": int(time.time())
+        }
+        self._save_state()
+        await BotLogger.log(f"Synced {len(synced)} slash commands to {label}", "info", "system")
@@ -2,10 +2,13 @@ from discord.ext import commands, tasks
 import discord
 import time
 from config.settings import config
-from config.constants import TESTING_CHANNEL_ID
+from config.constants import TESTING_CHANNEL_ID, CONFIG_POLL_INTERVAL
 from utils.logging import BotLogger
 from utils.formatters import Formatters
 from services.api_client import APIClient
+from services.config_sync import config_sync
+from utils.template_cache import template_cache
+from utils.metrics import COMMAND_INVOCATIONS, COMMAND_LATENCY, timed_listener
 
 class Events(commands.Cog):
     def __init__(self, bot):
@@ -13,13 +16,17 @@ class Events(commands.Cog):
         self.send_heartbeat.start()
         self.fetch_config.start()
         self.uptime_status_task.start()
+        config_sync.add_listener(self.on_config_change)
 
     def cog_unload(self):
         self.send_heartbeat.cancel()
         self.fetch_config.cancel()
+        config_sync.remove_listener(self.on_config_change)
+        config_sync.stop_stream()
         self.uptime_status_task.cancel()
 
     @commands.Cog.listener()
+    @timed_listener
     async def on_ready(self):
         # Set start time if not set (re-set on reconnect? bot.py sets it on on_ready)
         if config.start_time is None:
@@ -28,8 +35,30 @@ class Events(commands.Cog):
         msg = f'{self.bot.user} has connected to Discord!'
         await BotLogger.log(msg, "info", "system")
         
-        # Fetch config immediately
-        await self.fetch_config()
+        # Fetch config and warm every embed template immediately, then listen for pushed changes
+        await config_sync.fetch()
+        await template_cache.prefetch()
+        config_sync.start_stream()
+
+    @commands.Cog.listener()
+    async def on_command(self, ctx):
+        ctx.metrics_start = time.perf_counter()
+
+    @commands.Cog.listener()
+    async def on_command_completion(self, ctx):
+        command = ctx.command.qualified_name
+        COMMAND_INVOCATIONS.inc(command=command, kind="prefix")
+        start = getattr(ctx, "metrics_start", None)
+        if start is not None:
+            COMMAND_LATENCY.observe(time.perf_counter() - start, command=command, kind="prefix")
+
+    @commands.Cog.listener()
+    async def on_app_command_completion(self, interaction: discord.Interaction, command):
+        name = command.qualified_name
+        COMMAND_INVOCATIONS.inc(command=name, kind="slash")
+        # Measured from interaction creation, so it includes gateway delivery time
+        latency = (discord.utils.utcnow() - interaction.created_at).total_seconds()
+        COMMAND_LATENCY.observe(latency, command=name, kind="slash")
 
     @tasks.loop(seconds=30)
     async def send_heartbeat(self):
@@ -47,17 +76,16 @@ class Events(commands.Cog):
     async def before_heartbeat(self):
         await self.bot.wait_until_ready()
 
-    @tasks.loop(minutes=5)
+    @tasks.loop(seconds=CONFIG_POLL_INTERVAL)
     async def fetch_config(self):
-        try:
-            data = await APIClient.get(config.CONFIG_URL, headers=config.get_api_headers())
-            if isinstance(data, dict):
-                config.update_config(data)
-                print(f"Config updated: prefix={config.prefix}, disabled={config.disabled_commands}")
-            else:
-                print(f"Config fetch failed: unexpected format")
-        except Exception as e:
-            print(f"Config fetch error: {e}")
+        # Fallback poll; conditional, so an unchanged config (or template catalog) costs an empty 304
+        await config_sync.fetch()
+        await template_cache.prefetch()
+
+    async def on_config_change(self, reason: str):
+        """Refresh templates when the dashboard edits them (and after a stream reconnect)"""
+        if reason in ("templates", "connected"):
+            await template_cache.prefetch()
 
     @fetch_config.before_loop
     async def before_fetch_config(self):
@@ -0,0 +1,142 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Container, List, Optional
+import discord
+from config.settings import config
+from utils.logging import BotLogger
+from utils.metrics import metrics
+from utils.permissions import PermissionChecker
+
+MESSAGE_STAGE_LATENCY = metrics.histogram("bot_message_stage_seconds", "Message pipeline stage execution time", ("stage",))
+MESSAGE_STAGE_RUNS = metrics.counter("bot_message_stage_runs_total", "Message pipeline stage runs by outcome", ("stage", "status"))
+MESSAGE_DISPATCH_LATENCY = metrics.histogram("bot_message_dispatch_seconds", "Time to build the message context and run every matching stage")
+
+class MessageContext:
+    """Everything stages need about a message, computed once per message"""
+
+    __slots__ = (
+        "message", "content", "lowered", "author_id", "author_is_bot",
+        "guild_id", "channel_id", "in_allowed_channel", "command_name"
+    )
+
+    def __init__(self, message: discord.Message):
+        self.message = message
+        self.content = message.content
+        self.lowered = message.content.lower()
+        self.author_id = message.author.id
+        self.author_is_bot = message.author.bot
+        self.guild_id = message.guild.id if message.guild else None
+        self.channel_id = message.channel.id
+        self.in_allowed_channel = PermissionChecker.is_in_allowed_channel(self.channel_id)
+
+        # First word after the prefix, if this looks like a prefix command
+        self.command_name: Optional[str] = None
+        if self.content.startswith(config.prefix):
+            parts = self.lowered[len(config.prefix):].split(maxsplit=1)
+            if parts:
+                self.command_name = parts[0]
+
+StageHandler = Callable[[MessageContext], Awaitable[None]]
+
+class MessageStage:
+    """
+    A message handler plus the conditions under which it can run
+
+    Args:
+        name: Stage name used in metrics and error logs
+        handler: Coroutine taking a MessageContext
+        include_bots: Run for messages from other bots (the bot's own messages never reach a stage)
+        guild_only: Skip direct messages
+        allowed_channels_only: Skip channels outside the dashboard's allowed list
+        channels: Callable returning the channel IDs the stage cares about (anything supporting `in`);
+            looked up per message so it follows config updates
+        when: Extra predicate on the context, checked last
+    """
+
+    __slots__ = ("name", "handler", "include_bots", "guild_only", "allowed_channels_only", "channels", "when")
+
+    def __init__(
+        self,
+        name: str,
+        handler: StageHandler,
+        *,
+        include_bots: bool = False,
+        guild_only: bool = False,
+        allowed_channels_only: bool = False,
+        channels: Optional[Callable[[], Container[int]]] = None,
+        when: Optional[Callable[[MessageContext], bool]] = None
+    ):
+        self.name = name
+        self.handler = handler
+        self.include_bots = include_bots
+        self.guild_only = guild_only
+        self.allowed_channels_only = allowed_channels_only
+        self.channels = channels
+        self.when = when
+
+    def matches(self, ctx: MessageContext) -> bool:
+        if ctx.author_is_bot and not self.include_bots:
+            return False
+        if self.guild_only and ctx.guild_id is None:
+            return False
+        if self.allowed_channels_only and not ctx.in_allowed_channel:
+            return False
+        if self.channels is not None and ctx.channel_id not in self.channels():
+            return False
+        if self.when is not None and not self.when(ctx):
+            return False
+        return True
+
+class MessagePipeline:
+    """
+    Single on_message dispatcher for the whole bot
+
+    Each message is normalized into a MessageContext once. Every registered
+    stage whose predicates match then runs concurrently, as separate
+    listeners did before, with its own timing and error isolation. Stages
+    that cannot match cost a few attribute checks.
+    """
+
+    def __init__(self):
+        self._stages: List[MessageStage] = []
+
+    @property
+    def stages(self) -> List[MessageStage]:
+        return list(self._stages)
+
+    def add_stage(self, name: str, handler: StageHandler, **predicates) -> MessageStage:
+        """Register a stage (replacing any stage with the same name); see MessageStage for predicates"""
+        self.remove_stage(name)
+        stage = MessageStage(name, handler, **predicates)
+        self._stages.append(stage)
+        return stage
+
+    def remove_stage(self, name: str):
+        self._stages = [stage for stage in self._stages if stage.name != name]
+
+    async def dispatch(self, message: discord.Message, bot_user: Optional[discord.abc.User] = None):
+        if bot_user is not None and message.author.id == bot_user.id:
+            return
+
+        start = time.perf_counter()
+        ctx = MessageContext(message)
+        matched = [stage for stage in self._stages if stage.matches(ctx)]
+
+        if len(matched) == 1:
+            await self._run_stage(matched[0], ctx)
+        elif matched:
+            await asyncio.gather(*(self._run_stage(stage, ctx) for stage in matched))
+
+        MESSAGE_DISPATCH_LATENCY.observe(time.perf_counter() - start)
+
+    async def _run_stage(self, stage: MessageStage, ctx: MessageContext):
+        start = time.perf_counter()
+        status = "ok"
+        try:
+            await stage.handler(ctx)
+        except Exception as e:
+            status = "error"
+            await BotLogger.log_error(f"Message stage {stage.name} failed", e, "system")
+        finally:
+            MESSAGE_STAGE_RUNS.inc(stage=stage.name, status=status)
+            MESSAGE_STAGE_LATENCY.observe(time.perf_counter() - start, stage=stage.name)
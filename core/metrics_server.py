@@ -0,0 +1,58 @@
+import math
+import time
+from typing import Optional
+from aiohttp import web
+from config.settings import config
+from utils.metrics import metrics, GATEWAY_LATENCY, EVENT_LOOP_LAG, cache_hit_ratios
+
+class MetricsServer:
+    """Local HTTP endpoint serving /metrics (Prometheus text) and /healthz (JSON)"""
+
+    def __init__(self, bot, host: str = None, port: int = None):
+        self.bot = bot
+        self.host = host or config.METRICS_HOST
+        self.port = config.METRICS_PORT if port is None else port
+        self._runner: Optional[web.AppRunner] = None
+
+        GATEWAY_LATENCY.set_function(lambda: self.bot.latency)
+
+    async def start(self):
+        if self.port <= 0 or self._runner is not None:
+            return
+
+        app = web.Application()
+        app.router.add_get("/metrics", self._handle_metrics)
+        app.router.add_get("/healthz", self._handle_health)
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        print(f"[Metrics] Serving on http://{self.host}:{self.port}/metrics")
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _handle_metrics(self, request: web.Request) -> web.Response:
+        # Prometheus reads the exposition format version from Content-Type
+        return web.Response(
+            body=metrics.render_prometheus().encode("utf-8"),
+            headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"}
+        )
+
+    async def _handle_health(self, request: web.Request) -> web.Response:
+        ready = self.bot.is_ready() and not self.bot.is_closed()
+        latency = self.bot.latency
+        uptime = time.time() - config.start_time if config.start_time else 0
+
+        payload = {
+            "status": "ok" if ready else "starting",
+            "ready": ready,
+            "gateway_latency_ms": None if math.isnan(latency) or math.isinf(latency) else round(latency * 1000, 2),
+            "event_loop_lag_ms": round(EVENT_LOOP_LAG.get() * 1000, 2),
+            "uptime_seconds": int(uptime),
+            "guilds": len(self.bot.guilds),
+            "cache_hit_ratio": cache_hit_ratios()
+        }
+        return web.json_response(payload, status=200 if ready else 503)
@@ -0,0 +1,128 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+import traceback
+from typing import Optional, Tuple
+from config.constants import LOOP_WATCHDOG_INTERVAL, LOOP_STALL_THRESHOLD
+from utils.logging import BotLogger
+from utils.metrics import metrics, EVENT_LOOP_LAG
+
+EVENT_LOOP_STALLS = metrics.counter("bot_event_loop_stalls_total", "Event loop stalls over the watchdog threshold", ("handler",))
+EVENT_LOOP_STALL_SECONDS = metrics.histogram(
+    "bot_event_loop_stall_seconds",
+    "Duration of event loop stalls over the watchdog threshold",
+    buckets=(0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+)
+
+# Packages whose frames identify the bot code responsible for a stall, most specific first
+BOT_PACKAGES = ("cogs.", "services.", "models.", "core.", "utils.")
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class LoopWatchdog:
+    """
+    Detects event loop stalls and names the code that caused them
+
+    A heartbeat task on the loop records when it last ran and the loop lag.
+    A daemon thread checks the heartbeat and, once it is older than the
+    threshold, captures the loop thread's stack while it is still blocked.
+    """
+
+    def __init__(self, interval: float = LOOP_WATCHDOG_INTERVAL, threshold: float = LOOP_STALL_THRESHOLD):
+        self.interval = interval
+        self.threshold = threshold
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._last_beat = time.monotonic()
+        self._stall_handler: Optional[str] = None
+        self._beat_task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def start(self):
+        """Start watching the running loop (must be called from the loop thread)"""
+        if self._beat_task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._beat_task = self._loop.create_task(self._beat())
+        self._thread = threading.Thread(target=self._monitor, name="loop-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._beat_task is not None:
+            self._beat_task.cancel()
+            self._beat_task = None
+
+    async def _beat(self):
+        while True:
+            start = time.monotonic()
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = max(0.0, now - start - self.interval)
+            EVENT_LOOP_LAG.set(lag)
+            self._last_beat = now
+
+            if self._stall_handler is not None:
+                # The stall the monitor thread reported has ended; record its full duration
+                EVENT_LOOP_STALL_SECONDS.observe(lag)
+                self._stall_handler = None
+
+    def _monitor(self):
+        while not self._stop.wait(self.interval / 2):
+            stalled_for = time.monotonic() - self._last_beat - self.interval
+            if stalled_for < self.threshold or self._stall_handler is not None:
+                continue
+
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+
+            stack = traceback.extract_stack(frame)
+            handler, blocking_at = self._attribute(stack)
+            self._stall_handler = handler
+            formatted = "".join(traceback.format_list(stack))
+
+            # Print right away from this thread in case the loop never recovers
+            print(
+                f"[Watchdog] Event loop blocked for {stalled_for:.2f}s in {handler} at {blocking_at}\n{formatted}",
+                file=sys.stderr
+            )
+            self._loop.call_soon_threadsafe(self._report, handler, blocking_at, stalled_for, formatted)
+
+    @staticmethod
+    def _attribute(stack: traceback.StackSummary) -> Tuple[str, str]:
+        """
+        Name the handler and the blocking call site from a captured stack
+
+        The handler is the outermost frame from the highest-priority bot
+        package (a cog command or listener if one is on the stack); the call
+        site is the innermost frame of any module.
+        """
+        innermost = stack[-1]
+        blocking_at = f"{innermost.filename}:{innermost.lineno} in {innermost.name}"
+
+        modules = []
+        for frame_summary in stack:
+            path = os.path.abspath(frame_summary.filename)
+            if path.startswith(PROJECT_ROOT + os.sep):
+                module = os.path.relpath(path, PROJECT_ROOT)[:-3].replace(os.sep, ".")
+                modules.append((module, frame_summary))
+
+        for package in BOT_PACKAGES:
+            for module, frame_summary in modules:
+                if module.startswith(package):
+                    return f"{module}.{frame_summary.name}", blocking_at
+        return "unknown", blocking_at
+
+    def _report(self, handler: str, blocking_at: str, stalled_for: float, formatted: str):
+        EVENT_LOOP_STALLS.inc(handler=handler)
+        self._loop.create_task(BotLogger.log(
+            f"Event loop blocked for at least {stalled_for:.2f}s in {handler} at {blocking_at}\n{formatted[-1500:]}",
+            "warning",
+            "system"
+        ))
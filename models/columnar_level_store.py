@@ -0,0 +1,307 @@
+import os
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+import numpy as np
+from config.constants import LEVEL_ARRAY_FILE, LEVEL_ARRAY_TAIL_LIMIT, LEVEL_FILE, LEVEL_SNAPSHOT_INTERVAL, LEVEL_STATS_BINS, XP_MAX_TOTAL
+from models.level_store import LEVEL_USERS, LevelEntry, LevelStats, LevelStore, XPResult, read_level_file
+from models.xp_curve import XPCurve, xp_curve
+
+# Rows of the (3, capacity) table; each one is a contiguous int64 column
+USER_ID, TOTAL_XP, LEVEL = 0, 1, 2
+
+class ColumnarLevelStore(LevelStore):
+    """
+    Level store backed by parallel NumPy columns (LEVEL_ENGINE=numpy)
+
+    Users are rows of one int64 table holding user ID, lifetime XP and level,
+    about 24 bytes per member instead of a dict entry and two boxed ints.
+    The snapshot is a single .npy file opened memory-mapped (copy-on-write),
+    so start-up doesn't read the file up front; snapshots are written to a
+    temp file and renamed like levels.json. On first start the existing
+    levels.json is migrated.
+
+    Rows are kept ordered by user ID so the id -> row index is a binary
+    search; users who join later sit in an unsorted tail with a small dict
+    index until LEVEL_ARRAY_TAIL_LIMIT of them accumulate and the table is
+    re-sorted. Rankings, pages, decay and stats are vectorized over the
+    columns instead of maintaining a RankIndex.
+    """
+
+    def __init__(self, path: str = LEVEL_ARRAY_FILE, interval: float = LEVEL_SNAPSHOT_INTERVAL,
+                 curve: XPCurve = xp_curve, json_path: str = LEVEL_FILE):
+        super().__init__(path, interval, curve)
+        self.json_path = json_path
+        self._table = np.zeros((3, 0), dtype=np.int64)
+        self._count = 0
+        # Rows [0, _sorted) are ordered by user ID; later rows are indexed by _tail
+        self._sorted = 0
+        self._tail: Dict[int, int] = {}
+
+    def _read(self) -> Union[np.ndarray, Dict[int, LevelEntry]]:
+        if not os.path.exists(self.path):
+            # First start on this engine: migrate levels.json (converted on the loop in _restore)
+            return read_level_file(self.json_path, self.curve)
+        try:
+            table = np.load(self.path, mmap_mode="c")
+        except Exception as e:
+            print(f"Error loading levels array: {e}")
+            return {}
+        if table.ndim != 2 or table.shape[0] != 3 or table.dtype != np.int64:
+            print(f"Ignoring malformed levels array {self.path}")
+            return {}
+        return table
+
+    def _restore(self, data: Union[np.ndarray, Dict[int, LevelEntry]]):
+        if isinstance(data, dict):
+            table = np.empty((3, len(data)), dtype=np.int64)
+            table[USER_ID] = np.fromiter(data.keys(), dtype=np.int64, count=len(data))
+            table[TOTAL_XP] = np.fromiter(
+                (self.curve.to_total(entry.level, entry.xp) for entry in data.values()), dtype=np.int64, count=len(data)
+            )
+            table[LEVEL] = self._levels_for(table[TOTAL_XP])
+            if len(data):
+                self._dirty.set()
+        else:
+            table = data
+
+        self._table = table
+        self._count = table.shape[1]
+        ids = table[USER_ID]
+        if self._count > 1 and not np.all(ids[1:] > ids[:-1]):
+            self._sort_rows()
+        self._sorted = self._count
+        self._tail = {}
+
+    def _snapshot(self) -> np.ndarray:
+        return np.array(self._table[:, :self._count])
+
+    def _write(self, snapshot: np.ndarray):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, snapshot)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def _levels_for(self, totals: np.ndarray) -> np.ndarray:
+        if not totals.size:
+            return np.zeros(0, dtype=np.int64)
+        cumulative = np.asarray(self.curve.cumulative(int(totals.max())), dtype=np.int64)
+        return np.searchsorted(cumulative, totals, side="right").astype(np.int64)
+
+    def _sort_rows(self):
+        n = self._count
+        order = np.argsort(self._table[USER_ID, :n], kind="stable")
+        self._table[:, :n] = self._table[:, order]
+        self._sorted = n
+        self._tail = {}
+
+    def _maybe_sort(self):
+        if len(self._tail) > LEVEL_ARRAY_TAIL_LIMIT:
+            self._sort_rows()
+
+    def _row(self, user_id: int) -> Optional[int]:
+        row = self._tail.get(user_id)
+        if row is not None:
+            return row
+        ids = self._table[USER_ID, :self._sorted]
+        i = int(np.searchsorted(ids, user_id))
+        if i < self._sorted and ids[i] == user_id:
+            return i
+        return None
+
+    def _reserve(self, extra: int):
+        needed = self._count + extra
+        if needed > self._table.shape[1]:
+            grown = np.zeros((3, max(1024, 2 * self._count, needed)), dtype=np.int64)
+            grown[:, :self._count] = self._table[:, :self._count]
+            self._table = grown
+
+    def _append(self, user_id: int) -> int:
+        """Add an empty row (level 1, 0 XP); the caller re-sorts via _maybe_sort when done"""
+        self._reserve(1)
+        row = self._count
+        self._table[:, row] = (user_id, 0, 1)
+        self._tail[user_id] = row
+        self._count += 1
+        return row
+
+    def _ensure_rows(self, user_ids: np.ndarray) -> np.ndarray:
+        """Rows for many (distinct) users at once, appending the ones not in the table yet"""
+        sorted_ids = self._table[USER_ID, :self._sorted]
+        if self._sorted:
+            positions = np.minimum(np.searchsorted(sorted_ids, user_ids), self._sorted - 1)
+            found = sorted_ids[positions] == user_ids
+        else:
+            positions, found = np.zeros(len(user_ids), dtype=np.int64), np.zeros(len(user_ids), dtype=bool)
+        rows = np.where(found, positions, -1)
+
+        missing = np.flatnonzero(~found)
+        tail_rows = np.fromiter((self._tail.get(user_id, -1) for user_id in user_ids[missing].tolist()), dtype=np.int64, count=len(missing))
+        rows[missing] = tail_rows
+
+        new = missing[tail_rows < 0]
+        if len(new):
+            # New users are appended as one block of level 1, 0 XP rows
+            self._reserve(len(new))
+            start, end = self._count, self._count + len(new)
+            self._table[USER_ID, start:end] = user_ids[new]
+            self._table[TOTAL_XP, start:end] = 0
+            self._table[LEVEL, start:end] = 1
+            rows[new] = np.arange(start, end)
+            self._tail.update(zip(user_ids[new].tolist(), range(start, end)))
+            self._count = end
+        return rows
+
+    def _assign(self, rows: np.ndarray, totals: np.ndarray) -> Dict[int, XPResult]:
+        totals = np.clip(totals, 0, XP_MAX_TOTAL)
+        previous = self._table[LEVEL, rows].copy()
+        levels = self._levels_for(totals)
+        self._table[TOTAL_XP, rows] = totals
+        self._table[LEVEL, rows] = levels
+
+        cumulative = np.asarray(self.curve.cumulative(int(totals.max()) if totals.size else 0), dtype=np.int64)
+        xp = totals - cumulative[levels - 1]
+        results = {
+            user_id: XPResult(level, xp_into_level, previous_level)
+            for user_id, level, xp_into_level, previous_level in zip(
+                self._table[USER_ID, rows].tolist(), levels.tolist(), xp.tolist(), previous.tolist()
+            )
+        }
+        self._maybe_sort()
+        if results:
+            LEVEL_USERS.set(self._count)
+            self._dirty.set()
+        return results
+
+    def _entry(self, row: int) -> LevelEntry:
+        level = int(self._table[LEVEL, row])
+        return LevelEntry(level, int(self._table[TOTAL_XP, row]) - self.curve.total_for_level(level))
+
+    def get(self, user_id: int) -> Optional[LevelEntry]:
+        row = self._row(user_id)
+        return None if row is None else self._entry(row)
+
+    def total_xp(self, user_id: int) -> int:
+        row = self._row(user_id)
+        return 0 if row is None else int(self._table[TOTAL_XP, row])
+
+    def set(self, user_id: int, level: int, xp: int):
+        self.set_totals({user_id: self.curve.to_total(level, xp)})
+
+    def add_xp(self, user_id: int, amount: int) -> XPResult:
+        row = self._row(user_id)
+        if row is None:
+            row = self._append(user_id)
+        previous_level = int(self._table[LEVEL, row])
+        total = self.curve.clamp(int(self._table[TOTAL_XP, row]) + amount)
+        level = self.curve.level_for_total_xp(total)
+        self._table[TOTAL_XP, row] = total
+        self._table[LEVEL, row] = level
+        self._maybe_sort()
+        LEVEL_USERS.set(self._count)
+        self._dirty.set()
+        return XPResult(level, total - self.curve.total_for_level(level), previous_level)
+
+    def set_totals(self, totals: Dict[int, int]) -> Dict[int, XPResult]:
+        user_ids = np.fromiter(totals.keys(), dtype=np.int64, count=len(totals))
+        try:
+            values = np.fromiter(totals.values(), dtype=np.int64, count=len(totals))
+        except OverflowError:
+            values = np.fromiter((self.curve.clamp(total) for total in totals.values()), dtype=np.int64, count=len(totals))
+        return self._assign(self._ensure_rows(user_ids), values)
+
+    def grant(self, user_ids: Iterable[int], amount: int) -> Dict[int, XPResult]:
+        unique = set(user_ids)
+        rows = self._ensure_rows(np.fromiter(unique, dtype=np.int64, count=len(unique)))
+        # Totals are within 0 .. XP_MAX_TOTAL, so limiting the amount to +-XP_MAX_TOTAL keeps the sum in
+        # int64 without changing the clamped result (the JSON store clamps the same way)
+        amount = min(max(int(amount), -XP_MAX_TOTAL), XP_MAX_TOTAL)
+        return self._assign(rows, self._table[TOTAL_XP, rows] + amount)
+
+    def reset(self, user_ids: Optional[Iterable[int]] = None) -> int:
+        if user_ids is None:
+            removed = self._count
+            self._table = np.zeros((3, 0), dtype=np.int64)
+            self._count = self._sorted = 0
+            self._tail = {}
+        else:
+            rows = [row for row in map(self._row, set(user_ids)) if row is not None]
+            removed = len(rows)
+            if removed:
+                keep = np.ones(self._count, dtype=bool)
+                keep[rows] = False
+                self._table = self._table[:, :self._count][:, keep]
+                self._count = self._table.shape[1]
+                # Deleting shifts the tail rows, so re-sort rather than patch the tail index
+                self._sort_rows()
+        if removed:
+            LEVEL_USERS.set(self._count)
+            self._dirty.set()
+        return removed
+
+    def decay(self, percent: float) -> int:
+        n = self._count
+        if not n:
+            return 0
+        keep = max(0.0, 1 - percent / 100)
+        totals = (self._table[TOTAL_XP, :n] * keep).astype(np.int64)
+        self._table[TOTAL_XP, :n] = totals
+        self._table[LEVEL, :n] = self._levels_for(totals)
+        self._dirty.set()
+        return n
+
+    def stats(self) -> LevelStats:
+        n = self._count
+        if not n:
+            return LevelStats(0, 0, 0.0, 0, 0, 0, 0, [(edge, 0) for edge in LEVEL_STATS_BINS])
+
+        levels = self._table[LEVEL, :n]
+        totals = self._table[TOTAL_XP, :n]
+        edges = np.asarray(LEVEL_STATS_BINS, dtype=np.int64)
+        buckets = np.searchsorted(edges, levels, side="right") - 1
+        counts = np.bincount(buckets[buckets >= 0], minlength=len(edges))
+        p90, p99 = min(n - 1, n * 90 // 100), min(n - 1, n * 99 // 100)
+        percentiles = np.partition(totals, (p90, p99))
+        return LevelStats(
+            users=n,
+            total_xp=int(totals.sum()),
+            mean_level=float(levels.mean()),
+            median_level=int(np.partition(levels, n // 2)[n // 2]),
+            max_level=int(levels.max()),
+            p90_xp=int(percentiles[p90]),
+            p99_xp=int(percentiles[p99]),
+            histogram=list(zip(LEVEL_STATS_BINS, counts.tolist()))
+        )
+
+    def page(self, offset: int, limit: int) -> List[Tuple[int, LevelEntry]]:
+        n = self._count
+        if limit <= 0 or offset >= n:
+            return []
+        offset = max(offset, 0)
+        k = min(offset + limit, n)
+        ids = self._table[USER_ID, :n]
+        totals = self._table[TOTAL_XP, :n]
+
+        if k < n:
+            # Top k by XP in O(n); users tied at the cut are kept so the user ID tie-break stays exact
+            top = np.argpartition(-totals, k - 1)[:k]
+            candidates = np.flatnonzero(totals >= totals[top].min())
+        else:
+            candidates = np.arange(n)
+        order = candidates[np.lexsort((ids[candidates], -totals[candidates]))]
+        return [(int(ids[row]), self._entry(row)) for row in order[offset:offset + limit].tolist()]
+
+    def rank_of(self, user_id: int) -> Optional[int]:
+        row = self._row(user_id)
+        if row is None:
+            return None
+        ids = self._table[USER_ID, :self._count]
+        totals = self._table[TOTAL_XP, :self._count]
+        total = totals[row]
+        return int(np.count_nonzero(totals > total) + np.count_nonzero((totals == total) & (ids < user_id))) + 1
+
+    def __len__(self) -> int:
+        return self._count
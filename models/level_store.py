@@ -0,0 +1,324 @@
+import asyncio
+import json
+import os
+import time
+from bisect import bisect_left
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from config.constants import LEVEL_FILE, LEVEL_SNAPSHOT_INTERVAL, LEVEL_STATS_BINS
+from config.settings import config
+from models.rank_index import RankIndex
+from models.xp_curve import XPCurve, xp_curve
+from utils.metrics import metrics
+
+LEVEL_SNAPSHOT_SECONDS = metrics.histogram("bot_level_snapshot_seconds", "Time to write a levels snapshot to disk")
+LEVEL_USERS = metrics.gauge("bot_level_users", "Users tracked by the level store")
+
+class LevelEntry(NamedTuple):
+    level: int
+    xp: int
+
+class XPResult(NamedTuple):
+    level: int
+    xp: int
+    previous_level: int
+
+    @property
+    def leveled_up(self) -> bool:
+        return self.level > self.previous_level
+
+def read_level_file(path: str, curve: XPCurve = xp_curve) -> Dict[int, LevelEntry]:
+    """
+    Read a levels.json snapshot
+
+    Args:
+        path: File to read
+        curve: XP curve whose max_level bounds the stored levels
+
+    Returns:
+        {user_id: entry}; empty if the file is missing or unreadable
+    """
+    try:
+        with open(path, "r") as f:
+            raw = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"Error loading levels file: {e}")
+        return {}
+
+    users = {}
+    for user_id, data in raw.items():
+        try:
+            users[int(user_id)] = LevelEntry(curve.clamp_level(data["level"]), int(data["xp"]))
+        except (KeyError, ValueError, TypeError):
+            print(f"Skipping invalid levels entry for {user_id}")
+    return users
+
+class LevelStats(NamedTuple):
+    users: int
+    total_xp: int
+    mean_level: float
+    median_level: int
+    max_level: int
+    p90_xp: int
+    p99_xp: int
+    # (lowest level in the bucket, users in it) per LEVEL_STATS_BINS edge
+    histogram: List[Tuple[int, int]]
+
+class LevelStore:
+    """
+    In-memory XP/level table with write-behind JSON snapshots
+
+    Every read and write happens synchronously on the event loop, so the
+    loop is the single writer and concurrent messages can't lose updates.
+    Changes mark the store dirty; a background task writes a snapshot at
+    most once per interval (write to a temp file, then rename) and once more
+    on close. The file keeps the original levels.json shape.
+
+    A RankIndex ordered best-first is kept in step with every change, so
+    rank lookups and leaderboard pages never sort the table. Levels are
+    derived from lifetime XP through the cumulative XPCurve, so any award
+    lands on the right level however many it crosses.
+    """
+
+    def __init__(self, path: str = LEVEL_FILE, interval: float = LEVEL_SNAPSHOT_INTERVAL, curve: XPCurve = xp_curve):
+        self.path = path
+        self.interval = interval
+        self.curve = curve
+        self._users: Dict[int, LevelEntry] = {}
+        self._ranking = RankIndex()
+        self._dirty = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._loaded = False
+
+    async def start(self):
+        """Load the snapshot (once) and start the background writer"""
+        if not self._loaded:
+            self._restore(await asyncio.to_thread(self._read))
+            self._loaded = True
+            LEVEL_USERS.set(len(self))
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        """Stop the background writer and write any pending changes"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await self.flush()
+
+    def _read(self) -> Dict[int, LevelEntry]:
+        return read_level_file(self.path, self.curve)
+
+    def _restore(self, users: Dict[int, LevelEntry]):
+        self._users = users
+        self._rebuild_ranking()
+
+    def _snapshot(self) -> List[Tuple[int, int, int]]:
+        return [(user_id, entry.level, entry.xp) for user_id, entry in self._users.items()]
+
+    def _write(self, snapshot: List[Tuple[int, int, int]]):
+        data = {str(user_id): {"xp": xp, "level": level} for user_id, level, xp in snapshot}
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    async def flush(self):
+        """Write a snapshot now if anything changed since the last one"""
+        if not self._loaded or not self._dirty.is_set():
+            return
+        # Copy on the loop so the snapshot is consistent; serialize and write off it
+        snapshot = self._snapshot()
+        self._dirty.clear()
+        start = time.perf_counter()
+        try:
+            await asyncio.to_thread(self._write, snapshot)
+        except Exception as e:
+            self._dirty.set()
+            print(f"Error saving levels file: {e}")
+        finally:
+            LEVEL_SNAPSHOT_SECONDS.observe(time.perf_counter() - start)
+
+    async def _run(self):
+        while True:
+            await self._dirty.wait()
+            # Debounce: collect every change in the interval into one write
+            await asyncio.sleep(self.interval)
+            await self.flush()
+
+    @staticmethod
+    def _rank_key(user_id: int, entry: LevelEntry) -> Tuple[int, int, int]:
+        # Ascending order = highest level, then highest XP, then lowest user ID first
+        return (-entry.level, -entry.xp, user_id)
+
+    def get(self, user_id: int) -> Optional[LevelEntry]:
+        return self._users.get(user_id)
+
+    def set(self, user_id: int, level: int, xp: int):
+        previous = self._users.get(user_id)
+        if previous is not None:
+            self._ranking.remove(self._rank_key(user_id, previous))
+        entry = self._users[user_id] = LevelEntry(level, xp)
+        self._ranking.add(self._rank_key(user_id, entry))
+        LEVEL_USERS.set(len(self._users))
+        self._dirty.set()
+
+    def total_xp(self, user_id: int) -> int:
+        """Lifetime XP of a user (0 if they have none)"""
+        entry = self._users.get(user_id)
+        return self.curve.to_total(entry.level, entry.xp) if entry else 0
+
+    def add_xp(self, user_id: int, amount: int) -> XPResult:
+        """
+        Award XP and apply every level it crosses
+
+        Args:
+            user_id: Discord user ID
+            amount: XP to add (negative to take XP away)
+
+        Returns:
+            The user's new level and XP, plus the level before this award
+        """
+        previous_level = self._users[user_id].level if user_id in self._users else 1
+        level, xp = self.curve.split(self.total_xp(user_id) + amount)
+        self.set(user_id, level, xp)
+        return XPResult(level, xp, previous_level)
+
+    def set_totals(self, totals: Dict[int, int]) -> Dict[int, XPResult]:
+        """
+        Set the lifetime XP of many users in one pass
+
+        The ranking is patched per user for small batches and rebuilt once
+        from the whole table for large ones (imports, server-wide grants),
+        which is cheaper than thousands of individual moves.
+
+        Args:
+            totals: {user_id: lifetime XP}
+
+        Returns:
+            {user_id: result} for every user in the batch
+        """
+        rebuild = len(totals) * 8 > len(self._users)
+        results = {}
+        for user_id, total in totals.items():
+            previous = self._users.get(user_id)
+            level, xp = self.curve.split(total)
+            entry = LevelEntry(level, xp)
+            if not rebuild:
+                if previous is not None:
+                    self._ranking.remove(self._rank_key(user_id, previous))
+                self._ranking.add(self._rank_key(user_id, entry))
+            self._users[user_id] = entry
+            results[user_id] = XPResult(level, xp, previous.level if previous else 1)
+
+        if rebuild:
+            self._rebuild_ranking()
+        if results:
+            LEVEL_USERS.set(len(self._users))
+            self._dirty.set()
+        return results
+
+    def grant(self, user_ids: Iterable[int], amount: int) -> Dict[int, XPResult]:
+        """Add (or with a negative amount, remove) XP for many users in one pass"""
+        return self.set_totals({user_id: self.total_xp(user_id) + amount for user_id in set(user_ids)})
+
+    def reset(self, user_ids: Optional[Iterable[int]] = None) -> int:
+        """
+        Remove users from the table (everyone if user_ids is None)
+
+        Returns:
+            Number of users removed
+        """
+        if user_ids is None:
+            removed = len(self._users)
+            self._users = {}
+            self._ranking = RankIndex()
+        else:
+            removed = 0
+            for user_id in set(user_ids):
+                entry = self._users.pop(user_id, None)
+                if entry is not None:
+                    self._ranking.remove(self._rank_key(user_id, entry))
+                    removed += 1
+        if removed:
+            LEVEL_USERS.set(len(self._users))
+            self._dirty.set()
+        return removed
+
+    def decay(self, percent: float) -> int:
+        """
+        Take a percentage of every user's lifetime XP away (100 for a seasonal reset to level 1)
+
+        Returns:
+            Number of users affected
+        """
+        keep = max(0.0, 1 - percent / 100)
+        return len(self.set_totals({
+            user_id: int(self.curve.to_total(entry.level, entry.xp) * keep) for user_id, entry in self._users.items()
+        }))
+
+    def stats(self) -> LevelStats:
+        """Distribution of levels and XP across the table (for /levels stats)"""
+        if not self._users:
+            return LevelStats(0, 0, 0.0, 0, 0, 0, 0, [(edge, 0) for edge in LEVEL_STATS_BINS])
+
+        levels = sorted(entry.level for entry in self._users.values())
+        totals = sorted(self.curve.to_total(entry.level, entry.xp) for entry in self._users.values())
+        n = len(levels)
+        histogram = [
+            (edge, bisect_left(levels, upper) - bisect_left(levels, edge))
+            for edge, upper in zip(LEVEL_STATS_BINS, LEVEL_STATS_BINS[1:] + (float("inf"),))
+        ]
+        return LevelStats(
+            users=n,
+            total_xp=sum(totals),
+            mean_level=sum(levels) / n,
+            median_level=levels[n // 2],
+            max_level=levels[-1],
+            p90_xp=totals[min(n - 1, n * 90 // 100)],
+            p99_xp=totals[min(n - 1, n * 99 // 100)],
+            histogram=histogram
+        )
+
+    def _rebuild_ranking(self):
+        self._ranking = RankIndex(self._rank_key(user_id, entry) for user_id, entry in self._users.items())
+
+    def page(self, offset: int, limit: int) -> List[Tuple[int, LevelEntry]]:
+        """Users at ranking positions offset .. offset + limit - 1 (0-based), best first"""
+        return [(key[2], self._users[key[2]]) for key in self._ranking.slice(offset, limit)]
+
+    def top(self, limit: int = 10) -> List[Tuple[int, LevelEntry]]:
+        """Highest users by level, then XP"""
+        return self.page(0, limit)
+
+    def rank_of(self, user_id: int) -> Optional[int]:
+        """1-based leaderboard position of a user, or None if they have no XP yet"""
+        entry = self._users.get(user_id)
+        if entry is None:
+            return None
+        return self._ranking.index(self._rank_key(user_id, entry)) + 1
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+def create_level_store() -> LevelStore:
+    """
+    Build the level store selected by LEVEL_ENGINE
+
+    "numpy" uses the columnar engine when NumPy is installed and falls back
+    to the JSON store (with a message) when it isn't.
+    """
+    if config.LEVEL_ENGINE == "numpy":
+        try:
+            from models.columnar_level_store import ColumnarLevelStore
+        except ImportError as e:
+            print(f"LEVEL_ENGINE=numpy but NumPy is unavailable ({e}); using the JSON level store")
+        else:
+            return ColumnarLevelStore()
+    return LevelStore()
+
+# Global instance
+level_store = create_level_store()
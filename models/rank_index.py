@@ -0,0 +1,160 @@
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Iterator, List
+
+class RankIndex:
+    """
+    Sorted multiset with positional access (an order-statistic list)
+
+    Keys are kept in ascending order across a list of bounded buckets. A
+    Fenwick tree over the bucket sizes turns "how many keys sort before
+    this one" and "which key sits at position i" into O(log n) lookups; it is
+    updated in place on insert/remove and rebuilt only when a bucket splits
+    or empties. Pages are read straight out of the buckets in O(k).
+    """
+
+    def __init__(self, keys=(), load: int = 512):
+        self._load = load
+        self._buckets: List[list] = []
+        self._maxes: List[Any] = []
+        self._tree: List[int] = []
+        self._len = 0
+        self._bulk_load(sorted(keys))
+
+    def _bulk_load(self, keys: list):
+        self._buckets = [keys[i:i + self._load] for i in range(0, len(keys), self._load)]
+        self._maxes = [bucket[-1] for bucket in self._buckets]
+        self._len = len(keys)
+        self._rebuild_tree()
+
+    def _rebuild_tree(self):
+        # Fenwick tree (1-based) over bucket lengths, built in O(buckets)
+        tree = [0] + [len(bucket) for bucket in self._buckets]
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _tree_add(self, bucket_index: int, delta: int):
+        i = bucket_index + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def _tree_prefix(self, bucket_index: int) -> int:
+        """Total keys in buckets before bucket_index"""
+        total = 0
+        i = bucket_index
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def _tree_locate(self, position: int):
+        """Bucket holding the key at position, and the offset inside it"""
+        index = 0
+        step = 1 << (len(self._tree).bit_length())
+        while step:
+            nxt = index + step
+            if nxt < len(self._tree) and self._tree[nxt] <= position:
+                index = nxt
+                position -= self._tree[nxt]
+            step >>= 1
+        return index, position
+
+    def __len__(self) -> int:
+        return self._len
+
+    def add(self, key):
+        if not self._buckets:
+            self._buckets.append([key])
+            self._maxes.append(key)
+            self._len = 1
+            self._rebuild_tree()
+            return
+
+        b = bisect_left(self._maxes, key)
+        if b == len(self._maxes):
+            b -= 1
+            self._buckets[b].append(key)
+            self._maxes[b] = key
+        else:
+            insort(self._buckets[b], key)
+        self._len += 1
+
+        if len(self._buckets[b]) > 2 * self._load:
+            bucket = self._buckets[b]
+            self._buckets[b:b + 1] = [bucket[:self._load], bucket[self._load:]]
+            self._maxes[b:b + 1] = [bucket[self._load - 1], bucket[-1]]
+            self._rebuild_tree()
+        else:
+            self._tree_add(b, 1)
+
+    def remove(self, key):
+        """Remove one occurrence of key; raises ValueError if absent"""
+        b = bisect_left(self._maxes, key)
+        if b == len(self._maxes):
+            raise ValueError(f"{key!r} not in index")
+        bucket = self._buckets[b]
+        i = bisect_left(bucket, key)
+        if i == len(bucket) or bucket[i] != key:
+            raise ValueError(f"{key!r} not in index")
+
+        del bucket[i]
+        self._len -= 1
+        if not bucket:
+            del self._buckets[b]
+            del self._maxes[b]
+            self._rebuild_tree()
+        else:
+            self._maxes[b] = bucket[-1]
+            self._tree_add(b, -1)
+
+    def index(self, key) -> int:
+        """0-based position of key; raises ValueError if absent"""
+        b = bisect_left(self._maxes, key)
+        if b < len(self._maxes):
+            bucket = self._buckets[b]
+            i = bisect_left(bucket, key)
+            if i < len(bucket) and bucket[i] == key:
+                return self._tree_prefix(b) + i
+        raise ValueError(f"{key!r} not in index")
+
+    def count_before(self, key) -> int:
+        """Number of keys strictly less than key (present or not)"""
+        b = bisect_left(self._maxes, key)
+        if b == len(self._maxes):
+            return self._len
+        return self._tree_prefix(b) + bisect_left(self._buckets[b], key)
+
+    def count_at_most(self, key) -> int:
+        """Number of keys less than or equal to key"""
+        b = bisect_right(self._maxes, key)
+        if b == len(self._maxes):
+            return self._len
+        return self._tree_prefix(b) + bisect_right(self._buckets[b], key)
+
+    def __getitem__(self, position: int):
+        if position < 0:
+            position += self._len
+        if not 0 <= position < self._len:
+            raise IndexError("RankIndex index out of range")
+        b, offset = self._tree_locate(position)
+        return self._buckets[b][offset]
+
+    def slice(self, start: int, count: int) -> List[Any]:
+        """Up to count keys starting at position start"""
+        if count <= 0 or start >= self._len:
+            return []
+        start = max(start, 0)
+        b, offset = self._tree_locate(start)
+        result = []
+        while b < len(self._buckets) and len(result) < count:
+            bucket = self._buckets[b]
+            result.extend(bucket[offset:offset + count - len(result)])
+            b, offset = b + 1, 0
+        return result
+
+    def __iter__(self) -> Iterator[Any]:
+        for bucket in self._buckets:
+            yield from bucket
@@ -0,0 +1,85 @@
+from bisect import bisect_right
+from typing import Callable, List, Tuple
+from config.constants import XP_CURVE_PRECOMPUTED_LEVELS, XP_MAX_TOTAL
+
+def default_xp_for_level(level: int) -> int:
+    """XP required to advance from level to level + 1"""
+    return 100 * (level ** 2) + 100 * level
+
+class XPCurve:
+    """
+    Cumulative XP table for the level curve
+
+    Entry i of the table is the total XP needed to reach level i + 1
+    (level 1 starts at 0). The per-level formula is evaluated once per level
+    when the table is built or extended, never per message; converting a
+    total back to a level is a binary search, so an award that crosses any
+    number of levels is resolved in a single step.
+
+    The table is built up to max_level (the level XP_MAX_TOTAL reaches) at
+    construction, and levels and totals are clamped to that range, so it
+    never grows afterwards whatever level or total is asked for.
+    """
+
+    def __init__(self, xp_for_level: Callable[[int], int] = default_xp_for_level,
+                 levels: int = XP_CURVE_PRECOMPUTED_LEVELS):
+        self._xp_for_level = xp_for_level
+        self._totals: List[int] = [0]
+        self._extend(levels)
+        self.max_level = self.level_for_total_xp(XP_MAX_TOTAL)
+
+    def _extend(self, levels: int):
+        totals = self._totals
+        while len(totals) < levels:
+            level = len(totals)
+            totals.append(totals[-1] + self._xp_for_level(level))
+
+    @staticmethod
+    def clamp(total_xp: int) -> int:
+        return min(max(int(total_xp), 0), XP_MAX_TOTAL)
+
+    def xp_for_level(self, level: int) -> int:
+        """XP required to advance from level to level + 1"""
+        return self.total_for_level(level + 1) - self.total_for_level(level)
+
+    def clamp_level(self, level: int) -> int:
+        """Level limited to 1 .. max_level"""
+        return min(max(int(level), 1), self.max_level)
+
+    def total_for_level(self, level: int) -> int:
+        """Total XP needed to reach level (from level 1 with 0 XP), for levels up to max_level + 1"""
+        # max_level + 1 is still in the table (its total is past XP_MAX_TOTAL), so xp_for_level(max_level) works
+        return self._totals[min(max(int(level), 1), self.max_level + 1) - 1]
+
+    def level_for_total_xp(self, total_xp: int) -> int:
+        """Highest level whose cumulative requirement is at most total_xp"""
+        total_xp = self.clamp(total_xp)
+        while total_xp >= self._totals[-1]:
+            self._extend(2 * len(self._totals))
+        return bisect_right(self._totals, total_xp)
+
+    def cumulative(self, max_total_xp: int) -> List[int]:
+        """The cumulative table, extended to cover max_total_xp (for vectorized lookups)"""
+        self.level_for_total_xp(max_total_xp)
+        return self._totals
+
+    def split(self, total_xp: int) -> Tuple[int, int]:
+        """
+        Convert a total XP amount to the stored (level, xp into that level) pair
+
+        Args:
+            total_xp: Lifetime XP, clamped to 0 .. XP_MAX_TOTAL
+
+        Returns:
+            Level and the XP earned towards the next one
+        """
+        total_xp = self.clamp(total_xp)
+        level = self.level_for_total_xp(total_xp)
+        return level, total_xp - self._totals[level - 1]
+
+    def to_total(self, level: int, xp: int) -> int:
+        """Inverse of split: lifetime XP for a stored (level, xp) pair, clamped to 0 .. XP_MAX_TOTAL"""
+        return self.clamp(self.total_for_level(self.clamp_level(level)) + xp)
+
+# Global instance
+xp_curve = XPCurve()
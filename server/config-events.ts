@@ -0,0 +1,33 @@
+import { EventEmitter } from "events";
+
+// Bumped whenever anything served by /api/bot/config or /api/bot/templates
+// changes, so connected bots can refetch right away instead of waiting for
+// their next poll.
+export interface ConfigChange {
+  version: number;
+  reason: string;
+}
+
+const emitter = new EventEmitter();
+// One listener per connected bot stream
+emitter.setMaxListeners(0);
+
+let configVersion = 0;
+
+export function getConfigVersion(): number {
+  return configVersion;
+}
+
+export function notifyConfigChanged(reason: string): ConfigChange {
+  configVersion += 1;
+  const change = { version: configVersion, reason };
+  emitter.emit("change", change);
+  return change;
+}
+
+export function onConfigChanged(listener: (change: ConfigChange) => void): () => void {
+  emitter.on("change", listener);
+  return () => {
+    emitter.off("change", listener);
+  };
+}
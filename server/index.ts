@@ -51,8 +51,8 @@ app.use((req, res, next) => {
   res.on("finish", () => {
     const duration = Date.now() - start;
     if (path.startsWith("/api")) {
-      // Skip logging for high-frequency bot heartbeat and config requests
-      if (path === "/api/bot/heartbeat" || path === "/api/bot/config") {
+      // Skip logging for high-frequency bot heartbeat, config and template requests
+      if (path === "/api/bot/heartbeat" || path.startsWith("/api/bot/config") || path === "/api/bot/templates") {
         return;
       }
 
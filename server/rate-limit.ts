@@ -19,7 +19,7 @@ function isBotRoute(req: Request): boolean {
 
   // POST routes for bot
   if (req.method === "POST") {
-    if (path === "/api/logs" || path === "/api/warns" || path === "/api/lfm") {
+    if (path === "/api/logs" || path === "/api/logs/batch" || path === "/api/warns" || path === "/api/lfm") {
       return true;
     }
     if (path === "/api/bot/heartbeat") {
@@ -29,7 +29,7 @@ function isBotRoute(req: Request): boolean {
 
   // GET routes for bot
   if (req.method === "GET") {
-    if (path === "/api/bot/config") {
+    if (path === "/api/bot/config" || path === "/api/bot/config/stream" || path === "/api/bot/templates") {
       return true;
     }
     if (path.startsWith("/api/lfm/")) {
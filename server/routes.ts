@@ -2,9 +2,10 @@ import type { Express, RequestHandler } from "express";
 import type { Server } from "http";
 import passport from "passport";
 import { storage } from "./storage";
+import { getConfigVersion, notifyConfigChanged, onConfigChanged } from "./config-events";
 import { setupAuth, requireAuth, isAuthenticated, isDiscordConfigured } from "./auth";
 import { api } from "@shared/routes";
-import { insertWarnSchema, insertLfmSchema, insertScrobbleHistorySchema } from "@shared/schema";
+import { insertWarnSchema, insertLfmSchema, insertScrobbleHistorySchema, insertAutoResponseTriggerSchema, logPolicySchema } from "@shared/schema";
 import { z } from "zod";
 import crypto from "crypto";
 
@@ -255,6 +256,23 @@ export async function registerRoutes(
     }
   });
 
+  // Batched log ingest - the bot ships queued log entries here in one request
+  app.post(api.logs.batchCreate.path, requireBotApiKeyOrAuth, async (req, res) => {
+    try {
+      const input = api.logs.batchCreate.input.parse(req.body);
+      const inserted = await storage.createLogs(input.logs);
+      res.status(201).json({ inserted });
+    } catch (err) {
+      if (err instanceof z.ZodError) {
+        return res.status(400).json({
+          message: err.errors[0].message,
+          field: err.errors[0].path.join("."),
+        });
+      }
+      throw err;
+    }
+  });
+
   // Delete logs route - admin only
   app.delete("/api/logs", requireAdmin, async (req, res) => {
     try {
@@ -744,10 +762,11 @@ export async function registerRoutes(
   // Get bot config (for bot - protected by API key)
   app.get("/api/bot/config", requireBotApiKey, async (req, res) => {
     try {
-      const [config, starboardConfigs, autoreactConfigs] = await Promise.all([
+      const [config, starboardConfigs, autoreactConfigs, triggers] = await Promise.all([
         storage.getBotConfig(),
         storage.getStarboardConfigs(),
         storage.getAutoreactConfigs(),
+        storage.getAutoResponseTriggers(),
       ]);
 
       // Convert arrays to objects keyed by guildId for easier bot access
@@ -770,16 +789,70 @@ export async function registerRoutes(
         };
       }
 
-      res.json({
+      const autoResponses = triggers
+        .filter((t) => t.enabled)
+        .map((t) => ({
+          id: t.id,
+          guild_id: t.guildId,
+          pattern: t.pattern,
+          match_type: t.matchType,
+          action: t.action,
+          response: t.response,
+          cooldown_seconds: t.cooldownSeconds,
+        }));
+
+      // Until an admin saves a trigger, autoResponses is left out so the bot keeps its built-in
+      // triggers; once any row exists (even a disabled one) the dashboard list is authoritative
+      const body = JSON.stringify({
         ...config,
         starboard,
         autoreact,
+        ...(triggers.length > 0 ? { autoResponses } : {}),
       });
+
+      // Content hash, so the ETag stays valid across server restarts and direct DB edits
+      const etag = `"${crypto.createHash("sha1").update(body).digest("base64url")}"`;
+      res.set("ETag", etag);
+      res.set("Cache-Control", "no-cache");
+      res.set("X-Config-Version", String(getConfigVersion()));
+
+      if (req.headers["if-none-match"] === etag) {
+        return res.status(304).end();
+      }
+
+      res.type("application/json").send(body);
     } catch (err) {
       res.status(500).json({ message: "Failed to fetch config" });
     }
   });
 
+  // Server-sent events: tells connected bots to refetch config as soon as it changes
+  app.get("/api/bot/config/stream", requireBotApiKey, (req, res) => {
+    res.set({
+      "Content-Type": "text/event-stream",
+      "Cache-Control": "no-cache",
+      "Connection": "keep-alive",
+      "X-Accel-Buffering": "no",
+    });
+    res.flushHeaders();
+
+    const send = (change: { version: number; reason: string }) => {
+      res.write(`event: config\ndata: ${JSON.stringify(change)}\n\n`);
+    };
+
+    // Initial event lets the bot catch anything it missed while disconnected
+    send({ version: getConfigVersion(), reason: "connected" });
+    const unsubscribe = onConfigChanged(send);
+
+    // Comment lines keep proxies from closing an idle stream
+    const keepAlive = setInterval(() => res.write(": keep-alive\n\n"), 25000);
+
+    req.on("close", () => {
+      clearInterval(keepAlive);
+      unsubscribe();
+    });
+  });
+
   // Get bot config (for dashboard - with auth)
   app.get("/api/config", requireAuth, async (req, res) => {
     try {
@@ -799,18 +872,28 @@ export async function registerRoutes(
     try {
       const user = req.user as Express.User;
       const { prefix, disabledCommands, allowedChannels } = req.body;
+      // The bot rejects a whole config with a malformed policy, so it is checked before saving
+      const logPolicy = logPolicySchema.optional().parse(req.body.logPolicy);
 
       const config = await storage.updateBotConfig(
         {
           prefix,
           disabledCommands,
           allowedChannels,
+          logPolicy,
         },
         user.discordId
       );
 
+      notifyConfigChanged("config");
       res.json(config);
     } catch (err) {
+      if (err instanceof z.ZodError) {
+        return res.status(400).json({
+          message: err.errors[0].message,
+          field: ["logPolicy", ...err.errors[0].path].join("."),
+        });
+      }
       res.status(500).json({ message: "Failed to update config" });
     }
   });
@@ -1063,6 +1146,7 @@ export async function registerRoutes(
         createdBy: user.discordId,
       });
 
+      notifyConfigChanged("templates");
       res.status(201).json(template);
     } catch (err) {
       console.error("Error creating embed template:", err);
@@ -1101,6 +1185,7 @@ export async function registerRoutes(
       if (isDefault !== undefined) updateData.isDefault = isDefault;
 
       const template = await storage.updateEmbedTemplate(id, updateData);
+      notifyConfigChanged("templates");
       res.json(template);
     } catch (err) {
       console.error("Error updating embed template:", err);
@@ -1121,6 +1206,7 @@ export async function registerRoutes(
         return res.status(403).json({ message: "Cannot delete default template" });
       }
 
+      notifyConfigChanged("templates");
       res.json({ message: "Template deleted successfully", id });
     } catch (err) {
       console.error("Error deleting embed template:", err);
@@ -1170,6 +1256,50 @@ export async function registerRoutes(
     }
   });
 
+  // Every command template mapping with its template, so the bot can warm its cache in one request
+  app.get("/api/bot/templates", requireBotApiKey, async (req, res) => {
+    try {
+      const [mappings, templates] = await Promise.all([
+        storage.getCommandTemplateMappings(),
+        storage.getEmbedTemplates(),
+      ]);
+      const templatesById = new Map(templates.map((t) => [t.id, t]));
+
+      const entries = [];
+      for (const mapping of mappings) {
+        const template = templatesById.get(mapping.templateId);
+        if (!template) continue;
+        try {
+          entries.push({
+            command_name: mapping.commandName,
+            context: mapping.context || "default",
+            mapping,
+            template_data: typeof template.templateData === "string" ? JSON.parse(template.templateData) : template.templateData,
+          });
+        } catch {
+          console.error(`Skipping template ${template.id} for ${mapping.commandName}: invalid JSON`);
+        }
+      }
+
+      const body = JSON.stringify({ templates: entries });
+
+      // Same conditional-GET scheme as /api/bot/config
+      const etag = `"${crypto.createHash("sha1").update(body).digest("base64url")}"`;
+      res.set("ETag", etag);
+      res.set("Cache-Control", "no-cache");
+      res.set("X-Config-Version", String(getConfigVersion()));
+
+      if (req.headers["if-none-match"] === etag) {
+        return res.status(304).end();
+      }
+
+      res.type("application/json").send(body);
+    } catch (err) {
+      console.error("Error fetching command templates:", err);
+      res.status(500).json({ message: "Failed to fetch command templates" });
+    }
+  });
+
   // Create command template mapping
   app.post("/api/command-template-mappings", requireAdmin, async (req, res) => {
     try {
@@ -1187,6 +1317,7 @@ export async function registerRoutes(
         createdBy: user.discordId,
       });
 
+      notifyConfigChanged("templates");
       res.status(201).json(mapping);
     } catch (err) {
       console.error("Error creating command template mapping:", err);
@@ -1210,6 +1341,7 @@ export async function registerRoutes(
       if (context !== undefined) updateData.context = context;
 
       const mapping = await storage.updateCommandTemplateMapping(id, updateData);
+      notifyConfigChanged("templates");
       res.json(mapping);
     } catch (err) {
       console.error("Error updating command template mapping:", err);
@@ -1230,6 +1362,7 @@ export async function registerRoutes(
         return res.status(404).json({ message: "Mapping not found" });
       }
 
+      notifyConfigChanged("templates");
       res.json({ message: "Mapping deleted successfully", id });
     } catch (err) {
       console.error("Error deleting command template mapping:", err);
@@ -1295,6 +1428,7 @@ export async function registerRoutes(
         });
       }
 
+      notifyConfigChanged("starboard");
       res.json(config);
     } catch (err) {
       console.error("Error saving starboard config:", err);
@@ -1312,6 +1446,7 @@ export async function registerRoutes(
       if (!success) {
         return res.status(404).json({ message: "Starboard configuration not found" });
       }
+      notifyConfigChanged("starboard");
       res.json({ message: "Starboard configuration deleted" });
     } catch (err) {
       console.error("Error deleting starboard config:", err);
@@ -1373,6 +1508,7 @@ export async function registerRoutes(
         });
       }
 
+      notifyConfigChanged("autoreact");
       res.json(config);
     } catch (err) {
       console.error("Error saving autoreact config:", err);
@@ -1390,6 +1526,7 @@ export async function registerRoutes(
       if (!success) {
         return res.status(404).json({ message: "AutoReact configuration not found" });
       }
+      notifyConfigChanged("autoreact");
       res.json({ message: "AutoReact configuration deleted" });
     } catch (err) {
       console.error("Error deleting autoreact config:", err);
@@ -1397,6 +1534,67 @@ export async function registerRoutes(
     }
   });
 
+  // ============================================
+  // AUTO-RESPONSE TRIGGER ROUTES (Admin only)
+  // ============================================
+
+  app.get("/api/auto-responses", requireAdmin, async (req, res) => {
+    try {
+      res.json(await storage.getAutoResponseTriggers());
+    } catch (err) {
+      console.error("Error fetching auto-response triggers:", err);
+      res.status(500).json({ message: "Failed to fetch auto-response triggers" });
+    }
+  });
+
+  app.post("/api/auto-responses", requireAdmin, async (req, res) => {
+    try {
+      const user = req.user as Express.User;
+      const input = insertAutoResponseTriggerSchema.parse({ ...req.body, createdBy: user.discordId });
+      const trigger = await storage.createAutoResponseTrigger(input);
+      notifyConfigChanged("auto_responses");
+      res.status(201).json(trigger);
+    } catch (err) {
+      if (err instanceof z.ZodError) {
+        return res.status(400).json({ message: err.errors[0].message });
+      }
+      console.error("Error creating auto-response trigger:", err);
+      res.status(500).json({ message: "Failed to create auto-response trigger" });
+    }
+  });
+
+  app.put("/api/auto-responses/:id", requireAdmin, async (req, res) => {
+    try {
+      const input = insertAutoResponseTriggerSchema.omit({ createdBy: true }).partial().parse(req.body);
+      const trigger = await storage.updateAutoResponseTrigger(Number(req.params.id), input);
+      if (!trigger) {
+        return res.status(404).json({ message: "Auto-response trigger not found" });
+      }
+      notifyConfigChanged("auto_responses");
+      res.json(trigger);
+    } catch (err) {
+      if (err instanceof z.ZodError) {
+        return res.status(400).json({ message: err.errors[0].message });
+      }
+      console.error("Error updating auto-response trigger:", err);
+      res.status(500).json({ message: "Failed to update auto-response trigger" });
+    }
+  });
+
+  app.delete("/api/auto-responses/:id", requireAdmin, async (req, res) => {
+    try {
+      const success = await storage.deleteAutoResponseTrigger(Number(req.params.id));
+      if (!success) {
+        return res.status(404).json({ message: "Auto-response trigger not found" });
+      }
+      notifyConfigChanged("auto_responses");
+      res.json({ message: "Auto-response trigger deleted" });
+    } catch (err) {
+      console.error("Error deleting auto-response trigger:", err);
+      res.status(500).json({ message: "Failed to delete auto-response trigger" });
+    }
+  });
+
   // ============================================
   // EMBED VARIABLES REFERENCE (Admin only)
   // ============================================
@@ -1414,7 +1612,8 @@ export async function registerRoutes(
         leveling: [
           { name: "level", description: "User's current level", example: "5" },
           { name: "xp", description: "User's current XP", example: "350" },
-          { name: "xp_needed", description: "XP needed for next level", example: "150" }
+          { name: "xp_needed", description: "XP needed for next level", example: "150" },
+          { name: "rank", description: "User's leaderboard position (rank command)", example: "12" }
         ],
         timestamp: [
           { name: "timestamp", description: "Current date and time", example: "2024-01-09 14:30:00" },
@@ -1,16 +1,17 @@
 import { db } from "./db";
 import {
   logs, warns, lfmConnections, scrobbleHistory, users, botStatus, botConfig, adminUsers, authBypassUsers, searchPresets,
-  embedTemplates, commandTemplateMappings, starboardConfig, autoreactConfig,
+  embedTemplates, commandTemplateMappings, starboardConfig, autoreactConfig, autoResponseTriggers,
   type InsertLog, type Log, type InsertWarn, type Warn,
   type InsertLfmConnection, type LfmConnection, type InsertScrobbleHistory, type ScrobbleHistory,
   type User, type InsertUser,
-  type BotStatus, type BotConfig, type AdminUser, type AuthBypassUser,
+  type BotStatus, type BotConfig, type LogPolicy, type AdminUser, type AuthBypassUser,
   type SearchPreset, type InsertSearchPreset,
   type EmbedTemplate, type InsertEmbedTemplate,
   type CommandTemplateMapping, type InsertCommandTemplateMapping,
   type StarboardConfig, type InsertStarboardConfig,
-  type AutoreactConfig, type InsertAutoreactConfig
+  type AutoreactConfig, type InsertAutoreactConfig,
+  type AutoResponseTrigger, type InsertAutoResponseTrigger
 } from "@shared/schema";
 import { eq, desc, count, sql, and, gte, lte } from "drizzle-orm";
 
@@ -66,6 +67,7 @@ export interface IStorage {
   getLogsStats(): Promise<LogStats>;
   getCategoryStats(): Promise<CategoryStats>;
   createLog(log: InsertLog): Promise<Log>;
+  createLogs(logs: InsertLog[]): Promise<number>;
   deleteLogs(category?: string): Promise<number>;
   deleteLog(id: number): Promise<boolean>;
   bulkDeleteLogs(ids: number[]): Promise<number>;
@@ -92,7 +94,7 @@ export interface IStorage {
   updateBotHeartbeat(status: string, uptime?: string, errorMessage?: string): Promise<BotStatus>;
   // Bot config methods
   getBotConfig(): Promise<BotConfig>;
-  updateBotConfig(config: Partial<{ prefix: string; disabledCommands: string[]; allowedChannels: string[] }>, updatedBy: string): Promise<BotConfig>;
+  updateBotConfig(config: Partial<{ prefix: string; disabledCommands: string[]; allowedChannels: string[]; logPolicy: LogPolicy }>, updatedBy: string): Promise<BotConfig>;
   // Admin methods
   getAdminUsers(): Promise<AdminUser[]>;
   isAdmin(discordId: string): Promise<boolean>;
@@ -133,6 +135,11 @@ export interface IStorage {
   createAutoreactConfig(config: InsertAutoreactConfig): Promise<AutoreactConfig>;
   updateAutoreactConfig(guildId: string, config: Partial<InsertAutoreactConfig>): Promise<AutoreactConfig>;
   deleteAutoreactConfig(guildId: string): Promise<boolean>;
+  // Auto-response trigger methods
+  getAutoResponseTriggers(): Promise<AutoResponseTrigger[]>;
+  createAutoResponseTrigger(trigger: InsertAutoResponseTrigger): Promise<AutoResponseTrigger>;
+  updateAutoResponseTrigger(id: number, trigger: Partial<InsertAutoResponseTrigger>): Promise<AutoResponseTrigger | undefined>;
+  deleteAutoResponseTrigger(id: number): Promise<boolean>;
 }
 
 export class DatabaseStorage implements IStorage {
@@ -269,6 +276,12 @@ export class DatabaseStorage implements IStorage {
     return created;
   }
 
+  async createLogs(insertLogs: InsertLog[]): Promise<number> {
+    if (insertLogs.length === 0) return 0;
+    const created = await db.insert(logs).values(insertLogs).returning({ id: logs.id });
+    return created.length;
+  }
+
   async deleteLogs(category?: string): Promise<number> {
     let deleteQuery = db.delete(logs);
 
@@ -468,7 +481,7 @@ export class DatabaseStorage implements IStorage {
   }
 
   async updateBotConfig(
-    config: Partial<{ prefix: string; disabledCommands: string[]; allowedChannels: string[] }>,
+    config: Partial<{ prefix: string; disabledCommands: string[]; allowedChannels: string[]; logPolicy: LogPolicy }>,
     updatedBy: string
   ): Promise<BotConfig> {
     const existing = await this.getBotConfig();
@@ -888,6 +901,30 @@ export class DatabaseStorage implements IStorage {
     const result = await db.delete(autoreactConfig).where(eq(autoreactConfig.guildId, guildId)).returning({ id: autoreactConfig.id });
     return result.length > 0;
   }
+
+  // Auto-response trigger methods
+  async getAutoResponseTriggers(): Promise<AutoResponseTrigger[]> {
+    return await db.select().from(autoResponseTriggers).orderBy(autoResponseTriggers.id);
+  }
+
+  async createAutoResponseTrigger(trigger: InsertAutoResponseTrigger): Promise<AutoResponseTrigger> {
+    const [created] = await db.insert(autoResponseTriggers).values(trigger).returning();
+    return created;
+  }
+
+  async updateAutoResponseTrigger(id: number, trigger: Partial<InsertAutoResponseTrigger>): Promise<AutoResponseTrigger | undefined> {
+    const [updated] = await db
+      .update(autoResponseTriggers)
+      .set({ ...trigger, updatedAt: new Date() })
+      .where(eq(autoResponseTriggers.id, id))
+      .returning();
+    return updated;
+  }
+
+  async deleteAutoResponseTrigger(id: number): Promise<boolean> {
+    const result = await db.delete(autoResponseTriggers).where(eq(autoResponseTriggers.id, id)).returning({ id: autoResponseTriggers.id });
+    return result.length > 0;
+  }
 }
 
 export const storage = new DatabaseStorage();
@@ -1,6 +1,9 @@
 import os
-import aiohttp
 from config.settings import config
+from services.http_session import http_session
+
+# Chat completions can take far longer than the pooled session default
+AI_REQUEST_TIMEOUT = 60
 
 class OpenAIProvider:
     """Service for OpenAI API interactions"""
@@ -27,29 +30,29 @@ class OpenAIProvider:
         if system_prompt is None:
             system_prompt = "You are ChatGPT, a helpful AI assistant that was made by lumiin."
 
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                "Authorization": f"Bearer {openai_key}",
-                "Content-Type": "application/json"
-            }
-            payload = {
-                "model": "gpt-4o-mini",
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": question}
-                ],
-                "temperature": 0.7
-            }
-
-            async with session.post(
-                "https://api.openai.com/v1/chat/completions",
-                json=payload,
-                headers=headers
-            ) as resp:
-                if resp.status != 200:
-                    error_text = await resp.text()
-                    raise Exception(f"OpenAI API error {resp.status}: {error_text}")
-                return await resp.json()
+        headers = {
+            "Authorization": f"Bearer {openai_key}",
+            "Content-Type": "application/json"
+        }
+        payload = {
+            "model": "gpt-4o-mini",
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": question}
+            ],
+            "temperature": 0.7
+        }
+
+        async with http_session.post(
+            "https://api.openai.com/v1/chat/completions",
+            json=payload,
+            headers=headers,
+            timeout=AI_REQUEST_TIMEOUT
+        ) as resp:
+            if resp.status != 200:
+                error_text = await resp.text()
+                raise Exception(f"OpenAI API error {resp.status}: {error_text}")
+            return await resp.json()
 
     @staticmethod
     def get_answer(response_data: dict) -> str:
@@ -81,28 +84,28 @@ class GrokProvider:
         if not grok_key:
             raise ValueError("Grok API key not configured")
 
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                "Authorization": f"Bearer {grok_key}",
-                "Content-Type": "application/json"
-            }
-            payload = {
-                "model": "grok-4-1-fast",
-                "messages": [
-                    {"role": "user", "content": question}
-                ],
-                "temperature": 0.8
-            }
-
-            async with session.post(
-                "https://api.x.ai/v1/chat/completions",
-                json=payload,
-                headers=headers
-            ) as resp:
-                if resp.status != 200:
-                    error_text = await resp.text()
-                    raise Exception(f"Grok API error {resp.status}: {error_text}")
-                return await resp.json()
+        headers = {
+            "Authorization": f"Bearer {grok_key}",
+            "Content-Type": "application/json"
+        }
+        payload = {
+            "model": "grok-4-1-fast",
+            "messages": [
+                {"role": "user", "content": question}
+            ],
+            "temperature": 0.8
+        }
+
+        async with http_session.post(
+            "https://api.x.ai/v1/chat/completions",
+            json=payload,
+            headers=headers,
+            timeout=AI_REQUEST_TIMEOUT
+        ) as resp:
+            if resp.status != 200:
+                error_text = await resp.text()
+                raise Exception(f"Grok API error {resp.status}: {error_text}")
+            return await resp.json()
 
     @staticmethod
     def get_answer(response_data: dict) -> str:
@@ -139,15 +142,14 @@ class TranslateProvider:
             "q": text
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                "https://translate.googleapis.com/translate_a/single",
-                params=params
-            ) as resp:
-                if resp.status != 200:
-                    error_text = await resp.text()
-                    raise Exception(f"Translation API error {resp.status}: {error_text}")
-                data = await resp.json()
+        async with http_session.get(
+            "https://translate.googleapis.com/translate_a/single",
+            params=params
+        ) as resp:
+            if resp.status != 200:
+                error_text = await resp.text()
+                raise Exception(f"Translation API error {resp.status}: {error_text}")
+            data = await resp.json()
 
         # Extract translated text from response
         translated = "".join([sentence[0] for sentence in data[0] if sentence[0]])
@@ -0,0 +1,195 @@
+import asyncio
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+import discord
+from config.constants import AVATAR_MEMORY_MAX_BYTES, AVATAR_CACHE_DIR, AVATAR_DISK_MAX_BYTES
+from services.http_session import http_session
+from utils.metrics import metrics, record_cache
+
+AVATAR_FETCHES = metrics.counter("bot_avatar_fetches_total", "Avatar CDN downloads by outcome", ("result",))
+AVATAR_MEMORY_BYTES = metrics.gauge("bot_avatar_cache_bytes", "Bytes held by the in-memory avatar cache")
+
+User = Union[discord.User, discord.Member]
+
+class AvatarService:
+    """
+    Content-addressed avatar cache with a memory and a disk tier
+
+    Avatars are keyed by (user_id, avatar hash, size): a new avatar has a new
+    hash, so entries never need invalidating. Downloads ask the CDN for
+    exactly the size a renderer draws, as PNG. Lookups go memory LRU (bounded
+    by a byte budget) -> files under AVATAR_CACHE_DIR (bounded too, oldest
+    dropped first) -> CDN, and concurrent lookups of one avatar share a
+    single download.
+
+    Entries are the encoded PNG bytes rather than decoded bitmaps: renderers
+    run in the render process pool, which takes plain bytes, and an avatar
+    at its target size decodes in well under a millisecond there.
+    """
+
+    def __init__(self, max_bytes: int = AVATAR_MEMORY_MAX_BYTES, directory: str = AVATAR_CACHE_DIR,
+                 disk_max_bytes: int = AVATAR_DISK_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.disk_max_bytes = disk_max_bytes
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Disk usage, scanned on the first write; only touched from worker threads under _disk_lock
+        self._disk_files: Optional["OrderedDict[str, int]"] = None
+        self._disk_bytes = 0
+        self._disk_lock = threading.Lock()
+
+    @staticmethod
+    def cache_key(user: User, size: int) -> str:
+        # Default avatars have no hash; their asset key is the default avatar index
+        return f"{user.id}-{user.display_avatar.key}-{size}"
+
+    async def fetch(self, user: User, size: int) -> Optional[bytes]:
+        """
+        Get a user's avatar at the given size
+
+        Args:
+            user: Discord user or member (their display avatar is used)
+            size: Edge length in pixels, a power of two between 16 and 4096
+
+        Returns:
+            PNG bytes, or None if the CDN could not serve the avatar
+        """
+        key = self.cache_key(user, size)
+
+        data = self._memory.get(key)
+        if data is not None:
+            self._memory.move_to_end(key)
+            record_cache("avatar", True)
+            return data
+
+        task = self._inflight.get(key)
+        if task is not None:
+            record_cache("avatar", True, "coalesced")
+        else:
+            url = str(user.display_avatar.with_format("png").with_size(size).url)
+            task = asyncio.create_task(self._load(key, url))
+            self._inflight[key] = task
+
+        # Shielded so a cancelled caller doesn't cancel the download other callers wait on
+        return await asyncio.shield(task)
+
+    async def fetch_many(self, users: Iterable[User], size: int) -> List[Optional[bytes]]:
+        """
+        Get several avatars concurrently
+
+        Args:
+            users: Users whose avatars to fetch
+            size: Edge length in pixels
+
+        Returns:
+            Avatar bytes (or None) in the same order as users
+        """
+        return list(await asyncio.gather(*(self.fetch(user, size) for user in users)))
+
+    async def _load(self, key: str, url: str) -> Optional[bytes]:
+        try:
+            data = await asyncio.to_thread(self._read_disk, key)
+            if data is not None:
+                record_cache("avatar", True, "disk_hit")
+            else:
+                record_cache("avatar", False)
+                data = await self._download(url)
+                if data is None:
+                    return None
+                try:
+                    await asyncio.to_thread(self._write_disk, key, data)
+                except OSError as e:
+                    print(f"[AvatarService] Could not write avatar to disk cache: {e}")
+            self._remember(key, data)
+            return data
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _download(self, url: str) -> Optional[bytes]:
+        try:
+            data = await http_session.fetch_bytes(url, timeout=10)
+        except Exception as e:
+            AVATAR_FETCHES.inc(result="error")
+            print(f"[AvatarService] Error downloading avatar: {e}")
+            return None
+        AVATAR_FETCHES.inc(result="ok" if data else "error")
+        return data or None
+
+    def _remember(self, key: str, data: bytes):
+        if len(data) > self.max_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        self._memory[key] = data
+        self._memory_bytes += len(data)
+        while self._memory_bytes > self.max_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+        AVATAR_MEMORY_BYTES.set(self._memory_bytes)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.png")
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        with self._disk_lock:
+            if self._disk_files is not None and key in self._disk_files:
+                self._disk_files.move_to_end(key)
+        try:
+            # mtime doubles as the last-use time when the directory is rescanned after a restart
+            os.utime(path)
+        except OSError:
+            pass
+        return data or None
+
+    def _scan_disk(self) -> "OrderedDict[str, int]":
+        entries: List[Tuple[float, str, int]] = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith(".png"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.name[:-4], stat.st_size))
+        entries.sort()
+        return OrderedDict((key, size) for _, key, size in entries)
+
+    def _write_disk(self, key: str, data: bytes):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        with self._disk_lock:
+            if self._disk_files is None:
+                self._disk_files = self._scan_disk()
+                self._disk_bytes = sum(self._disk_files.values())
+            files = self._disk_files
+            self._disk_bytes += len(data) - files.pop(key, 0)
+            files[key] = len(data)
+            while self._disk_bytes > self.disk_max_bytes and len(files) > 1:
+                old_key, old_size = files.popitem(last=False)
+                self._disk_bytes -= old_size
+                try:
+                    os.remove(self._path(old_key))
+                except OSError:
+                    pass
+
+    def clear_memory(self):
+        """Drop the in-memory tier (the disk tier is kept)"""
+        self._memory.clear()
+        self._memory_bytes = 0
+        AVATAR_MEMORY_BYTES.set(0)
+
+# Global instance
+avatar_service = AvatarService()
@@ -0,0 +1,176 @@
+import asyncio
+import json
+import time
+from typing import Awaitable, Callable, List, Optional
+import aiohttp
+from config.settings import config
+from config.constants import CONFIG_STREAM_READ_TIMEOUT, CONFIG_STREAM_MAX_BACKOFF
+from services.http_session import http_session
+from utils.logging import BotLogger, LogPolicy
+from utils.metrics import metrics
+
+CONFIG_FETCHES = metrics.counter("bot_config_fetches_total", "Dashboard config fetches by result", ("result",))
+CONFIG_STREAM_CONNECTED = metrics.gauge("bot_config_stream_connected", "1 while the config push stream is connected")
+
+class ConfigSync:
+    """
+    Keeps the bot's config in step with the dashboard
+
+    Fetches are conditional: the last ETag is sent as If-None-Match and an
+    unchanged config comes back as an empty 304. When push is enabled, a
+    server-sent events stream triggers a fetch as soon as the dashboard saves
+    a change; the periodic poll stays on as a fallback. Listeners added with
+    add_listener() hear about every pushed change (with its reason), for data
+    that lives outside /bot/config such as embed templates.
+    """
+
+    def __init__(self, url: str = None, stream_url: str = None):
+        self.url = url or config.CONFIG_URL
+        self.stream_url = stream_url or config.CONFIG_STREAM_URL
+        self.etag: Optional[str] = None
+        self.last_updated: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self._stream_task: Optional[asyncio.Task] = None
+        self._listeners: List[Callable[[str], Awaitable[None]]] = []
+
+    def add_listener(self, listener: Callable[[str], Awaitable[None]]):
+        """Call listener(reason) on every pushed change, after the config fetch"""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[str], Awaitable[None]]):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def apply(self, data: dict):
+        """Apply a full config payload from the dashboard (raises ValueError, changing nothing, if it is invalid)"""
+        # Validated before anything is applied, so a bad policy doesn't leave half a config in place
+        policy = LogPolicy.from_config(data.get("logPolicy"))
+        config.update_config(data)
+        BotLogger.set_policy(policy)
+        self.last_updated = time.time()
+
+    async def fetch(self, force: bool = False) -> bool:
+        """
+        Fetch the config if it changed since the last fetch
+
+        Args:
+            force: Skip the If-None-Match header and always download the body
+
+        Returns:
+            True if a new config was applied
+        """
+        # Concurrent triggers (poll + push) collapse into one request
+        async with self._lock:
+            headers = config.get_api_headers()
+            if self.etag and not force:
+                headers["If-None-Match"] = self.etag
+
+            try:
+                async with http_session.get(self.url, headers=headers) as response:
+                    if response.status == 304:
+                        CONFIG_FETCHES.inc(result="not_modified")
+                        return False
+                    if response.status != 200:
+                        CONFIG_FETCHES.inc(result="error")
+                        print(f"Config fetch failed: HTTP {response.status}")
+                        return False
+
+                    data = await response.json()
+                    etag = response.headers.get("ETag")
+            except Exception as e:
+                CONFIG_FETCHES.inc(result="error")
+                print(f"Config fetch error: {e}")
+                return False
+
+            if not isinstance(data, dict):
+                CONFIG_FETCHES.inc(result="error")
+                print("Config fetch failed: unexpected format")
+                return False
+
+            try:
+                self.apply(data)
+            except Exception as e:
+                # The previous config (and its indexes) stays active; the ETag isn't advanced so it is retried
+                CONFIG_FETCHES.inc(result="invalid")
+                print(f"Config apply failed, keeping the previous config: {e}")
+                return False
+            self.etag = etag
+            CONFIG_FETCHES.inc(result="updated")
+            print(f"Config updated: prefix={config.prefix}, disabled={config.disabled_commands}")
+            return True
+
+    def start_stream(self):
+        """Start listening for pushed config changes (no-op if push is disabled)"""
+        if not config.CONFIG_PUSH_ENABLED or self._stream_task is not None:
+            return
+        self._stream_task = asyncio.create_task(self._listen())
+
+    def stop_stream(self):
+        if self._stream_task is not None:
+            self._stream_task.cancel()
+            self._stream_task = None
+        CONFIG_STREAM_CONNECTED.set(0)
+
+    async def _listen(self):
+        backoff = 1
+        while True:
+            try:
+                await self._consume_stream()
+                backoff = 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Config stream error: {e}, reconnecting in {backoff}s")
+            finally:
+                CONFIG_STREAM_CONNECTED.set(0)
+
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, CONFIG_STREAM_MAX_BACKOFF)
+
+    async def _consume_stream(self):
+        session = await http_session.get_session()
+        headers = config.get_api_headers()
+        headers["Accept"] = "text/event-stream"
+        # No total timeout: the stream stays open, and keep-alives bound each read
+        timeout = aiohttp.ClientTimeout(total=None, sock_read=CONFIG_STREAM_READ_TIMEOUT)
+
+        async with session.get(self.stream_url, headers=headers, timeout=timeout) as response:
+            if response.status != 200:
+                raise RuntimeError(f"HTTP {response.status}")
+            CONFIG_STREAM_CONNECTED.set(1)
+
+            event, data_lines = None, []
+            async for raw_line in response.content:
+                line = raw_line.decode("utf-8").rstrip("\r\n")
+                if not line:
+                    # Blank line ends an event
+                    if event == "config":
+                        await self._on_change("\n".join(data_lines))
+                    event, data_lines = None, []
+                elif line.startswith(":"):
+                    continue
+                elif line.startswith("event:"):
+                    event = line[6:].strip()
+                elif line.startswith("data:"):
+                    data_lines.append(line[5:].strip())
+
+    async def _on_change(self, payload: str):
+        try:
+            change = json.loads(payload) if payload else {}
+        except ValueError:
+            change = {}
+
+        reason = change.get("reason", "unknown")
+        # Always a conditional fetch, so a reconnect with nothing new costs one 304
+        if await self.fetch() and reason != "connected":
+            await BotLogger.log(f"Config change pushed from dashboard ({reason})", "info", "system")
+
+        for listener in list(self._listeners):
+            try:
+                await listener(reason)
+            except Exception as e:
+                print(f"Config change listener error: {e}")
+
+# Global instance
+config_sync = ConfigSync()
@@ -0,0 +1,108 @@
+import aiohttp
+import time
+from contextlib import asynccontextmanager
+from typing import Optional
+from yarl import URL
+from config.constants import (
+    HTTP_POOL_LIMIT,
+    HTTP_POOL_LIMIT_PER_HOST,
+    HTTP_DNS_CACHE_TTL,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_DEFAULT_TIMEOUT
+)
+from utils.metrics import HTTP_LATENCY
+
+class HTTPSessionManager:
+    """Bot-lifetime pooled aiohttp session shared by every outbound caller"""
+
+    def __init__(
+        self,
+        limit: int = HTTP_POOL_LIMIT,
+        limit_per_host: int = HTTP_POOL_LIMIT_PER_HOST,
+        dns_cache_ttl: int = HTTP_DNS_CACHE_TTL,
+        keepalive_timeout: float = HTTP_KEEPALIVE_TIMEOUT,
+        default_timeout: float = HTTP_DEFAULT_TIMEOUT
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.default_timeout = default_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._session is not None and not self._session.closed
+
+    async def start(self):
+        """Open the pooled session (called from DiscordBot.setup_hook)"""
+        if self.is_open:
+            return
+
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            use_dns_cache=True,
+            ttl_dns_cache=self.dns_cache_ttl,
+            keepalive_timeout=self.keepalive_timeout
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.default_timeout)
+        )
+
+    async def close(self):
+        """Close the pooled session and release all kept-alive connections"""
+        if self.is_open:
+            await self._session.close()
+        self._session = None
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared session, opening it on first use
+
+        Lazy opening keeps scripts and cogs usable outside of the bot lifecycle.
+        """
+        if not self.is_open:
+            await self.start()
+        return self._session
+
+    @asynccontextmanager
+    async def request(self, method: str, url: str, *, timeout: Optional[float] = None, **kwargs):
+        """
+        Perform a request on the shared session
+
+        Args:
+            method: HTTP method
+            url: Target URL
+            timeout: Total timeout in seconds for this call (defaults to the session timeout)
+            **kwargs: Passed through to aiohttp (params, json, headers, data, ...)
+
+        Yields:
+            aiohttp.ClientResponse
+        """
+        session = await self.get_session()
+        if timeout is not None:
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+
+        # Latency is measured to response headers, not to whenever the caller finishes reading
+        start = time.perf_counter()
+        async with session.request(method, url, **kwargs) as response:
+            HTTP_LATENCY.observe(time.perf_counter() - start, host=URL(str(url)).host or "unknown", method=method.upper())
+            yield response
+
+    def get(self, url: str, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    async def fetch_bytes(self, url: str, timeout: Optional[float] = None) -> Optional[bytes]:
+        """Download a URL and return its body, or None on a non-200 response"""
+        async with self.get(url, timeout=timeout) as resp:
+            if resp.status != 200:
+                return None
+            return await resp.read()
+
+# Global instance
+http_session = HTTPSessionManager()
@@ -0,0 +1,118 @@
+"""
+Output encoding stage shared by the renderers (runs inside the render pool).
+
+Each renderer's output goes through encode() with its profile from
+RENDER_OUTPUT_PROFILES: photographic cards become WebP, flat cards a
+palette-quantized PNG, animations an optimized GIF. Settings step down
+until the result fits the profile's byte budget (the smallest attempt is
+kept if none does). The format, encode time and size of the last encode in
+this thread are left for take_stats(), which the render service reports
+from the bot process.
+"""
+
+import io
+import threading
+import time
+from typing import NamedTuple, Optional
+from PIL import Image, ImageSequence
+from config.constants import RENDER_OUTPUT_PROFILES, RENDER_BYTE_BUDGETS
+
+# Settings tried in order until the output fits its budget
+WEBP_QUALITY_STEPS = (82, 70, 55, 40)
+PNG_COLOR_STEPS = (256, 128, 64)
+
+class EncodeStats(NamedTuple):
+    format: str
+    seconds: float
+    size: int
+    over_budget: bool
+
+_local = threading.local()
+
+def take_stats() -> Optional[EncodeStats]:
+    """Stats of the last encode in this thread (cleared once read)"""
+    stats = getattr(_local, "stats", None)
+    _local.stats = None
+    return stats
+
+def _save(img: Image.Image, fmt: str, **params) -> bytes:
+    buffer = io.BytesIO()
+    img.save(buffer, format=fmt, **params)
+    return buffer.getvalue()
+
+def _webp(img: Image.Image, budget: int) -> bytes:
+    if img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+    smallest = None
+    for quality in WEBP_QUALITY_STEPS:
+        data = _save(img, "WEBP", quality=quality, method=2)
+        if smallest is None or len(data) < len(smallest):
+            smallest = data
+        if len(data) <= budget:
+            break
+    return smallest
+
+def _palette_png(img: Image.Image, budget: int) -> bytes:
+    if img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+    # Median cut keeps smooth gradients intact but only takes RGB; fast octree handles alpha
+    method = Image.Quantize.MEDIANCUT if img.mode == "RGB" else Image.Quantize.FASTOCTREE
+    smallest = None
+    for colors in PNG_COLOR_STEPS:
+        quantized = img.quantize(colors=colors, method=method)
+        data = _save(quantized, "PNG")
+        if smallest is None or len(data) < len(smallest):
+            smallest = data
+        if len(data) <= budget:
+            break
+    return smallest
+
+def _optimized_gif(data: bytes) -> bytes:
+    """Re-save an animated GIF with optimized palettes and frame deltas; the original wins if smaller"""
+    with Image.open(io.BytesIO(data)) as animation:
+        frames = [frame.copy() for frame in ImageSequence.Iterator(animation)]
+        info = animation.info
+        durations = []
+        for index in range(len(frames)):
+            animation.seek(index)
+            durations.append(animation.info.get("duration", info.get("duration", 20)))
+    if len(frames) < 2:
+        return data
+
+    params = {
+        "save_all": True,
+        "append_images": frames[1:],
+        "duration": durations,
+        "loop": info.get("loop", 0),
+        "disposal": 2,
+        "optimize": True,
+    }
+    if "transparency" in info:
+        params["transparency"] = info["transparency"]
+    optimized = _save(frames[0], "GIF", **params)
+    return optimized if len(optimized) < len(data) else data
+
+def encode(image, renderer: str) -> bytes:
+    """
+    Encode a renderer's output with its profile
+
+    Args:
+        image: A PIL image, or already-encoded GIF bytes for "animation" renderers
+        renderer: Renderer name (selects the profile in RENDER_OUTPUT_PROFILES)
+
+    Returns:
+        Encoded image bytes
+    """
+    profile = RENDER_OUTPUT_PROFILES.get(renderer, "flat")
+    budget = RENDER_BYTE_BUDGETS[profile]
+    start = time.perf_counter()
+
+    if profile == "animation":
+        data, fmt = _optimized_gif(image), "gif"
+    elif profile == "photo":
+        data, fmt = _webp(image, budget), "webp"
+    else:
+        data, fmt = _palette_png(image, budget), "png"
+
+    _local.stats = EncodeStats(fmt, time.perf_counter() - start, len(data), len(data) > budget)
+    return data
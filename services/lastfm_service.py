@@ -7,6 +7,7 @@ import pylast
 from typing import List, Dict, Optional
 from datetime import datetime
 from config.settings import config
+from services.sdk_executor import lastfm_executor
 
 
 class LastFmService:
@@ -58,7 +59,8 @@ class LastFmService:
             network = self._get_user_network(session_key)
 
             # Update now playing
-            network.update_now_playing(
+            await lastfm_executor.run(
+                network.update_now_playing,
                 artist=artist,
                 title=track,
                 album=album,
@@ -98,7 +100,8 @@ class LastFmService:
             network = self._get_user_network(session_key)
 
             # Scrobble the track
-            network.scrobble(
+            await lastfm_executor.run(
+                network.scrobble,
                 artist=artist,
                 title=track,
                 timestamp=timestamp,
@@ -162,5 +165,16 @@ class LastFmService:
         return results
 
 
-# Global instance
-lastfm_service = LastFmService()
+_lastfm_service: Optional[LastFmService] = None
+
+def get_lastfm_service() -> Optional[LastFmService]:
+    """
+    Get the shared Last.fm service, creating it on first use
+
+    Returns:
+        The service, or None if Last.fm credentials are not configured
+    """
+    global _lastfm_service
+    if _lastfm_service is None and config.LASTFM_API_KEY and config.LASTFM_API_SECRET:
+        _lastfm_service = LastFmService()
+    return _lastfm_service
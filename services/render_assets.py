@@ -0,0 +1,102 @@
+"""
+Process-wide imaging assets shared by the renderers.
+
+Fonts, circle masks, borders and static backgrounds are built once per
+render worker and reused by every job it runs, so a render only pays for
+the parts that depend on its inputs. Cached images are shared: renderers
+must copy() before drawing on one and otherwise only read them (as paste
+sources or masks).
+"""
+
+from functools import lru_cache
+from typing import Optional, Tuple
+from PIL import Image, ImageDraw, ImageFont
+
+Color = Tuple[int, ...]
+
+# Font fallback chains, tried in order; Pillow's built-in font is the last resort
+SERIF_FONTS = ("/usr/share/fonts/truetype/dejavu/DejaVuSerif.ttf", "arial.ttf")
+MEME_FONTS = ("impact.ttf", "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf")
+BOLD_FONTS = ("fonts/Roboto-Bold.ttf", "arial.ttf")
+REGULAR_FONTS = ("fonts/Roboto-Regular.ttf", "arial.ttf")
+
+# (chain, size) pairs loaded when a worker starts
+PRELOAD_FONTS = (
+    (SERIF_FONTS, 56), (SERIF_FONTS, 32),
+    (BOLD_FONTS, 55), (REGULAR_FONTS, 35),
+)
+
+@lru_cache(maxsize=None)
+def _resolve_font_path(chain: Tuple[str, ...]) -> Optional[str]:
+    """First loadable font file of a chain (None: use the default font), resolved once per chain"""
+    for path in chain:
+        try:
+            ImageFont.truetype(path, 12)
+            return path
+        except OSError:
+            continue
+    print(f"Warning: none of the fonts {chain} could be loaded, using the default font")
+    return None
+
+@lru_cache(maxsize=128)
+def font(chain: Tuple[str, ...], size: int) -> ImageFont.ImageFont:
+    """
+    Loaded font for a fallback chain at a size
+
+    Args:
+        chain: Font paths to try in order (e.g. SERIF_FONTS)
+        size: Point size
+
+    Returns:
+        The font, loaded from disk only the first time (chain, size) is used
+    """
+    path = _resolve_font_path(chain)
+    if path is None:
+        return ImageFont.load_default()
+    return ImageFont.truetype(path, size)
+
+@lru_cache(maxsize=32)
+def circle_mask(size: int) -> Image.Image:
+    """Size x size "L" mask with a filled circle"""
+    mask = Image.new("L", (size, size), 0)
+    ImageDraw.Draw(mask).ellipse((0, 0, size, size), fill=255)
+    return mask
+
+@lru_cache(maxsize=32)
+def circle_border(size: int, width: int, color: Color = (255, 255, 255, 255)) -> Image.Image:
+    """Filled RGBA disc framing a size x size avatar with a border of width pixels on each side"""
+    outer = size + width * 2
+    border = Image.new("RGBA", (outer, outer), (0, 0, 0, 0))
+    ImageDraw.Draw(border).ellipse((0, 0, outer - 1, outer - 1), fill=color)
+    return border
+
+@lru_cache(maxsize=16)
+def vertical_gradient(size: Tuple[int, int], top: Color, bottom: Color) -> Image.Image:
+    """
+    RGB image fading from top to bottom
+
+    Built from Image.linear_gradient (a 256-step ramp) stretched to the
+    height and used as a composite mask, so no per-row Python drawing.
+    """
+    width, height = size
+    ramp = Image.linear_gradient("L").resize((width, height), Image.BILINEAR)
+    return Image.composite(Image.new("RGB", size, bottom), Image.new("RGB", size, top), ramp)
+
+@lru_cache(maxsize=None)
+def quote_background() -> Image.Image:
+    """1200x500 dark card with the rounded panel the quote is written on"""
+    img = Image.new("RGB", (1200, 500), color=(20, 20, 20))
+    ImageDraw.Draw(img).rounded_rectangle((20, 20, 1180, 480), radius=30, fill=(40, 40, 40))
+    return img
+
+@lru_cache(maxsize=None)
+def welcome_background() -> Image.Image:
+    """800x250 deep purple to violet-slate gradient behind welcome cards"""
+    return vertical_gradient((800, 250), (25, 20, 45), (45, 30, 85))
+
+def preload():
+    """Build the fixed assets up front (render pool worker initializer)"""
+    for chain, size in PRELOAD_FONTS:
+        font(chain, size)
+    quote_background()
+    welcome_background()
@@ -0,0 +1,94 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+from config.constants import RENDERER_VERSIONS, RENDER_CACHE_TTL, RENDER_CACHE_MAX_BYTES
+from utils.metrics import metrics, record_cache
+
+RENDER_CACHE_BYTES = metrics.gauge("bot_render_cache_bytes", "Bytes held by the rendered-output cache")
+RENDER_CACHE_EVICTIONS = metrics.counter("bot_render_cache_evictions_total", "Rendered images dropped from the cache", ("reason",))
+
+class _Entry(NamedTuple):
+    data: bytes
+    expires: float
+
+class RenderCache:
+    """
+    Content-addressed cache of encoded render output
+
+    Keys are a hash of (renderer, renderer version, parameters); image
+    parameters enter the key through their own digest, so the same avatar
+    or template bytes give the same key no matter where they came from.
+    Entries live for ttl seconds and the least recently used are dropped once
+    the stored images exceed max_bytes. Lookups are counted under the
+    "render" cache in the hit-ratio metrics.
+    """
+
+    def __init__(self, ttl: float = RENDER_CACHE_TTL, max_bytes: int = RENDER_CACHE_MAX_BYTES):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.cache: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+
+    @staticmethod
+    def make_key(renderer: str, args: tuple, kwargs: dict) -> Optional[str]:
+        """
+        Cache key for a render job
+
+        Args:
+            renderer: Renderer name
+            args, kwargs: Renderer parameters
+
+        Returns:
+            Hex digest, or None if the renderer's output must not be cached
+        """
+        version = RENDERER_VERSIONS.get(renderer)
+        if version is None:
+            return None
+
+        digest = hashlib.blake2b(f"{renderer}:{version}".encode(), digest_size=20)
+        for value in (*args, *sorted(kwargs.items())):
+            if isinstance(value, (bytes, bytearray)):
+                digest.update(b"\x00b" + hashlib.blake2b(value, digest_size=20).digest())
+            else:
+                digest.update(b"\x00r" + repr(value).encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Cached output for a key, or None (counted as a hit or miss)"""
+        entry = self.cache.get(key)
+        if entry is not None:
+            if time.monotonic() < entry.expires:
+                self.cache.move_to_end(key)
+                record_cache("render", True)
+                return entry.data
+            self._drop(key, "expired")
+        record_cache("render", False)
+        return None
+
+    def put(self, key: str, data: bytes):
+        """Store render output, evicting the least recently used entries past the byte budget"""
+        if len(data) > self.max_bytes:
+            return
+        if key in self.cache:
+            self._drop(key, None)
+        self.cache[key] = _Entry(data, time.monotonic() + self.ttl)
+        self._bytes += len(data)
+        while self._bytes > self.max_bytes:
+            self._drop(next(iter(self.cache)), "size")
+        RENDER_CACHE_BYTES.set(self._bytes)
+
+    def _drop(self, key: str, reason: Optional[str]):
+        entry = self.cache.pop(key)
+        self._bytes -= len(entry.data)
+        if reason:
+            RENDER_CACHE_EVICTIONS.inc(reason=reason)
+        RENDER_CACHE_BYTES.set(self._bytes)
+
+    def clear(self):
+        self.cache.clear()
+        self._bytes = 0
+        RENDER_CACHE_BYTES.set(0)
+
+# Global instance
+render_cache = RenderCache()
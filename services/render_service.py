@@ -0,0 +1,210 @@
+import asyncio
+import io
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional, Tuple, Union
+from config.constants import RENDER_MAX_WORKERS, RENDER_JOB_TIMEOUT
+from services.render_cache import render_cache
+from utils.metrics import metrics
+
+RENDER_JOBS = metrics.counter("bot_render_jobs_total", "Render jobs by renderer and outcome", ("renderer", "status"))
+RENDER_SECONDS = metrics.histogram("bot_render_seconds", "Render job time including queueing", ("renderer",))
+RENDER_QUEUE_DEPTH = metrics.gauge("bot_render_queue_depth", "Render jobs waiting for a free worker")
+RENDER_IN_FLIGHT = metrics.gauge("bot_render_in_flight", "Render jobs currently running in the pool")
+RENDER_ENCODE_SECONDS = metrics.histogram("bot_render_encode_seconds", "Time spent encoding render output", ("renderer", "format"))
+RENDER_OUTPUT_BYTES = metrics.histogram(
+    "bot_render_output_bytes", "Encoded render output size", ("renderer", "format"),
+    buckets=(4096, 16384, 65536, 131072, 262144, 524288, 1048576, 2097152, 4194304, 8388608)
+)
+RENDER_OVER_BUDGET = metrics.counter("bot_render_over_budget_total", "Render outputs larger than their byte budget", ("renderer",))
+
+# Magic bytes -> file extension for the formats the encoder produces
+_IMAGE_SIGNATURES = ((b"\x89PNG", "png"), (b"GIF8", "gif"), (b"\xff\xd8", "jpg"))
+
+def image_filename(stem: str, image: Union[bytes, io.BytesIO]) -> str:
+    """
+    Attachment file name with the extension of the encoded image
+
+    Args:
+        stem: File name without extension (e.g. "quote")
+        image: Encoded image bytes, or a buffer holding them
+
+    Returns:
+        e.g. "quote.webp"
+    """
+    header = bytes(image.getbuffer()[:12]) if isinstance(image, io.BytesIO) else bytes(image[:12])
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return f"{stem}.webp"
+    for signature, extension in _IMAGE_SIGNATURES:
+        if header.startswith(signature):
+            return f"{stem}.{extension}"
+    return f"{stem}.png"
+
+def _run_job(renderer: str, args: tuple, kwargs: dict) -> Tuple[bytes, Optional[tuple]]:
+    # Pillow is imported inside the workers (and the thread fallback), never at bot startup
+    from services import image_encoder, renderers
+    image_bytes = renderers.run_job(renderer, args, kwargs)
+    # Encode stats travel back with the image: worker processes have their own metrics registry
+    stats = image_encoder.take_stats()
+    return image_bytes, tuple(stats) if stats is not None else None
+
+def _init_worker():
+    # Load fonts and build static backgrounds once per worker, before its first job
+    from services import render_assets
+    render_assets.preload()
+
+class RenderTimeout(Exception):
+    """Raised when a render job exceeds its timeout"""
+
+class RenderService:
+    """
+    Runs Pillow renderers in a process pool so image commands never block the event loop
+
+    Jobs are submitted as plain data and return encoded image bytes. At most
+    max_workers jobs run at once; the rest wait on a semaphore and are
+    counted in the queue-depth gauge. A job holds its permit until the worker
+    is actually done with it: a timed-out or abandoned job keeps running in
+    the pool, so its permit only returns when it finishes. If the pool breaks
+    it is shut down and rebuilt, and the job is retried once in a thread so
+    the caller still gets its image.
+
+    Every renderer's output goes through services.image_encoder; the format,
+    encode time and size it reports are recorded here, since workers can't
+    update the bot's metrics. Output of deterministic renderers is kept in
+    render_cache, so a job with the same parameters returns the stored bytes
+    without touching the pool.
+    """
+
+    def __init__(self, max_workers: int = RENDER_MAX_WORKERS, timeout: float = RENDER_JOB_TIMEOUT):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def start(self):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+        if self._pool is None:
+            # spawn avoids forking a process that already runs gateway and watchdog threads
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker
+            )
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _replace_broken_pool(self, pool: Optional[ProcessPoolExecutor]):
+        # Several jobs can see the same breakage; only the first replaces the pool
+        if pool is not None and pool is self._pool:
+            self.shutdown()
+        self.start()
+
+    def _job_done(self, job: asyncio.Future):
+        RENDER_IN_FLIGHT.dec()
+        self._semaphore.release()
+        if not job.cancelled():
+            # Mark the result as retrieved even when nobody is waiting any more (the caller timed out)
+            job.exception()
+
+    async def _run_limited(self, submit: Callable[[], asyncio.Future], timeout: float):
+        """
+        Run one job under the concurrency limit
+
+        Args:
+            submit: Starts the job and returns its future
+            timeout: Seconds the caller waits for the result
+
+        Returns:
+            The job's result
+        """
+        RENDER_QUEUE_DEPTH.inc()
+        try:
+            await self._semaphore.acquire()
+        finally:
+            RENDER_QUEUE_DEPTH.dec()
+
+        RENDER_IN_FLIGHT.inc()
+        try:
+            job = submit()
+        except BaseException:
+            RENDER_IN_FLIGHT.dec()
+            self._semaphore.release()
+            raise
+        job.add_done_callback(self._job_done)
+
+        # Shielded so a timeout only stops the wait; the permit is released by _job_done
+        return await asyncio.wait_for(asyncio.shield(job), timeout=timeout)
+
+    async def render(self, renderer: str, *args, timeout: Optional[float] = None, **kwargs) -> bytes:
+        """
+        Render an image in the pool
+
+        Args:
+            renderer: Renderer name from services.renderers.RENDERERS
+            *args, **kwargs: Plain-data renderer parameters
+            timeout: Per-job timeout in seconds (defaults to RENDER_JOB_TIMEOUT)
+
+        Returns:
+            Encoded image bytes
+
+        Raises:
+            RenderTimeout: If the job does not finish in time
+        """
+        cache_key = render_cache.make_key(renderer, args, kwargs)
+        if cache_key is not None:
+            cached = render_cache.get(cache_key)
+            if cached is not None:
+                RENDER_JOBS.inc(renderer=renderer, status="cached")
+                return cached
+
+        self.start()
+        loop = asyncio.get_running_loop()
+        timeout = timeout or self.timeout
+        start = time.perf_counter()
+
+        status = "ok"
+        try:
+            pool = self._pool
+            try:
+                image_bytes, encode_stats = await self._run_limited(
+                    lambda: loop.run_in_executor(pool, _run_job, renderer, args, kwargs),
+                    timeout
+                )
+            except BrokenProcessPool:
+                status = "fallback"
+                print(f"[RenderService] Process pool broke while rendering {renderer}, rebuilding")
+                self._replace_broken_pool(pool)
+                image_bytes, encode_stats = await self._run_limited(
+                    lambda: asyncio.ensure_future(asyncio.to_thread(_run_job, renderer, args, kwargs)),
+                    timeout
+                )
+            if encode_stats is not None:
+                self._record_encode(renderer, *encode_stats)
+            if cache_key is not None:
+                render_cache.put(cache_key, image_bytes)
+            return image_bytes
+        except asyncio.TimeoutError:
+            status = "timeout"
+            raise RenderTimeout(f"Render job '{renderer}' timed out after {timeout}s")
+        except Exception:
+            status = "error"
+            raise
+        finally:
+            RENDER_JOBS.inc(renderer=renderer, status=status)
+            RENDER_SECONDS.observe(time.perf_counter() - start, renderer=renderer)
+
+    @staticmethod
+    def _record_encode(renderer: str, fmt: str, seconds: float, size: int, over_budget: bool):
+        RENDER_ENCODE_SECONDS.observe(seconds, renderer=renderer, format=fmt)
+        RENDER_OUTPUT_BYTES.observe(size, renderer=renderer, format=fmt)
+        if over_budget:
+            RENDER_OVER_BUDGET.inc(renderer=renderer)
+
+# Global instance
+render_service = RenderService()
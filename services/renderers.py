@@ -0,0 +1,218 @@
+"""
+Pure image renderers executed inside the render process pool.
+
+Every renderer takes plain data (bytes, strings, numbers) and returns the
+encoded image bytes (see services.image_encoder), so jobs can be pickled to
+worker processes. Nothing here may touch discord objects, the network or
+the event loop.
+"""
+
+import io
+import random
+import textwrap
+from PIL import Image, ImageDraw
+from services import image_encoder, render_assets
+from services.render_assets import BOLD_FONTS, MEME_FONTS, REGULAR_FONTS, SERIF_FONTS
+
+def _text_size(font, text):
+    # Using getbbox if available (Pillow >= 9.2.0), fallback to getsize
+    if hasattr(font, 'getbbox'):
+        bbox = font.getbbox(text)
+        return bbox[2] - bbox[0], bbox[3] - bbox[1]
+    return font.getsize(text)
+
+def render_quote(avatar_data: bytes, quote_text: str, author_name: str) -> bytes:
+    """Inspirational quote card with the author's avatar on the left"""
+    avatar = Image.open(io.BytesIO(avatar_data)).resize((240, 240)).convert("RGBA")
+
+    # Wide rectangular card with the rounded panel for an inspirational quote aesthetic
+    img = render_assets.quote_background().copy()
+    draw = ImageDraw.Draw(img)
+
+    # Position avatar on the left side
+    avatar_x = 50
+    avatar_y = (500 - 240) // 2
+    img.paste(avatar, (avatar_x, avatar_y), avatar if avatar.mode == 'RGBA' else None)
+
+    # Serif fonts for a fancy inspirational feel
+    font = render_assets.font(SERIF_FONTS, 56)
+    attr_font = render_assets.font(SERIF_FONTS, 32)
+
+    # Format quote with quotation marks
+    quoted_text = f'"{quote_text}"'
+    wrapped_text = textwrap.fill(quoted_text, width=20)
+
+    # Center the quote text both horizontally and vertically
+    bbox = draw.multiline_textbbox((0, 0), wrapped_text, font=font)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+    text_x = 310 + (1200 - 310 - text_width) // 2
+    text_y = (500 - text_height) // 2
+
+    draw.multiline_text((text_x, text_y), wrapped_text, font=font, fill=(255, 255, 255), align="center")
+
+    # Add attribution with em dash
+    attribution = f"— {author_name}"
+    attr_bbox = draw.textbbox((0, 0), attribution, font=attr_font)
+    attr_width = attr_bbox[2] - attr_bbox[0]
+    attr_x = 310 + (1200 - 310 - attr_width) // 2
+
+    draw.text((attr_x, text_y + text_height + 15), attribution, font=attr_font, fill=(200, 200, 200))
+
+    return image_encoder.encode(img, "quote")
+
+def render_meme(template_data: bytes, top_text: str = "", bottom_text: str = "") -> bytes:
+    """Classic top/bottom caption meme over a template image"""
+    img = Image.open(io.BytesIO(template_data)).convert("RGB")
+    draw = ImageDraw.Draw(img)
+
+    width, height = img.size
+
+    # Scale font size based on image height (8% of height)
+    font_size = int(height * 0.08)
+
+    font = render_assets.font(MEME_FONTS, font_size)
+
+    def draw_text(text, y_position):
+        if not text:
+            return
+        # Scale wrap width based on image width
+        chars_per_line = max(15, int(width / (font_size * 0.6)))
+        wrapped = textwrap.fill(text, width=chars_per_line)
+        lines = wrapped.split("\n")
+        line_height = draw.textbbox((0, 0), "A", font=font)[3]
+        total_height = len(lines) * line_height
+        start_y = y_position - total_height // 2
+
+        for line in lines:
+            bbox = draw.textbbox((0, 0), line, font=font)
+            text_width = bbox[2] - bbox[0]
+            x = (width - text_width) // 2
+            # Draw black outline
+            draw.text((x + 2, start_y + 2), line, font=font, fill=(0, 0, 0))
+            # Draw white text
+            draw.text((x, start_y), line, font=font, fill=(255, 255, 255))
+            start_y += line_height
+
+    draw_text(top_text, height * 0.15)
+    draw_text(bottom_text, height * 0.85)
+
+    return image_encoder.encode(img, "meme")
+
+def render_welcome(avatar_data: bytes, name_text: str, count_text: str) -> bytes:
+    """800x250 welcome card with a circular avatar, member name and member count"""
+    # Constants
+    W, H = 800, 250
+    AVATAR_SIZE = 160
+    AVATAR_PADDING = 45
+
+    # Pre-rendered gradient background (dark purple/slate theme)
+    img = render_assets.welcome_background().copy()
+    draw = ImageDraw.Draw(img)
+
+    # Process avatar - make it circular with border
+    avatar = Image.open(io.BytesIO(avatar_data)).convert("RGBA").resize((AVATAR_SIZE, AVATAR_SIZE))
+    mask = render_assets.circle_mask(AVATAR_SIZE)
+    border_size = 4
+    border_img = render_assets.circle_border(AVATAR_SIZE, border_size)
+
+    # Composite avatar onto transparent background
+    avatar_comp = Image.new("RGBA", (AVATAR_SIZE, AVATAR_SIZE), (0, 0, 0, 0))
+    avatar_comp.paste(avatar, (0, 0), mask)
+
+    # Paste avatar onto border
+    final_avatar = border_img.copy()
+    final_avatar.paste(avatar_comp, (border_size, border_size), avatar_comp)
+
+    # Paste avatar onto main image
+    img.paste(final_avatar, (AVATAR_PADDING, (H - final_avatar.height) // 2), final_avatar)
+
+    name_font = render_assets.font(BOLD_FONTS, 55)
+    text_font = render_assets.font(REGULAR_FONTS, 35)
+
+    # Text positioning
+    text_x = AVATAR_PADDING + final_avatar.width + 40
+
+    # Calculate text height for vertical centering
+    _, name_h = _text_size(name_font, name_text)
+    _, count_h = _text_size(text_font, count_text)
+
+    TEXT_SPACING = 25
+    total_text_height = name_h + count_h + TEXT_SPACING
+    start_y = (H - total_text_height) // 2
+
+    # Draw member name
+    draw.text((text_x, start_y), name_text, font=name_font, fill=(255, 255, 255))
+
+    # Draw member count (lilac color)
+    draw.text((text_x, start_y + name_h + TEXT_SPACING), count_text, font=text_font, fill=(180, 160, 255))
+
+    return image_encoder.encode(img, "welcome")
+
+def render_captcha(text: str, width: int, height: int, font_size: int) -> bytes:
+    """Noisy captcha image with the code centered"""
+    # Create image
+    img = Image.new("RGB", (width, height), (30, 30, 46))
+    draw = ImageDraw.Draw(img)
+
+    font = render_assets.font(BOLD_FONTS, font_size)
+
+    # Add noise (lines/dots) to make it harder for OCR but readable for humans
+    for _ in range(30):
+        x1 = random.randint(0, width)
+        y1 = random.randint(0, height)
+        x2 = random.randint(0, width)
+        y2 = random.randint(0, height)
+        draw.line([(x1, y1), (x2, y2)], fill=(50, 50, 70), width=1)
+
+    # Draw text
+    # Center the text roughly
+    text_bbox = draw.textbbox((0, 0), text, font=font)
+    text_width = text_bbox[2] - text_bbox[0]
+    text_height = text_bbox[3] - text_bbox[1]
+
+    x = (width - text_width) / 2
+    y = (height - text_height) / 2
+
+    draw.text((x, y), text, font=font, fill=(255, 255, 255))
+
+    return image_encoder.encode(img, "captcha")
+
+def render_ship(avatar1_data: bytes, avatar2_data: bytes) -> bytes:
+    """Two avatars side by side joined by a pink plus"""
+    avatar1 = Image.open(io.BytesIO(avatar1_data)).resize((256, 256)).convert("RGBA")
+    avatar2 = Image.open(io.BytesIO(avatar2_data)).resize((256, 256)).convert("RGBA")
+
+    img = Image.new("RGBA", (256 + 150 + 256, 256), color=(0, 0, 0, 0))
+    img.paste(avatar1, (0, 0), avatar1)
+    img.paste(avatar2, (256 + 150, 0), avatar2)
+
+    draw = ImageDraw.Draw(img)
+    plus_x, plus_y = 256 + 75, 128
+    pink = (255, 105, 180)
+    draw.rectangle([plus_x - 40, plus_y - 15, plus_x + 40, plus_y + 15], fill=pink)
+    draw.rectangle([plus_x - 15, plus_y - 40, plus_x + 15, plus_y + 40], fill=pink)
+
+    return image_encoder.encode(img, "ship")
+
+def render_petpet(avatar_data: bytes) -> bytes:
+    """Animated petpet GIF of an avatar"""
+    from petpetgif import petpet
+
+    dest = io.BytesIO()
+    petpet.make(io.BytesIO(avatar_data), dest)
+    return image_encoder.encode(dest.getvalue(), "petpet")
+
+# Renderer registry: jobs are submitted to the pool by name
+RENDERERS = {
+    "quote": render_quote,
+    "meme": render_meme,
+    "welcome": render_welcome,
+    "captcha": render_captcha,
+    "ship": render_ship,
+    "petpet": render_petpet,
+}
+
+def run_job(name: str, args: tuple, kwargs: dict) -> bytes:
+    """Pool entry point: dispatch a job to its renderer by name"""
+    return RENDERERS[name](*args, **kwargs)
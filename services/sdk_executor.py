@@ -0,0 +1,75 @@
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+from config.constants import (
+    SPOTIFY_SDK_WORKERS,
+    SPOTIFY_SDK_TIMEOUT,
+    LASTFM_SDK_WORKERS,
+    LASTFM_SDK_TIMEOUT
+)
+from utils.metrics import metrics
+
+SDK_CALLS = metrics.counter("bot_sdk_calls_total", "Blocking SDK calls by outcome", ("sdk", "status"))
+SDK_SECONDS = metrics.histogram("bot_sdk_call_seconds", "Blocking SDK call time including queueing", ("sdk",))
+SDK_IN_FLIGHT = metrics.gauge("bot_sdk_in_flight", "Blocking SDK calls submitted and not yet finished", ("sdk",))
+
+class SDKTimeout(Exception):
+    """Raised when a blocking SDK call exceeds its timeout"""
+
+class SDKExecutor:
+    """
+    Dedicated, bounded thread pool for one synchronous third-party SDK
+
+    Each SDK gets its own pool so a slow Spotify response can only tie up
+    Spotify's threads, never the event loop or another SDK's workers.
+    """
+
+    def __init__(self, name: str, max_workers: int, timeout: float):
+        self.name = name
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=f"sdk-{self.name}")
+        return self._pool
+
+    async def run(self, func: Callable[..., Any], *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """
+        Call a blocking SDK function in this SDK's thread pool
+
+        Raises:
+            SDKTimeout: If the call does not return within the timeout. The
+                worker thread keeps running until the SDK call itself returns.
+        """
+        loop = asyncio.get_running_loop()
+        timeout = timeout or self.timeout
+        start = time.perf_counter()
+        status = "ok"
+
+        SDK_IN_FLIGHT.inc(sdk=self.name)
+        future = loop.run_in_executor(self._get_pool(), functools.partial(func, *args, **kwargs))
+        future.add_done_callback(lambda _: SDK_IN_FLIGHT.dec(sdk=self.name))
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            status = "timeout"
+            raise SDKTimeout(f"{self.name} call {getattr(func, '__name__', func)} timed out after {timeout}s")
+        except Exception:
+            status = "error"
+            raise
+        finally:
+            SDK_CALLS.inc(sdk=self.name, status=status)
+            SDK_SECONDS.observe(time.perf_counter() - start, sdk=self.name)
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+# Global instances, one per SDK
+spotify_executor = SDKExecutor("spotify", SPOTIFY_SDK_WORKERS, SPOTIFY_SDK_TIMEOUT)
+lastfm_executor = SDKExecutor("lastfm", LASTFM_SDK_WORKERS, LASTFM_SDK_TIMEOUT)
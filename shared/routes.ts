@@ -18,6 +18,16 @@ export const api = {
         201: z.custom<typeof logs.$inferSelect>(),
       },
     },
+    batchCreate: {
+      method: 'POST' as const,
+      path: '/api/logs/batch',
+      input: z.object({
+        logs: z.array(insertLogSchema).min(1).max(500),
+      }),
+      responses: {
+        201: z.object({ inserted: z.number() }),
+      },
+    },
   },
 };
 
@@ -1,4 +1,4 @@
-import { pgTable, text, serial, timestamp, boolean, integer } from "drizzle-orm/pg-core";
+import { pgTable, text, serial, timestamp, boolean, integer, jsonb } from "drizzle-orm/pg-core";
 import { createInsertSchema } from "drizzle-zod";
 import { z } from "zod";
 
@@ -73,11 +73,23 @@ export const botStatus = pgTable("bot_status", {
 });
 
 // Bot configuration
+// Levels the bot's LogPolicy understands (utils/logging.py LOG_LEVEL_PRIORITY)
+export const logLevels = ["debug", "info", "warning", "error", "critical"] as const;
+
+export const logPolicySchema = z.object({
+  minLevels: z.record(z.enum(logLevels)).optional(),
+  sampleRates: z.record(z.number().min(0).max(1)).optional(),
+}).strict();
+
+export type LogPolicy = z.infer<typeof logPolicySchema>;
+
 export const botConfig = pgTable("bot_config", {
   id: serial("id").primaryKey(),
   prefix: text("prefix").notNull().default(","),
   disabledCommands: text("disabled_commands").array().default([]),
   allowedChannels: text("allowed_channels").array().default([]),
+  // { minLevels: { [category]: level }, sampleRates: { [category]: 0..1 } }
+  logPolicy: jsonb("log_policy").$type<LogPolicy>(),
   updatedAt: timestamp("updated_at").defaultNow(),
   updatedBy: text("updated_by"),
 });
@@ -198,10 +210,32 @@ export const autoreactConfig = pgTable("autoreact_config", {
   updatedAt: timestamp("updated_at").defaultNow(),
 });
 
+// Auto-response triggers (guildId null = every guild)
+export const autoResponseTriggers = pgTable("auto_response_triggers", {
+  id: serial("id").primaryKey(),
+  guildId: text("guild_id"),
+  pattern: text("pattern").notNull(),
+  matchType: text("match_type").notNull().default("word"), // "keyword", "word", or "regex"
+  action: text("action").notNull().default("send"), // "send", "reply", "react", or "gif"
+  response: text("response").notNull(),
+  cooldownSeconds: integer("cooldown_seconds").notNull().default(0),
+  enabled: boolean("enabled").notNull().default(true),
+  createdBy: text("created_by").notNull(),
+  createdAt: timestamp("created_at").defaultNow(),
+  updatedAt: timestamp("updated_at").defaultNow(),
+});
+
 export const insertStarboardConfigSchema = createInsertSchema(starboardConfig).omit({ id: true, createdAt: true, updatedAt: true });
 export const insertAutoreactConfigSchema = createInsertSchema(autoreactConfig).omit({ id: true, createdAt: true, updatedAt: true });
+export const insertAutoResponseTriggerSchema = createInsertSchema(autoResponseTriggers, {
+  matchType: z.enum(["keyword", "word", "regex"]),
+  action: z.enum(["send", "reply", "react", "gif"]),
+  cooldownSeconds: z.number().int().min(0),
+}).omit({ id: true, createdAt: true, updatedAt: true });
 
 export type StarboardConfig = typeof starboardConfig.$inferSelect;
 export type InsertStarboardConfig = z.infer<typeof insertStarboardConfigSchema>;
 export type AutoreactConfig = typeof autoreactConfig.$inferSelect;
 export type InsertAutoreactConfig = z.infer<typeof insertAutoreactConfigSchema>;
+export type AutoResponseTrigger = typeof autoResponseTriggers.$inferSelect;
+export type InsertAutoResponseTrigger = z.infer<typeof insertAutoResponseTriggerSchema>;
@@ -0,0 +1,8 @@
+import pytest
+from config.settings import ConfigManager
+
+@pytest.fixture
+def fresh_config(monkeypatch):
+    """A new ConfigManager, so tests that apply configs don't change the process-wide singleton"""
+    monkeypatch.setattr(ConfigManager, "_instance", None)
+    return ConfigManager()
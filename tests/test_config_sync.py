@@ -0,0 +1,103 @@
+import asyncio
+import json
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from services import config_sync as config_sync_module
+from services.config_sync import ConfigSync
+from services.http_session import http_session
+
+class FakeDashboard:
+    """Serves /bot/config with ETags and /bot/config/stream as server-sent events"""
+
+    def __init__(self):
+        self.version = 1
+        self.responses = []
+        self.pushes = asyncio.Queue()
+        self.stream_opened = asyncio.Event()
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/bot/config", self.get_config)
+        app.router.add_get("/bot/config/stream", self.stream)
+        return app
+
+    async def get_config(self, request: web.Request) -> web.Response:
+        etag = f'"v{self.version}"'
+        if request.headers.get("If-None-Match") == etag:
+            self.responses.append(304)
+            return web.Response(status=304, headers={"ETag": etag})
+        self.responses.append(200)
+        body = {"prefix": "," if self.version == 1 else "!", "disabledCommands": []}
+        return web.json_response(body, headers={"ETag": etag})
+
+    async def stream(self, request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        await self._send(response, {"reason": "connected"})
+        self.stream_opened.set()
+        while True:
+            reason = await self.pushes.get()
+            if reason is None:
+                return response
+            await response.write(b": keep-alive\n\n")
+            await self._send(response, {"reason": reason})
+
+    @staticmethod
+    async def _send(response: web.StreamResponse, data: dict):
+        await response.write(f"event: config\ndata: {json.dumps(data)}\n\n".encode())
+
+    def save(self, reason: str):
+        """What the dashboard does when an admin saves: new version, then a push"""
+        self.version += 1
+        self.pushes.put_nowait(reason)
+
+async def _until(predicate, timeout: float = 5):
+    async def poll():
+        while not predicate():
+            await asyncio.sleep(0.01)
+    await asyncio.wait_for(poll(), timeout)
+
+def test_pushed_change_fetches_once_and_reconnect_costs_a_304(monkeypatch, fresh_config):
+    manager = fresh_config
+    monkeypatch.setattr(config_sync_module, "config", manager)
+
+    async def run():
+        dashboard = FakeDashboard()
+        server = TestServer(dashboard.app())
+        await server.start_server()
+        sync = ConfigSync(url=str(server.make_url("/bot/config")), stream_url=str(server.make_url("/bot/config/stream")))
+
+        applied = []
+        apply = sync.apply
+        monkeypatch.setattr(sync, "apply", lambda data: (applied.append(data), apply(data)))
+
+        listener_reasons = []
+        async def listener(reason):
+            listener_reasons.append(reason)
+        sync.add_listener(listener)
+
+        assert await sync.fetch()
+        assert dashboard.responses == [200]
+
+        listen = asyncio.create_task(sync._listen())
+        try:
+            # Connecting sends a "connected" event; the conditional fetch comes back unchanged
+            await dashboard.stream_opened.wait()
+            await _until(lambda: listener_reasons == ["connected"])
+            assert dashboard.responses == [200, 304]
+            assert len(applied) == 1
+
+            dashboard.save("prefix")
+            await _until(lambda: listener_reasons == ["connected", "prefix"])
+            assert dashboard.responses == [200, 304, 200]
+            assert len(applied) == 2
+            assert sync.etag == '"v2"'
+            assert manager.prefix == "!"
+        finally:
+            dashboard.pushes.put_nowait(None)
+            listen.cancel()
+            await asyncio.gather(listen, return_exceptions=True)
+            await http_session.close()
+            await server.close()
+
+    asyncio.run(run())
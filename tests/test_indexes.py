@@ -0,0 +1,17 @@
+from config.constants import DEFAULT_AUTO_RESPONSES
+from config.indexes import ConfigIndex
+
+def test_unconfigured_dashboard_keeps_builtin_triggers():
+    # The server omits autoResponses until an admin has saved a trigger
+    index = ConfigIndex.build({"prefix": ",", "disabledCommands": [], "allowedChannels": []})
+
+    triggers = index.auto_responses.triggers
+    assert [t.id for t in triggers] == [entry["id"] for entry in DEFAULT_AUTO_RESPONSES]
+    assert [t.action for t in triggers] == ["gif", "send", "react"]
+    assert [t.id for t in index.auto_responses.scan("hey there", None)] == ["default-greeting"]
+
+def test_saved_empty_trigger_list_disables_builtins():
+    index = ConfigIndex.build({"autoResponses": []})
+
+    assert index.auto_responses.triggers == ()
+    assert index.auto_responses.scan("hey there", None) == []
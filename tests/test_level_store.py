@@ -0,0 +1,153 @@
+import asyncio
+import random
+import pytest
+from models.level_store import LevelStore
+from models.rank_index import RankIndex
+from models.xp_curve import xp_curve
+
+def _oracle(store):
+    """Every user best first, by sorting the whole table: highest lifetime XP, then lowest user ID"""
+    users = [(user_id, store.get(user_id)) for user_id in _user_ids(store)]
+    return sorted(users, key=lambda item: (-xp_curve.to_total(item[1].level, item[1].xp), item[0]))
+
+def _user_ids(store):
+    table = getattr(store, "_table", None)
+    return list(store._users) if table is None else table[0, :store._count].tolist()
+
+def _assert_ranking_matches_oracle(store):
+    expected = _oracle(store)
+    assert len(store) == len(expected)
+    for position, (user_id, _) in enumerate(expected, start=1):
+        assert store.rank_of(user_id) == position
+    for offset in (0, 1, 7, len(expected) - 3, len(expected)):
+        assert store.page(offset, 10) == expected[max(offset, 0):offset + 10]
+    assert store.page(0, len(expected) + 5) == expected
+
+def _columnar(path, json_path=None):
+    pytest.importorskip("numpy")
+    from models.columnar_level_store import ColumnarLevelStore
+    return ColumnarLevelStore(path=str(path), json_path=str(json_path or path.with_suffix(".json")))
+
+def test_rank_index_matches_sorted_list():
+    rng = random.Random(14)
+    index, oracle = RankIndex(load=4), []
+    for _ in range(2000):
+        if oracle and rng.random() < 0.4:
+            key = rng.choice(oracle)
+            index.remove(key)
+            oracle.remove(key)
+        else:
+            key = rng.randrange(200)
+            index.add(key)
+            oracle.append(key)
+        oracle.sort()
+
+        assert len(index) == len(oracle)
+        probe = rng.randrange(-5, 205)
+        assert index.count_before(probe) == sum(1 for key in oracle if key < probe)
+        assert index.count_at_most(probe) == sum(1 for key in oracle if key <= probe)
+        if oracle:
+            position = rng.randrange(len(oracle))
+            assert index[position] == oracle[position]
+            assert index.index(oracle[position]) == oracle.index(oracle[position])
+            assert index.slice(position, 9) == oracle[position:position + 9]
+    assert list(index) == oracle
+    with pytest.raises(ValueError):
+        index.remove(10 ** 6)
+
+@pytest.mark.parametrize("engine", ["json", "numpy"])
+def test_rank_and_pages_match_oracle_with_ties(engine, tmp_path):
+    store = LevelStore(path=str(tmp_path / "levels.json")) if engine == "json" else _columnar(tmp_path / "levels.npy")
+    rng = random.Random(15)
+    # Few distinct totals, so most users share their XP with others and the user ID decides
+    totals = [0, 50, 200, 200, 1_000, 25_000]
+    store.set_totals({user_id: rng.choice(totals) for user_id in rng.sample(range(1, 10_000), 120)})
+    _assert_ranking_matches_oracle(store)
+
+    for user_id in rng.sample(_user_ids(store), 40):
+        store.add_xp(user_id, rng.choice((-300, 0, 150, 1_000)))
+    store.add_xp(10_001, 200)
+    _assert_ranking_matches_oracle(store)
+
+    assert store.rank_of(123_456) is None
+    assert store.page(len(store), 10) == []
+
+@pytest.mark.parametrize("engine", ["json", "numpy"])
+def test_snapshot_write_and_reload(engine, tmp_path):
+    def make():
+        if engine == "json":
+            return LevelStore(path=str(tmp_path / "levels.json"), interval=3600)
+        return _columnar(tmp_path / "levels.npy")
+
+    async def run():
+        store = make()
+        await store.start()
+        store.set_totals({1: 120, 2: 5_000, 3: 5_000})
+        store.add_xp(4, 10 ** 7)
+        await store.close()
+
+        reloaded = make()
+        await reloaded.start()
+        try:
+            for user_id in (1, 2, 3, 4):
+                assert reloaded.get(user_id) == store.get(user_id)
+            assert reloaded.page(0, 10) == store.page(0, 10)
+        finally:
+            await reloaded.close()
+
+    asyncio.run(run())
+
+def test_columnar_store_migrates_levels_json(tmp_path):
+    json_path = tmp_path / "levels.json"
+
+    async def run():
+        source = LevelStore(path=str(json_path), interval=3600)
+        await source.start()
+        source.set_totals({user_id: user_id * 997 for user_id in range(1, 50)})
+        await source.close()
+
+        migrated = _columnar(tmp_path / "levels.npy", json_path)
+        await migrated.start()
+        try:
+            assert migrated.page(0, 100) == source.page(0, 100)
+        finally:
+            await migrated.close()
+
+    asyncio.run(run())
+
+def test_columnar_store_matches_json_store(tmp_path, monkeypatch):
+    pytest.importorskip("numpy")
+    from models import columnar_level_store
+
+    # A small tail limit makes the columnar store re-sort its rows during the run
+    monkeypatch.setattr(columnar_level_store, "LEVEL_ARRAY_TAIL_LIMIT", 16)
+    reference = LevelStore(path=str(tmp_path / "levels.json"))
+    columnar = _columnar(tmp_path / "levels.npy")
+    rng = random.Random(17)
+    ids = range(1, 400)
+
+    for step in range(300):
+        op = rng.choice(("add", "add", "grant", "set_totals", "reset", "decay"))
+        if op == "add":
+            user_id, amount = rng.choice(ids), rng.randrange(-2_000, 20_000)
+            assert columnar.add_xp(user_id, amount) == reference.add_xp(user_id, amount)
+        elif op == "grant":
+            users, amount = rng.sample(ids, rng.randrange(1, 60)), rng.randrange(-50_000, 50_000)
+            assert columnar.grant(users, amount) == reference.grant(users, amount)
+        elif op == "set_totals":
+            totals = {user_id: rng.randrange(0, 10 ** 8) for user_id in rng.sample(ids, rng.randrange(1, 80))}
+            assert columnar.set_totals(totals) == reference.set_totals(totals)
+        elif op == "reset":
+            users = None if rng.random() < 0.05 else rng.sample(ids, rng.randrange(1, 20))
+            assert columnar.reset(users) == reference.reset(users)
+        else:
+            percent = rng.choice((10, 50, 100))
+            assert columnar.decay(percent) == reference.decay(percent)
+
+        assert len(columnar) == len(reference), f"step {step}: {op}"
+        for user_id in rng.sample(ids, 20):
+            assert columnar.get(user_id) == reference.get(user_id), f"step {step}: {op}"
+            assert columnar.rank_of(user_id) == reference.rank_of(user_id), f"step {step}: {op}"
+
+    assert columnar.page(0, len(reference)) == reference.page(0, len(reference))
+    assert columnar.stats() == reference.stats()
@@ -0,0 +1,36 @@
+import pytest
+from services import config_sync as config_sync_module
+from services.config_sync import ConfigSync
+from utils.logging import BotLogger, LogPolicy
+
+def test_policy_accepts_known_levels_and_rates_in_range():
+    policy = LogPolicy.from_config({"minLevels": {"message": "WARNING"}, "sampleRates": {"message": 0, "command": 1}})
+
+    assert not policy.allows("info", "message")
+    assert policy.sample_rates == {"message": 0.0, "command": 1.0}
+    assert LogPolicy.from_config(None).allows("debug", "message")
+
+@pytest.mark.parametrize("data", [
+    {"minLevels": {"message": "verbose"}},
+    {"minLevels": {"message": None}},
+    {"sampleRates": {"message": 1.5}},
+    {"sampleRates": {"message": -0.1}},
+    {"sampleRates": {"message": "0.5"}},
+    {"sampleRates": {"message": True}},
+    {"minLevels": ["info"]},
+    "info",
+])
+def test_policy_rejects_invalid_values(data):
+    with pytest.raises(ValueError):
+        LogPolicy.from_config(data)
+
+def test_invalid_policy_leaves_the_whole_config_unchanged(monkeypatch, fresh_config):
+    manager = fresh_config
+    monkeypatch.setattr(config_sync_module, "config", manager)
+    monkeypatch.setattr(BotLogger, "policy", LogPolicy())
+    sync = ConfigSync(url="http://dashboard.invalid/bot/config", stream_url="http://dashboard.invalid/bot/config/stream")
+
+    with pytest.raises(ValueError):
+        sync.apply({"prefix": "!", "logPolicy": {"sampleRates": {"message": 2}}})
+    assert manager.prefix != "!"
+    assert BotLogger.policy.sample_rates == {}
@@ -0,0 +1,60 @@
+import asyncio
+from utils.logging import OVERFLOW_DROP_LEVEL, OVERFLOW_DROP_OLDEST, LogShipper
+
+def _entry(message, level="info"):
+    return {"message": message, "level": level, "category": "system"}
+
+def _messages(shipper):
+    return [entry["message"] for entry in shipper._queue]
+
+def test_drop_oldest_makes_room_by_evicting_the_oldest_entry():
+    shipper = LogShipper(max_size=3, overflow_policy=OVERFLOW_DROP_OLDEST)
+    for message in "abcde":
+        shipper.enqueue(_entry(message))
+
+    assert _messages(shipper) == ["c", "d", "e"]
+    assert shipper.dropped == 2
+
+def test_drop_level_evicts_the_oldest_lowest_level_entry():
+    shipper = LogShipper(max_size=4, overflow_policy=OVERFLOW_DROP_LEVEL)
+    shipper.enqueue(_entry("info-1"))
+    shipper.enqueue(_entry("debug-1", "debug"))
+    shipper.enqueue(_entry("warning-1", "warning"))
+    shipper.enqueue(_entry("debug-2", "debug"))
+
+    # The oldest debug entry makes way for anything above debug
+    shipper.enqueue(_entry("error-1", "error"))
+    assert _messages(shipper) == ["info-1", "warning-1", "debug-2", "error-1"]
+    shipper.enqueue(_entry("info-2"))
+    assert _messages(shipper) == ["info-1", "warning-1", "error-1", "info-2"]
+    assert shipper.dropped == 2
+
+    # Nothing queued ranks below info now, so an incoming info or debug entry is the one dropped
+    shipper.enqueue(_entry("info-3"))
+    shipper.enqueue(_entry("debug-3", "debug"))
+    assert _messages(shipper) == ["info-1", "warning-1", "error-1", "info-2"]
+    assert shipper.dropped == 4
+
+    shipper.enqueue(_entry("warning-2", "warning"))
+    assert _messages(shipper) == ["warning-1", "error-1", "info-2", "warning-2"]
+    assert shipper.dropped == 5
+
+def test_stop_ships_everything_queued_in_batches():
+    async def run():
+        shipper = LogShipper(max_size=100, batch_size=4, flush_interval=3600)
+        batches = []
+
+        async def send(batch):
+            batches.append([entry["message"] for entry in batch])
+        shipper._send = send
+
+        shipper.start()
+        for i in range(10):
+            shipper.enqueue(_entry(str(i)))
+        await shipper.stop()
+
+        assert [message for batch in batches for message in batch] == [str(i) for i in range(10)]
+        assert all(len(batch) <= 4 for batch in batches)
+        assert shipper.dropped == 0
+
+    asyncio.run(run())
@@ -0,0 +1,64 @@
+from types import SimpleNamespace
+import pytest
+from services import render_cache as render_cache_module
+from services.render_cache import RENDER_CACHE_BYTES, RENDER_CACHE_EVICTIONS, RenderCache
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(render_cache_module, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+def _evictions(reason):
+    return RENDER_CACHE_EVICTIONS.get(reason=reason)
+
+def test_least_recently_used_entries_are_evicted_first(clock):
+    cache = RenderCache(ttl=60, max_bytes=100)
+    cache.put("a", b"a" * 40)
+    cache.put("b", b"b" * 30)
+    cache.put("c", b"c" * 20)
+    # Reading "a" makes "b" the least recently used
+    assert cache.get("a") == b"a" * 40
+
+    evicted = _evictions("size")
+    cache.put("d", b"d" * 30)
+    assert list(cache.cache) == ["c", "a", "d"]
+    assert _evictions("size") == evicted + 1
+    assert cache._bytes == 90
+    assert RENDER_CACHE_BYTES.get() == 90
+
+    # One large entry can push out several
+    cache.put("e", b"e" * 95)
+    assert list(cache.cache) == ["e"]
+    assert _evictions("size") == evicted + 4
+    assert cache._bytes == 95
+
+def test_size_accounting_on_replace_expiry_and_oversized_output(clock):
+    cache = RenderCache(ttl=60, max_bytes=100)
+    cache.put("a", b"a" * 40)
+    cache.put("a", b"a" * 10)
+    assert cache._bytes == 10
+
+    # Output bigger than the whole budget isn't stored and evicts nothing
+    cache.put("huge", b"h" * 101)
+    assert "huge" not in cache.cache
+    assert cache._bytes == 10
+
+    expired = _evictions("expired")
+    clock[0] += 61
+    assert cache.get("a") is None
+    assert _evictions("expired") == expired + 1
+    assert cache._bytes == 0
+    assert RENDER_CACHE_BYTES.get() == 0
+
+def test_key_depends_on_renderer_version_and_image_bytes(monkeypatch):
+    monkeypatch.setitem(render_cache_module.RENDERER_VERSIONS, "quote", 1)
+    key = RenderCache.make_key("quote", (b"avatar", "text"), {"size": 256})
+
+    assert RenderCache.make_key("quote", (bytearray(b"avatar"), "text"), {"size": 256}) == key
+    assert RenderCache.make_key("quote", (b"other", "text"), {"size": 256}) != key
+    assert RenderCache.make_key("quote", (b"avatar", "text"), {"size": 512}) != key
+
+    monkeypatch.setitem(render_cache_module.RENDERER_VERSIONS, "quote", 2)
+    assert RenderCache.make_key("quote", (b"avatar", "text"), {"size": 256}) != key
+    assert RenderCache.make_key("not-cached", (), {}) is None
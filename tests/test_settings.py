@@ -0,0 +1,8 @@
+def test_disabled_command_lookup_ignores_case(fresh_config):
+    manager = fresh_config
+    manager.update_config({"disabledCommands": ["Rank", "pet"]})
+
+    assert manager.is_command_disabled("Rank")
+    assert manager.is_command_disabled("rank")
+    assert manager.is_command_disabled("PET")
+    assert not manager.is_command_disabled("cat")
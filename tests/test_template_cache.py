@@ -0,0 +1,114 @@
+import asyncio
+from types import SimpleNamespace
+import pytest
+from utils import template_cache as template_cache_module
+from utils.template_cache import FETCH_FAILED, TemplateCache
+
+class FakeFetcher:
+    """Stands in for TemplateCache._fetch_from_api; each call takes the next result and returns it once released"""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    def hold(self):
+        self.gate.clear()
+
+    def release(self):
+        self.gate.set()
+
+    async def __call__(self, command_name, context):
+        self.calls.append((command_name, context))
+        result = self.results.pop(0)
+        await self.gate.wait()
+        return result
+
+def _template(title):
+    return {"mapping": {"command_name": "levels.level_up"}, "template_data": {"title": title}}
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(template_cache_module, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+def _cache(fetcher, **ttls):
+    cache = TemplateCache(**{"ttl": 10, "negative_ttl": 5, "stale_ttl": 100, "error_ttl": 3, **ttls})
+    cache._fetch_from_api = fetcher
+    return cache
+
+def test_concurrent_misses_share_one_request(clock):
+    async def run():
+        fetcher = FakeFetcher(_template("Level up"))
+        cache = _cache(fetcher)
+        fetcher.hold()
+        lookups = [asyncio.create_task(cache.get_template("levels.level_up")) for _ in range(5)]
+        await asyncio.sleep(0)
+        fetcher.release()
+        results = await asyncio.gather(*lookups)
+
+        assert fetcher.calls == [("levels.level_up", "default")]
+        assert all(result is results[0] for result in results)
+        assert results[0]["template_data"] == {"title": "Level up"}
+        assert "compiled" in results[0]
+
+    asyncio.run(run())
+
+def test_failed_refresh_keeps_serving_stale_copy(clock):
+    async def run():
+        fetcher = FakeFetcher(_template("Old"), FETCH_FAILED)
+        cache = _cache(fetcher)
+        first = await cache.get_template("levels.level_up")
+
+        # Expired but within the stale window: served at once, refreshed in the background
+        clock[0] += 20
+        assert await cache.get_template("levels.level_up") is first
+        await asyncio.gather(*cache._inflight.values())
+        assert len(fetcher.calls) == 2
+
+        # The failed refresh keeps the old copy, and the retry waits for error_ttl
+        assert await cache.get_template("levels.level_up") is first
+        assert len(fetcher.calls) == 2
+
+    asyncio.run(run())
+
+def test_negative_entry_expires_after_its_ttl(clock):
+    async def run():
+        fetcher = FakeFetcher(None, _template("Mapped"))
+        cache = _cache(fetcher, stale_ttl=0)
+        assert await cache.get_template("levels.level_up") is None
+
+        clock[0] += 4
+        assert await cache.get_template("levels.level_up") is None
+        assert len(fetcher.calls) == 1
+
+        clock[0] += 2
+        template = await cache.get_template("levels.level_up")
+        assert template["template_data"] == {"title": "Mapped"}
+        assert len(fetcher.calls) == 2
+
+    asyncio.run(run())
+
+def test_invalidate_during_fetch_discards_its_result(clock):
+    async def run():
+        fetcher = FakeFetcher(_template("Before"), _template("After"))
+        cache = _cache(fetcher)
+        fetcher.hold()
+        lookup = asyncio.create_task(cache.get_template("levels.level_up"))
+        await asyncio.sleep(0)
+
+        cache.invalidate("levels.level_up")
+        # A lookup after the invalidation doesn't join the fetch that started before it
+        second = asyncio.create_task(cache.get_template("levels.level_up"))
+        await asyncio.sleep(0)
+        fetcher.release()
+
+        # The caller that was waiting still gets an answer, but it isn't cached
+        assert (await lookup)["template_data"] == {"title": "Before"}
+        assert (await second)["template_data"] == {"title": "After"}
+        assert len(fetcher.calls) == 2
+        assert cache.cache["levels.level_up:default"].template["template_data"] == {"title": "After"}
+
+    asyncio.run(run())
@@ -0,0 +1,80 @@
+import re
+from utils.triggers import TriggerEngine
+
+def _entry(trigger_id, pattern, match_type, guild_id=None):
+    return {"id": trigger_id, "guild_id": guild_id, "pattern": pattern, "match_type": match_type, "response": "ok"}
+
+def _ids(engine, text, guild_id=None):
+    return [t.id for t in engine.scan(text, guild_id)]
+
+def test_overlapping_triggers_all_fire_in_table_order():
+    engine = TriggerEngine.from_config([
+        _entry("is", "is", "keyword"),
+        _entry("his", "his", "word"),
+        _entry("hi", "hi", "keyword"),
+        _entry("this", "this", "word"),
+    ])
+
+    # "hi" and "his" start at the same offset, "is" starts inside both
+    assert _ids(engine, "his") == ["is", "his", "hi"]
+    # Word triggers still respect word boundaries
+    assert _ids(engine, "xhis") == ["is", "hi"]
+    assert _ids(engine, "this") == ["is", "hi", "this"]
+    assert _ids(engine, "no match") == []
+
+def test_guild_triggers_combine_with_global_ones():
+    engine = TriggerEngine.from_config([
+        _entry("global", "hello", "word"),
+        _entry("local", "hell", "keyword", guild_id=1),
+    ])
+
+    assert _ids(engine, "hello", guild_id=1) == ["global", "local"]
+    assert _ids(engine, "hello", guild_id=2) == ["global"]
+
+def test_inline_global_flags_are_scoped():
+    engine = TriggerEngine.from_config([
+        _entry("flag", "(?i)bar", "regex"),
+        _entry("dotall", "(?s)a.b", "regex"),
+        _entry("word", "bar", "word"),
+    ])
+
+    assert _ids(engine, "foo bar a\nb") == ["flag", "dotall", "word"]
+
+def test_uncombinable_trigger_is_scanned_on_its_own(monkeypatch):
+    from utils import triggers
+
+    real_compile = re.compile
+
+    def compile_rejecting(pattern, flags=0):
+        # Pretend the "lone" regex can't be embedded in the combined pattern
+        if "(?P<t1>" in pattern:
+            raise re.error("not combinable")
+        return real_compile(pattern, flags)
+
+    monkeypatch.setattr(triggers.re, "compile", compile_rejecting)
+    engine = TriggerEngine.from_config([
+        _entry("first", "hi", "keyword"),
+        _entry("lone", "h.s", "regex"),
+        _entry("last", "is", "keyword"),
+    ])
+    monkeypatch.undo()
+
+    compiled = engine._global
+    assert compiled.pattern is not None
+    assert [i for i, _ in compiled.separate] == [1]
+    assert _ids(engine, "his") == ["first", "lone", "last"]
+
+def test_trie_triggers_sharing_a_path():
+    engine = TriggerEngine.from_config([
+        _entry("cats", "cats", "word"),
+        _entry("cat-word", "cat", "word"),
+        _entry("cat-again", "cat", "word"),
+        _entry("cat-key", "cat", "keyword"),
+        _entry("category", "category", "keyword"),
+    ])
+
+    # A failed boundary on "cat" doesn't hide the longer word, and duplicates both fire
+    assert _ids(engine, "cats") == ["cats", "cat-key"]
+    assert _ids(engine, "a cat!") == ["cat-word", "cat-again", "cat-key"]
+    assert _ids(engine, "category") == ["cat-key", "category"]
+    assert _ids(engine, "CAT") == ["cat-word", "cat-again", "cat-key"]
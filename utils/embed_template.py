@@ -0,0 +1,158 @@
+import discord
+import json
+import re
+from typing import Any, FrozenSet, List, Mapping, Optional, Tuple
+
+# {variable.path} placeholders, compiled once for every template
+VARIABLE_PATTERN = re.compile(r'\{([a-zA-Z0-9_.]+)\}')
+
+DEFAULT_COLOR = 0x9b59b6
+
+class TextPlan:
+    """
+    One template string split into literal and variable segments
+
+    Rendering joins the segments, looking each variable up once; a variable
+    missing from the context is left as its {placeholder}, like
+    EmbedBuilder.substitute_variables.
+    """
+
+    __slots__ = ("literals", "names", "placeholders")
+
+    def __init__(self, text: str):
+        literals: List[str] = []
+        names: List[str] = []
+        position = 0
+        for match in VARIABLE_PATTERN.finditer(text):
+            literals.append(text[position:match.start()])
+            names.append(match.group(1))
+            position = match.end()
+        literals.append(text[position:])
+
+        # literals[i] comes before names[i]; the last literal closes the string
+        self.literals: Tuple[str, ...] = tuple(literals)
+        self.names: Tuple[str, ...] = tuple(names)
+        self.placeholders: Tuple[str, ...] = tuple(f"{{{name}}}" for name in names)
+
+    def render(self, variables: Mapping[str, str]) -> str:
+        names, literals = self.names, self.literals
+        if not names:
+            return literals[0]
+        if len(names) == 1:
+            # Most template strings hold a single placeholder ("{user.name}", "Level {level}")
+            return literals[0] + variables.get(names[0], self.placeholders[0]) + literals[1]
+        parts = [literals[0]]
+        for name, placeholder, literal in zip(names, self.placeholders, literals[1:]):
+            parts.append(variables.get(name, placeholder))
+            parts.append(literal)
+        return "".join(parts)
+
+def _plan(value: Any) -> Optional[TextPlan]:
+    """Compile a template string; empty or missing values stay None (the field is skipped)"""
+    return TextPlan(value) if value and isinstance(value, str) else None
+
+def _render(plan: Optional[TextPlan], variables: Mapping[str, str]) -> Optional[str]:
+    return plan.render(variables) if plan is not None else None
+
+class CompiledEmbedTemplate:
+    """
+    An embed template compiled into a render plan
+
+    Built once when a template is fetched (see TemplateCache), so rendering
+    is a join per text field with no JSON parsing or regex work. variables
+    is the set of placeholder names the template uses, so callers can skip
+    building values nobody reads.
+    """
+
+    def __init__(self, template_data: Any):
+        # Parse template_data if it's a string
+        if isinstance(template_data, str):
+            template_data = json.loads(template_data)
+        if not isinstance(template_data, dict):
+            raise ValueError("template_data must be a JSON object")
+
+        self.title = _plan(template_data.get("title"))
+        self.description = _plan(template_data.get("description"))
+        self.url = _plan(template_data.get("url"))
+        self.color = template_data.get("color", DEFAULT_COLOR)
+
+        footer = template_data.get("footer")
+        footer = footer if isinstance(footer, dict) else {}
+        self.footer_text = _plan(footer.get("text"))
+        self.footer_icon = _plan(footer.get("icon_url"))
+
+        thumbnail = template_data.get("thumbnail")
+        self.thumbnail = _plan(thumbnail.get("url")) if isinstance(thumbnail, dict) else None
+
+        image = template_data.get("image")
+        self.image = _plan(image.get("url")) if isinstance(image, dict) else None
+
+        author = template_data.get("author")
+        author = author if isinstance(author, dict) else {}
+        self.author_name = _plan(author.get("name"))
+        self.author_icon = _plan(author.get("icon_url"))
+        self.author_url = _plan(author.get("url"))
+
+        self.fields: List[Tuple[TextPlan, TextPlan, bool]] = []
+        fields = template_data.get("fields")
+        if isinstance(fields, list):
+            for field in fields:
+                if not isinstance(field, dict):
+                    continue
+                name, value = _plan(field.get("name", "")), _plan(field.get("value", ""))
+                if name is not None and value is not None:
+                    self.fields.append((name, value, field.get("inline", False)))
+
+        plans = [
+            self.title, self.description, self.url, self.footer_text, self.footer_icon, self.thumbnail,
+            self.image, self.author_name, self.author_icon, self.author_url
+        ]
+        for name, value, _ in self.fields:
+            plans.extend((name, value))
+        self.variables: FrozenSet[str] = frozenset(name for plan in plans if plan is not None for name in plan.names)
+
+    def render(self, variables: Optional[Mapping[str, str]] = None) -> discord.Embed:
+        """
+        Build the embed for one set of variable values
+
+        Args:
+            variables: Values by placeholder name (e.g., {"user.name": "John", "level": "5"})
+
+        Returns:
+            discord.Embed with every known placeholder replaced
+        """
+        variables = variables if variables is not None else {}
+
+        embed = discord.Embed(
+            title=_render(self.title, variables),
+            description=_render(self.description, variables),
+            color=self.color,
+            url=_render(self.url, variables)
+        )
+
+        footer_text = _render(self.footer_text, variables)
+        if footer_text:
+            embed.set_footer(text=footer_text, icon_url=_render(self.footer_icon, variables))
+
+        thumbnail_url = _render(self.thumbnail, variables)
+        if thumbnail_url:
+            embed.set_thumbnail(url=thumbnail_url)
+
+        image_url = _render(self.image, variables)
+        if image_url:
+            embed.set_image(url=image_url)
+
+        author_name = _render(self.author_name, variables)
+        if author_name:
+            embed.set_author(
+                name=author_name,
+                icon_url=_render(self.author_icon, variables),
+                url=_render(self.author_url, variables)
+            )
+
+        for name_plan, value_plan, inline in self.fields:
+            name, value = name_plan.render(variables), value_plan.render(variables)
+            if name and value:
+                embed.add_field(name=name, value=value, inline=inline)
+
+        return embed
@@ -1,13 +1,210 @@
-import aiohttp
+import asyncio
+import random
 import sys
+from collections import deque
+from typing import Deque, Dict, List, Optional
 from config.settings import config
+from config.constants import LOG_QUEUE_SIZE, LOG_BATCH_SIZE, LOG_FLUSH_INTERVAL
+from services.http_session import http_session
+
+# Relative importance of log levels, used by the drop-by-level overflow policy
+LOG_LEVEL_PRIORITY = {
+    "debug": 10,
+    "info": 20,
+    "warning": 30,
+    "error": 40,
+    "critical": 50
+}
+
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_DROP_LEVEL = "drop_level"
+
+class LogPolicy:
+    """
+    Per-category minimum levels and sampling rates for outbound logs
+
+    Dashboard config shape (all keys optional):
+        {"minLevels": {"message": "info"}, "sampleRates": {"message": 0.01}}
+
+    Raises ValueError for a level not in LOG_LEVEL_PRIORITY or a sample
+    rate outside 0 .. 1, rather than guessing what was meant.
+    """
+
+    def __init__(self, min_levels: Optional[Dict[str, str]] = None, sample_rates: Optional[Dict[str, float]] = None):
+        # Store priorities/rates pre-resolved so allows() is two dict lookups
+        self.min_priority: Dict[str, int] = {}
+        for category, level in (min_levels or {}).items():
+            priority = LOG_LEVEL_PRIORITY.get(str(level).lower())
+            if priority is None:
+                raise ValueError(f"Unknown log level {level!r} for category {category!r}")
+            self.min_priority[category] = priority
+
+        self.sample_rates: Dict[str, float] = {}
+        for category, rate in (sample_rates or {}).items():
+            if isinstance(rate, bool) or not isinstance(rate, (int, float)) or not 0.0 <= rate <= 1.0:
+                raise ValueError(f"Sample rate for category {category!r} must be a number from 0 to 1, got {rate!r}")
+            self.sample_rates[category] = float(rate)
+
+    @classmethod
+    def from_config(cls, data: Optional[Dict]) -> "LogPolicy":
+        if data is None:
+            return cls()
+        if not isinstance(data, dict):
+            raise ValueError(f"logPolicy must be an object, got {type(data).__name__}")
+        min_levels, sample_rates = data.get("minLevels"), data.get("sampleRates")
+        for name, value in (("minLevels", min_levels), ("sampleRates", sample_rates)):
+            if value is not None and not isinstance(value, dict):
+                raise ValueError(f"logPolicy.{name} must be an object")
+        return cls(min_levels, sample_rates)
+
+    def allows(self, level: str, category: str) -> bool:
+        if LOG_LEVEL_PRIORITY.get(level, 0) < self.min_priority.get(category, 0):
+            return False
+        rate = self.sample_rates.get(category, 1.0)
+        return rate >= 1.0 or random.random() < rate
+
+class LogShipper:
+    """
+    Bounded in-process log queue with a background batch flusher
+
+    Entries are enqueued without awaiting the network. A flusher task sends
+    them to the dashboard's batch ingest endpoint whenever a full batch is
+    queued or the flush interval elapses, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        max_size: int = LOG_QUEUE_SIZE,
+        batch_size: int = LOG_BATCH_SIZE,
+        flush_interval: float = LOG_FLUSH_INTERVAL,
+        overflow_policy: str = OVERFLOW_DROP_OLDEST
+    ):
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow_policy = overflow_policy
+        self.dropped = 0
+
+        self._queue: Deque[Dict[str, str]] = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def closed(self) -> bool:
+        return self._closing
+
+    def start(self):
+        """Start the background flusher (requires a running event loop)"""
+        if self.running:
+            return
+        self._closing = False
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Stop the flusher once everything still queued has been shipped"""
+        self._closing = True
+        if self._task is not None:
+            self._wakeup.set()
+            await self._task
+            self._task = None
+
+        while self._queue:
+            await self._send(self._take_batch())
+
+    def enqueue(self, entry: Dict[str, str]):
+        """Queue an entry, applying the overflow policy when the queue is full"""
+        if len(self._queue) >= self.max_size and not self._make_room(entry):
+            self.dropped += 1
+            return
+
+        self._queue.append(entry)
+        if self._wakeup is not None and len(self._queue) >= self.batch_size:
+            self._wakeup.set()
+
+    def _make_room(self, entry: Dict[str, str]) -> bool:
+        """Evict one queued entry for the incoming one. Returns False if the incoming entry should be dropped instead."""
+        if self.overflow_policy == OVERFLOW_DROP_LEVEL:
+            incoming = LOG_LEVEL_PRIORITY.get(entry["level"], 0)
+            # Evict the oldest entry of the lowest queued level, if it ranks below the incoming one
+            victim_index, victim_priority = None, None
+            for i, queued in enumerate(self._queue):
+                priority = LOG_LEVEL_PRIORITY.get(queued["level"], 0)
+                if victim_priority is None or priority < victim_priority:
+                    victim_index, victim_priority = i, priority
+            if victim_index is None or victim_priority >= incoming:
+                return False
+            del self._queue[victim_index]
+        else:
+            self._queue.popleft()
+
+        self.dropped += 1
+        return True
+
+    def _take_batch(self) -> List[Dict[str, str]]:
+        count = min(self.batch_size, len(self._queue))
+        return [self._queue.popleft() for _ in range(count)]
+
+    async def _run(self):
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            # Ship full batches right away; a partial batch waits for the next interval
+            while self._queue:
+                await self._send(self._take_batch())
+                if not self._closing and len(self._queue) < self.batch_size:
+                    break
+
+    async def _send(self, batch: List[Dict[str, str]]):
+        if not batch:
+            return
+        try:
+            async with http_session.post(
+                config.LOGS_BATCH_URL,
+                json={"logs": batch},
+                headers=config.get_api_headers()
+            ) as response:
+                if response.status != 201:
+                    print(f"Failed to ship {len(batch)} logs to server: {response.status}", file=sys.stderr)
+        except Exception as e:
+            print(f"Error shipping {len(batch)} logs to server: {e}", file=sys.stderr)
 
 class BotLogger:
+    shipper = LogShipper(overflow_policy=config.LOG_OVERFLOW_POLICY)
+    policy = LogPolicy()
+
+    @staticmethod
+    def set_policy(policy: LogPolicy):
+        BotLogger.policy = policy
+
+    @staticmethod
+    def should_log(level: str, category: str) -> bool:
+        """
+        Check the log policy before building a message
+
+        Hot paths call this first so sampled-out entries are never formatted,
+        then pass checked=True to log() so the sample is not drawn twice.
+        """
+        return BotLogger.policy.allows(level, category)
+
     @staticmethod
-    async def log(message: str, level: str = "info", category: str = "system"):
+    async def log(message: str, level: str = "info", category: str = "system", checked: bool = False):
         """
-        Send log to the web server API
-        
+        Queue a log for the web server API
+
+        The entry is shipped in the background by the LogShipper, so this
+        never waits on the dashboard. Entries rejected by the log policy are
+        dropped before printing or queueing.
+
         Categories:
         - message: Regular user messages
         - command: Bot command executions
@@ -16,27 +213,26 @@ class BotLogger:
         - system: Bot startup, config, slash sync
         - error: Error events (use with level="error")
         """
+        if not checked and not BotLogger.policy.allows(level, category):
+            return
+
         # Print to console as well
         print(f"[{level.upper()}] [{category}] {message}")
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                payload = {
-                    "message": message,
-                    "level": level,
-                    "category": category
-                }
-                async with session.post(
-                    config.LOGS_URL,
-                    json=payload,
-                    headers=config.get_api_headers()
-                ) as response:
-                    if response.status != 201:
-                        print(f"Failed to log to server: {response.status}", file=sys.stderr)
-        except Exception as e:
-            print(f"Error logging to server: {e}", file=sys.stderr)
+
+        BotLogger.shipper.enqueue({
+            "message": message,
+            "level": level,
+            "category": category
+        })
+        if not BotLogger.shipper.running and not BotLogger.shipper.closed:
+            BotLogger.shipper.start()
 
     @staticmethod
     async def log_error(message: str, error: Exception, category: str = "error"):
         error_msg = f"{message}: {str(error)}"
         await BotLogger.log(error_msg, level="error", category=category)
+
+    @staticmethod
+    async def shutdown():
+        """Flush every queued log (called on bot shutdown)"""
+        await BotLogger.shipper.stop()
@@ -0,0 +1,217 @@
+import bisect
+import functools
+import math
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Latency buckets in seconds, from sub-millisecond cache hits up to slow API calls
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelKey = Tuple[str, ...]
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_value(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames: Tuple[str, ...] = tuple(labelnames)
+
+    def _key(self, labels: Dict[str, str]) -> LabelKey:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _label_str(self, key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+        pairs = list(zip(self.labelnames, key))
+        if extra:
+            pairs.append(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        lines.extend(self._samples())
+        return lines
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+class Counter(_Metric):
+    """Monotonically increasing count"""
+    type_name = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.values: Dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        self.values[key] = self.values.get(key, 0) + amount
+
+    def get(self, **labels) -> float:
+        return self.values.get(self._key(labels), 0)
+
+    def _samples(self) -> List[str]:
+        return [f"{self.name}{self._label_str(k)} {_format_value(v)}" for k, v in self.values.items()]
+
+class Gauge(_Metric):
+    """Point-in-time value, either set directly or read from a callback at scrape time"""
+    type_name = "gauge"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.values: Dict[LabelKey, float] = {}
+        self._function: Optional[Callable[[], float]] = None
+
+    def set(self, value: float, **labels):
+        self.values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        self.values[key] = self.values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+    def set_function(self, function: Callable[[], float]):
+        """Read the (unlabelled) value from function whenever the gauge is scraped"""
+        self._function = function
+
+    def get(self, **labels) -> float:
+        if self._function is not None and not labels:
+            try:
+                return float(self._function())
+            except Exception:
+                return math.nan
+        return self.values.get(self._key(labels), 0)
+
+    def _samples(self) -> List[str]:
+        if self._function is not None:
+            return [f"{self.name} {_format_value(self.get())}"]
+        return [f"{self.name}{self._label_str(k)} {_format_value(v)}" for k, v in self.values.items()]
+
+class Histogram(_Metric):
+    """Cumulative bucketed distribution of observed values"""
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (), buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # key -> [per-bucket counts..., +Inf count], sum
+        self.counts: Dict[LabelKey, List[int]] = {}
+        self.sums: Dict[LabelKey, float] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        counts = self.counts.get(key)
+        if counts is None:
+            counts = self.counts[key] = [0] * (len(self.buckets) + 1)
+            self.sums[key] = 0.0
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sums[key] += value
+
+    def count(self, **labels) -> int:
+        return sum(self.counts.get(self._key(labels), ()))
+
+    def _samples(self) -> List[str]:
+        lines = []
+        for key, counts in self.counts.items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                lines.append(f"{self.name}_bucket{self._label_str(key, ('le', _format_value(bound)))} {cumulative}")
+            cumulative += counts[-1]
+            lines.append(f"{self.name}_bucket{self._label_str(key, ('le', '+Inf'))} {cumulative}")
+            lines.append(f"{self.name}_sum{self._label_str(key)} {_format_value(self.sums[key])}")
+            lines.append(f"{self.name}_count{self._label_str(key)} {cumulative}")
+        return lines
+
+class MetricsRegistry:
+    """Process-wide registry of counters, gauges and histograms"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Iterable[str] = (), buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render_prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format"""
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+# Global instance
+metrics = MetricsRegistry()
+
+# Shared bot metrics
+COMMAND_INVOCATIONS = metrics.counter("bot_command_invocations_total", "Completed command invocations", ("command", "kind"))
+COMMAND_LATENCY = metrics.histogram("bot_command_latency_seconds", "Command latency from invocation to completion", ("command", "kind"))
+LISTENER_LATENCY = metrics.histogram("bot_listener_seconds", "Event listener execution time", ("listener",))
+GATEWAY_LATENCY = metrics.gauge("bot_gateway_latency_seconds", "Discord gateway heartbeat latency")
+EVENT_LOOP_LAG = metrics.gauge("bot_event_loop_lag_seconds", "Most recent event loop scheduling lag")
+HTTP_LATENCY = metrics.histogram("bot_http_request_seconds", "Outbound HTTP request latency", ("host", "method"))
+CACHE_REQUESTS = metrics.counter("bot_cache_requests_total", "Cache lookups by result", ("cache", "result"))
+
+def record_cache(cache: str, hit: bool, result: Optional[str] = None):
+    """
+    Count one cache lookup
+
+    Args:
+        cache: Cache name
+        hit: Whether the lookup was answered without a fetch of its own
+        result: Finer-grained result label (e.g. "stale"); defaults to hit/miss
+    """
+    CACHE_REQUESTS.inc(cache=cache, result=result or ("hit" if hit else "miss"))
+
+def cache_hit_ratios() -> Dict[str, float]:
+    """Hit ratio per cache, computed from CACHE_REQUESTS"""
+    totals: Dict[str, List[float]] = {}
+    for (cache, result), value in CACHE_REQUESTS.values.items():
+        hits_and_total = totals.setdefault(cache, [0, 0])
+        # Anything but a miss (stale, negative, coalesced...) was served without its own fetch
+        if result != "miss":
+            hits_and_total[0] += value
+        hits_and_total[1] += value
+    return {cache: (hits / total if total else 0.0) for cache, (hits, total) in totals.items()}
+
+def timed_listener(func):
+    """
+    Record a cog listener's execution time in LISTENER_LATENCY
+
+    Apply beneath @commands.Cog.listener() so the listener keeps its name.
+    """
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await func(self, *args, **kwargs)
+        finally:
+            LISTENER_LATENCY.observe(time.perf_counter() - start, listener=f"{type(self).__name__}.{func.__name__}")
+    return wrapper
@@ -1,4 +1,4 @@
-from config.constants import ADMIN_USER_IDS, DEFAULT_ALLOWED_CHANNELS
+from config.constants import ADMIN_USER_IDS
 from config.settings import config
 
 class PermissionChecker:
@@ -12,9 +12,5 @@ class PermissionChecker:
         Check if the channel is allowed.
         If the allowed list is empty (both dynamic and default), all channels are allowed.
         """
-        allowed = config.allowed_channels or DEFAULT_ALLOWED_CHANNELS
-        
-        if not allowed:
-            return True
-            
-        return channel_id in allowed
+        allowed = config.index.allowed_channels
+        return not allowed or channel_id in allowed
@@ -1,17 +1,68 @@
 import aiohttp
 import asyncio
-import os
-from datetime import datetime, timedelta
-from typing import Optional, Dict
+import time
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Dict
+from config.constants import (
+    TEMPLATE_CACHE_TTL, TEMPLATE_NEGATIVE_TTL, TEMPLATE_STALE_TTL, TEMPLATE_ERROR_TTL, TEMPLATE_CACHE_MAX_ENTRIES
+)
 from config.settings import config
+from services.http_session import http_session
+from utils.embed_template import CompiledEmbedTemplate
+from utils.metrics import metrics, record_cache
+
+TEMPLATE_FETCHES = metrics.counter("bot_template_fetches_total", "Template API fetches by outcome", ("result",))
+TEMPLATE_CACHE_EVICTIONS = metrics.counter("bot_template_cache_evictions_total", "Templates evicted by the LRU bound")
+TEMPLATE_CACHE_SIZE = metrics.gauge("bot_template_cache_entries", "Entries (including negative ones) in the template cache")
+
+# _fetch_from_api result for timeouts and errors, as opposed to None for "no template"
+FETCH_FAILED = object()
+
+class _Entry(NamedTuple):
+    template: Optional[dict]
+    # time.monotonic() deadlines: fresh until expires, servable (while refreshing) until stale_until
+    expires: float
+    stale_until: float
 
 class TemplateCache:
-    """In-memory cache for embed templates with TTL"""
+    """
+    In-memory LRU cache for embed templates
+
+    - "No template" (404) answers are cached too, for TEMPLATE_NEGATIVE_TTL,
+      so unmapped commands don't call the API every time.
+    - Concurrent lookups of a key share one in-flight fetch.
+    - Expired entries are served stale for up to TEMPLATE_STALE_TTL while a
+      background fetch refreshes them; a failed refresh keeps the stale copy.
+    - At most TEMPLATE_CACHE_MAX_ENTRIES keys are kept, least recently used
+      evicted first.
+
+    Every template is compiled into a render plan as it enters the cache and
+    returned under the "compiled" key next to "mapping" and "template_data";
+    a template that fails to compile is treated as missing.
 
-    def __init__(self, ttl_minutes: int = 5):
-        self.cache: Dict[str, dict] = {}
-        self.cache_times: Dict[str, datetime] = {}
-        self.ttl = timedelta(minutes=ttl_minutes)
+    prefetch() loads every command -> template mapping in one request (a
+    conditional GET against /bot/templates). While that catalog is current it
+    answers lookups directly, including "no template" for unmapped keys, so
+    only keys looked up after it goes stale fall back to per-key fetches.
+    """
+
+    def __init__(self, ttl: float = TEMPLATE_CACHE_TTL, negative_ttl: float = TEMPLATE_NEGATIVE_TTL,
+                 stale_ttl: float = TEMPLATE_STALE_TTL, error_ttl: float = TEMPLATE_ERROR_TTL,
+                 max_entries: int = TEMPLATE_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.stale_ttl = stale_ttl
+        self.error_ttl = error_ttl
+        self.max_entries = max_entries
+        self.cache: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Bumped by invalidate() so fetches started before it don't store old data
+        self._generation = 0
+        # Bulk catalog from prefetch(): {cache_key: template}, authoritative until _catalog_until
+        self._catalog: Dict[str, dict] = {}
+        self._catalog_until = 0.0
+        self._catalog_etag: Optional[str] = None
+        self._prefetch_lock = asyncio.Lock()
 
     async def get_template(self, command_name: str, context: str = "default") -> Optional[dict]:
         """
@@ -25,21 +76,150 @@ class TemplateCache:
             Template data dict or None if not found
         """
         cache_key = f"{command_name}:{context}"
+        now = time.monotonic()
 
         # Check cache
-        if cache_key in self.cache:
-            if datetime.now() - self.cache_times[cache_key] < self.ttl:
-                return self.cache[cache_key]
+        entry = self.cache.get(cache_key)
+        if entry is not None:
+            self.cache.move_to_end(cache_key)
+            if now < entry.expires:
+                record_cache("template", True, "hit" if entry.template is not None else "negative_hit")
+                return entry.template
+
+        if now < self._catalog_until:
+            # The catalog lists every mapping, so a key missing from it has no template
+            template = self._catalog.get(cache_key)
+            record_cache("template", True, "hit" if template is not None else "negative_hit")
+            return template
+
+        if entry is not None:
+            if now < entry.stale_until:
+                record_cache("template", True, "stale")
+                self._start_fetch(cache_key, command_name, context)
+                return entry.template
+
+        task = self._inflight.get(cache_key)
+        if task is not None:
+            record_cache("template", True, "coalesced")
+        else:
+            record_cache("template", False)
+            task = self._start_fetch(cache_key, command_name, context)
+
+        # Shielded so a cancelled caller doesn't cancel the fetch other callers wait on
+        return await asyncio.shield(task)
 
-        # Fetch from API
-        template = await self._fetch_from_api(command_name, context)
-        if template:
-            self.cache[cache_key] = template
-            self.cache_times[cache_key] = datetime.now()
+    def _start_fetch(self, cache_key: str, command_name: str, context: str) -> asyncio.Task:
+        """Start a fetch for a key, or return the one already running"""
+        task = self._inflight.get(cache_key)
+        if task is None:
+            # The generation is taken now, so an invalidate() before the task first runs still counts
+            task = asyncio.create_task(self._load(cache_key, command_name, context, self._generation))
+            self._inflight[cache_key] = task
+        return task
 
+    async def _load(self, cache_key: str, command_name: str, context: str, generation: int) -> Optional[dict]:
+        try:
+            template = await self._fetch_from_api(command_name, context)
+        finally:
+            # After an invalidate() the key may already belong to a newer fetch
+            if self._inflight.get(cache_key) is asyncio.current_task():
+                del self._inflight[cache_key]
+
+        now = time.monotonic()
+        if template is FETCH_FAILED:
+            TEMPLATE_FETCHES.inc(result="error")
+            previous = self.cache.get(cache_key)
+            if previous is not None and now < previous.stale_until:
+                # Keep serving the old copy (no later than its original stale deadline); retry after error_ttl
+                template = previous.template
+                entry = _Entry(template, now + self.error_ttl, max(previous.stale_until, now + self.error_ttl))
+            else:
+                template = None
+                entry = _Entry(None, now + self.error_ttl, now + self.error_ttl)
+        else:
+            TEMPLATE_FETCHES.inc(result="ok" if template is not None else "not_found")
+            template = self._compile(cache_key, template)
+            ttl = self.ttl if template is not None else self.negative_ttl
+            entry = _Entry(template, now + ttl, now + ttl + self.stale_ttl)
+
+        if generation == self._generation:
+            self._store(cache_key, entry)
+        return template
+
+    @staticmethod
+    def _compile(cache_key: str, template: Optional[dict]) -> Optional[dict]:
+        """Attach the compiled render plan; malformed templates are dropped (with a message)"""
+        if template is None:
+            return None
+        try:
+            template["compiled"] = CompiledEmbedTemplate(template["template_data"])
+        except (KeyError, TypeError, ValueError) as e:
+            print(f"[TemplateCache] Ignoring malformed template for {cache_key}: {e}")
+            return None
         return template
 
-    async def _fetch_from_api(self, command_name: str, context: str) -> Optional[dict]:
+    def _store(self, cache_key: str, entry: _Entry):
+        self.cache[cache_key] = entry
+        self.cache.move_to_end(cache_key)
+        while len(self.cache) > self.max_entries:
+            self.cache.popitem(last=False)
+            TEMPLATE_CACHE_EVICTIONS.inc()
+        TEMPLATE_CACHE_SIZE.set(len(self.cache))
+
+    async def prefetch(self, force: bool = False) -> bool:
+        """
+        Load every command -> template mapping in one request
+
+        Args:
+            force: Skip the If-None-Match header and always download the catalog
+
+        Returns:
+            True if the catalog changed and was applied
+        """
+        # Concurrent triggers (startup, poll, push) collapse into one request
+        async with self._prefetch_lock:
+            headers = config.get_api_headers()
+            if self._catalog_etag and not force:
+                headers["If-None-Match"] = self._catalog_etag
+
+            try:
+                async with http_session.get(config.TEMPLATES_URL, headers=headers, timeout=10) as resp:
+                    if resp.status == 304:
+                        TEMPLATE_FETCHES.inc(result="bulk_not_modified")
+                        self._catalog_until = time.monotonic() + self.ttl + self.stale_ttl
+                        return False
+                    if resp.status != 200:
+                        TEMPLATE_FETCHES.inc(result="bulk_error")
+                        print(f"[TemplateCache] Error prefetching templates: HTTP {resp.status}")
+                        return False
+                    data = await resp.json()
+                    etag = resp.headers.get("ETag")
+            except Exception as e:
+                TEMPLATE_FETCHES.inc(result="bulk_error")
+                print(f"[TemplateCache] Error prefetching templates: {e}")
+                return False
+
+            catalog = {}
+            for item in data.get("templates") or ():
+                try:
+                    cache_key = f"{item['command_name']}:{item.get('context') or 'default'}"
+                    template = {"mapping": item.get("mapping"), "template_data": item["template_data"]}
+                except (KeyError, TypeError):
+                    continue
+                template = self._compile(cache_key, template)
+                if template is not None:
+                    catalog[cache_key] = template
+
+            # Entries cached before this catalog may describe the old mappings
+            self.invalidate()
+            self._catalog = catalog
+            self._catalog_until = time.monotonic() + self.ttl + self.stale_ttl
+            self._catalog_etag = etag
+            TEMPLATE_FETCHES.inc(result="bulk_ok")
+            print(f"[TemplateCache] Prefetched {len(catalog)} command templates")
+            return True
+
+    async def _fetch_from_api(self, command_name: str, context: str):
         """
         Fetch template from API endpoint
 
@@ -48,7 +228,8 @@ class TemplateCache:
             context: Context for the command
 
         Returns:
-            Template data dict or None if not found
+            Template data dict, None if the command has no template, or
+            FETCH_FAILED if the API could not be reached
         """
         try:
             headers = config.get_api_headers()
@@ -58,26 +239,25 @@ class TemplateCache:
             if context:
                 url += f"?context={context}"
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=5)) as resp:
-                    if resp.status == 200:
-                        return await resp.json()
-                    elif resp.status == 404:
-                        # Template not found - this is expected for unmapped commands
-                        return None
-                    else:
-                        print(f"[TemplateCache] Error fetching template for {command_name}: HTTP {resp.status}")
-                        return None
+            async with http_session.get(url, headers=headers, timeout=5) as resp:
+                if resp.status == 200:
+                    return await resp.json()
+                elif resp.status == 404:
+                    # Template not found - this is expected for unmapped commands
+                    return None
+                else:
+                    print(f"[TemplateCache] Error fetching template for {command_name}: HTTP {resp.status}")
+                    return FETCH_FAILED
 
         except asyncio.TimeoutError:
             print(f"[TemplateCache] Timeout fetching template for {command_name}")
-            return None
+            return FETCH_FAILED
         except aiohttp.ClientError as e:
             print(f"[TemplateCache] Client error fetching template for {command_name}: {e}")
-            return None
+            return FETCH_FAILED
         except Exception as e:
             print(f"[TemplateCache] Unexpected error fetching template for {command_name}: {e}")
-            return None
+            return FETCH_FAILED
 
     def invalidate(self, command_name: str = None):
         """
@@ -86,14 +266,20 @@ class TemplateCache:
         Args:
             command_name: Command to invalidate, or None to clear all
         """
+        self._generation += 1
         if command_name:
             keys_to_remove = [k for k in self.cache.keys() if k.startswith(command_name)]
             for key in keys_to_remove:
                 del self.cache[key]
-                del self.cache_times[key]
+            # Fetches already running finish for their callers, but new lookups start fresh ones
+            for key in [k for k in self._inflight if k.startswith(command_name)]:
+                del self._inflight[key]
         else:
             self.cache.clear()
-            self.cache_times.clear()
+            self._inflight.clear()
+        # The catalog can't vouch for anything after an invalidation; the next prefetch restores it
+        self._catalog_until = 0.0
+        TEMPLATE_CACHE_SIZE.set(len(self.cache))
 
 # Global instance
 template_cache = TemplateCache()
@@ -0,0 +1,250 @@
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Pattern, Tuple
+from utils.metrics import metrics
+
+AUTO_RESPONSE_HITS = metrics.counter("bot_auto_response_hits_total", "Auto-response trigger matches by outcome", ("trigger", "result"))
+AUTO_RESPONSE_SCAN_SECONDS = metrics.histogram(
+    "bot_auto_response_scan_seconds",
+    "Time to scan one message against every auto-response trigger",
+    buckets=(0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.01)
+)
+
+MATCH_TYPES = ("keyword", "word", "regex")
+ACTIONS = ("send", "reply", "react", "gif")
+
+# Backreferences and named groups would break once patterns are combined
+_UNSAFE_REGEX = re.compile(r"\\[1-9]|\(\?P[<=]")
+# A leading global flag group such as (?i) or (?s); only legal at the start of a whole pattern
+_GLOBAL_FLAGS = re.compile(r"\(\?([aiLmsux]+)\)")
+
+@dataclass(frozen=True)
+class Trigger:
+    id: str
+    guild_id: Optional[int]
+    pattern: str
+    match_type: str
+    action: str
+    response: str
+    cooldown: float = 0
+
+    @property
+    def source(self) -> str:
+        """This trigger as a regex fragment"""
+        if self.match_type == "keyword":
+            return re.escape(self.pattern)
+        if self.match_type == "word":
+            return rf"(?<!\w){re.escape(self.pattern)}(?!\w)"
+        # Leading global flags become a scoped group, so the fragment can sit inside the combined pattern
+        flags = _GLOBAL_FLAGS.match(self.pattern)
+        if flags:
+            return f"(?{flags.group(1)}:{self.pattern[flags.end():]})"
+        return self.pattern
+
+    @classmethod
+    def from_config(cls, data: Dict[str, Any]) -> Optional["Trigger"]:
+        """
+        Validate one trigger from the dashboard payload
+
+        Returns:
+            The trigger, or None (with a message) if it is malformed
+        """
+        try:
+            guild_id = data.get("guild_id")
+            trigger = cls(
+                id=str(data["id"]),
+                guild_id=int(guild_id) if guild_id else None,
+                pattern=str(data["pattern"]),
+                match_type=data.get("match_type") or "word",
+                action=data.get("action") or "send",
+                response=str(data["response"]),
+                cooldown=float(data.get("cooldown_seconds") or 0)
+            )
+        except (KeyError, ValueError, TypeError) as e:
+            print(f"Skipping invalid auto-response trigger {data.get('id')}: {e}")
+            return None
+
+        if not trigger.pattern or trigger.match_type not in MATCH_TYPES or trigger.action not in ACTIONS:
+            print(f"Skipping invalid auto-response trigger {trigger.id}: bad pattern, match type or action")
+            return None
+
+        if trigger.match_type == "regex":
+            try:
+                compiled = re.compile(trigger.source, re.IGNORECASE)
+            except re.error as e:
+                print(f"Skipping auto-response trigger {trigger.id}: invalid regex: {e}")
+                return None
+            if _UNSAFE_REGEX.search(trigger.pattern) or compiled.match(""):
+                print(f"Skipping auto-response trigger {trigger.id}: regex uses group references or matches empty text")
+                return None
+
+        return trigger
+
+class CompiledSet(NamedTuple):
+    # Combined pattern for every trigger that could be combined (None if none could)
+    pattern: Optional[Pattern]
+    triggers: Tuple[Trigger, ...]
+    # (table index, pattern) of triggers that had to stay separate, scanned one by one
+    separate: Tuple[Tuple[int, Pattern], ...]
+
+class _TrieNode:
+    __slots__ = ("children", "ends")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        # Table indexes of the triggers whose text ends at this node
+        self.ends: List[int] = []
+
+def _build_trie(words: Iterable[Tuple[int, str]]) -> _TrieNode:
+    root = _TrieNode()
+    for index, word in words:
+        node = root
+        for char in word.lower():
+            node = node.children.setdefault(char, _TrieNode())
+        node.ends.append(index)
+    return root
+
+def _trie_pattern(node: _TrieNode, terminal: Callable[[int], str]) -> str:
+    """
+    Regex for a trie: one branch per next character, terminal(i) where trigger i ends
+
+    Every text prefix the trie knows is followed along a single path, so the
+    cost per offset depends on the message, not on how many words the trie
+    holds. Past a node where a word ends the rest of the path is optional,
+    so shorter words still count when a longer one doesn't match.
+    """
+    ends = "".join(terminal(index) for index in node.ends)
+    if not node.children:
+        return ends
+    branches = "|".join(
+        re.escape(char) + _trie_pattern(child, terminal) for char, child in sorted(node.children.items())
+    )
+    return f"{ends}(?:{branches}){'?' if node.ends else ''}"
+
+def _keyword_end(index: int) -> str:
+    return f"(?P<t{index}>)"
+
+def _word_end(index: int) -> str:
+    # Optional, so a failed right boundary doesn't stop longer words on the same path
+    return rf"(?:(?!\w)(?P<t{index}>))?"
+
+def _regex_lookahead(index: int, trigger: Trigger) -> str:
+    """A regex trigger as an optional zero-width lookahead with its own named group"""
+    return f"(?:(?=(?P<t{index}>{trigger.source})))?"
+
+class TriggerEngine:
+    """
+    Every auto-response trigger compiled into one regex per guild
+
+    Each trigger becomes a named alternative (t0, t1, ...) of a single
+    pattern, so a message is scanned once however many triggers exist.
+    Guild-specific triggers are compiled together with the global ones;
+    guilds without their own triggers share the global pattern.
+
+    Keyword and word triggers are merged into character tries (the regex
+    form of an Aho-Corasick automaton), so their cost doesn't grow with
+    their number; regex triggers are added as one optional lookahead each.
+    The pattern starts with a lookahead that skips offsets where nothing can
+    start, and consumes nothing, so every trigger is reported: each one has
+    its own named group, set wherever it matches, overlapping or not, as if
+    each were tested separately. Only a regex that can't be embedded in the
+    combined pattern is scanned on its own.
+    """
+
+    def __init__(self, triggers: Iterable[Trigger] = ()):
+        self.triggers: Tuple[Trigger, ...] = tuple(triggers)
+
+        global_triggers = [t for t in self.triggers if t.guild_id is None]
+        self._global = self._compile(global_triggers)
+        self._by_guild: Dict[int, Optional[CompiledSet]] = {}
+        for guild_id in {t.guild_id for t in self.triggers if t.guild_id is not None}:
+            guild_triggers = [t for t in self.triggers if t.guild_id in (None, guild_id)]
+            self._by_guild[guild_id] = self._compile(guild_triggers)
+
+    @classmethod
+    def from_config(cls, entries: Iterable[Dict[str, Any]]) -> "TriggerEngine":
+        triggers = (Trigger.from_config(entry) for entry in entries)
+        return cls(t for t in triggers if t is not None)
+
+    @staticmethod
+    def _compile(triggers: List[Trigger]) -> Optional[CompiledSet]:
+        usable, patterns = [], []
+        for trigger in triggers:
+            try:
+                patterns.append(re.compile(trigger.source, re.IGNORECASE))
+            except re.error as e:
+                print(f"Skipping auto-response trigger {trigger.id}: invalid regex: {e}")
+                continue
+            usable.append(trigger)
+        if not usable:
+            return None
+
+        keywords = [(i, t.pattern) for i, t in enumerate(usable) if t.match_type == "keyword"]
+        words = [(i, t.pattern) for i, t in enumerate(usable) if t.match_type == "word"]
+        regexes, separate = [], []
+        for i, trigger in enumerate(usable):
+            if trigger.match_type != "regex":
+                continue
+            try:
+                re.compile(_regex_lookahead(i, trigger), re.IGNORECASE)
+                regexes.append(i)
+            except re.error as e:
+                print(f"Auto-response trigger {trigger.id} can't be combined, scanning it on its own: {e}")
+                separate.append((i, patterns[i]))
+
+        starts, fragments = [], []
+        if keywords:
+            trie = _build_trie(keywords)
+            starts.append(_trie_pattern(trie, lambda index: ""))
+            fragments.append(f"(?:(?={_trie_pattern(trie, _keyword_end)}))?")
+        if words:
+            trie = _build_trie(words)
+            starts.append(rf"(?<!\w){_trie_pattern(trie, lambda index: '')}")
+            fragments.append(rf"(?:(?=(?<!\w){_trie_pattern(trie, _word_end)}))?")
+        for i in regexes:
+            starts.append(f"(?:{usable[i].source})")
+            fragments.append(_regex_lookahead(i, usable[i]))
+
+        pattern = None
+        if starts:
+            # The leading lookahead rejects offsets where no trigger starts before any group is tried
+            try:
+                pattern = re.compile(f"(?={'|'.join(starts)}){''.join(fragments)}", re.IGNORECASE)
+            except re.error as e:
+                print(f"Auto-response triggers could not be combined, scanning them one by one: {e}")
+                separate = [(i, patterns[i]) for i in range(len(usable))]
+        return CompiledSet(pattern, tuple(usable), tuple(separate))
+
+    def has_triggers(self, guild_id: Optional[int]) -> bool:
+        return self._by_guild.get(guild_id, self._global) is not None
+
+    def scan(self, text: str, guild_id: Optional[int]) -> List[Trigger]:
+        """
+        Find the triggers a message sets off
+
+        Args:
+            text: Message content (already lower-cased by the pipeline)
+            guild_id: Guild the message was sent in, or None for DMs
+
+        Returns:
+            Matched triggers in table order, each at most once
+        """
+        compiled = self._by_guild.get(guild_id, self._global)
+        if compiled is None:
+            return []
+
+        start = time.perf_counter()
+        matched = set()
+        if compiled.pattern is not None:
+            remaining = len(compiled.triggers) - len(compiled.separate)
+            for match in compiled.pattern.finditer(text):
+                matched.update(int(name[1:]) for name, value in match.groupdict().items() if value is not None)
+                if len(matched) == remaining:
+                    break
+        for i, single in compiled.separate:
+            if single.search(text):
+                matched.add(i)
+        AUTO_RESPONSE_SCAN_SECONDS.observe(time.perf_counter() - start)
+
+        return [compiled.triggers[i] for i in sorted(matched)]
@@ -1,12 +1,87 @@
 import discord
+import functools
 from datetime import datetime
-from typing import Dict, Union
+from typing import Callable, Dict, Iterator, Mapping, Optional, Union
+
+Provider = Callable[[], str]
+
+_MISSING = object()
+
+class LazyContext(Mapping):
+    """
+    Template variables computed on first access
+
+    Each variable is a zero-argument provider; its value is computed the
+    first time a template reads it and memoized for the rest of that render.
+    A compiled template only looks up the placeholders it references, so
+    variables it doesn't use are never built. Plain values can still be set
+    with context["name"] = "value".
+    """
+
+    __slots__ = ("_providers", "_values")
+
+    def __init__(self, values: Optional[Mapping[str, str]] = None, providers: Optional[Dict[str, Provider]] = None):
+        # The context takes ownership of providers (no copy: contexts are built once per render)
+        self._providers: Dict[str, Provider] = providers if providers is not None else {}
+        self._values: Dict[str, str] = dict(values) if values else {}
+
+    def provide(self, name: str, provider: Provider):
+        """Add (or replace) a lazily computed variable"""
+        self._providers[name] = provider
+        self._values.pop(name, None)
+
+    def extend(self, providers: Dict[str, Provider]) -> "LazyContext":
+        """New context with extra providers; nothing already here is computed"""
+        context = LazyContext(self._values, dict(self._providers))
+        context._providers.update(providers)
+        for name in providers:
+            context._values.pop(name, None)
+        return context
+
+    def __setitem__(self, name: str, value: str):
+        self._values[name] = value
+
+    def __getitem__(self, name: str) -> str:
+        value = self._values.get(name, _MISSING)
+        if value is _MISSING:
+            value = self._values[name] = self._providers[name]()
+        return value
+
+    def get(self, name: str, default=None):
+        value = self._values.get(name, _MISSING)
+        if value is not _MISSING:
+            return value
+        provider = self._providers.get(name)
+        if provider is None:
+            return default
+        value = self._values[name] = provider()
+        return value
+
+    def __contains__(self, name) -> bool:
+        return name in self._values or name in self._providers
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._values
+        for name in self._providers:
+            if name not in self._values:
+                yield name
+
+    def __len__(self) -> int:
+        return len(self._values.keys() | self._providers.keys())
+
+def _user_providers(user: Union[discord.User, discord.Member]) -> Dict[str, Provider]:
+    return {
+        "user.name": lambda: user.name,
+        "user.mention": lambda: user.mention,
+        "user.id": lambda: str(user.id),
+        "user.display_avatar.url": lambda: str(user.display_avatar.url)
+    }
 
 class VariableContext:
-    """Build variable context dictionaries for template substitution"""
+    """Build variable contexts for template substitution (values are computed lazily)"""
 
     @staticmethod
-    def from_user(user: Union[discord.User, discord.Member]) -> Dict[str, str]:
+    def from_user(user: Union[discord.User, discord.Member]) -> LazyContext:
         """
         Build context from user object
 
@@ -14,17 +89,12 @@ class VariableContext:
             user: Discord user or member object
 
         Returns:
-            Dictionary of user-related variables
+            Context with user-related variables
         """
-        return {
-            "user.name": user.name,
-            "user.mention": user.mention,
-            "user.id": str(user.id),
-            "user.display_avatar.url": str(user.display_avatar.url)
-        }
+        return LazyContext(providers=_user_providers(user))
 
     @staticmethod
-    def from_level_data(user: Union[discord.User, discord.Member], level: int, xp: int, xp_needed: int) -> Dict[str, str]:
+    def from_level_data(user: Union[discord.User, discord.Member], level: int, xp: int, xp_needed: int) -> LazyContext:
         """
         Build context for leveling embeds
 
@@ -35,36 +105,36 @@ class VariableContext:
             xp_needed: XP needed for next level
 
         Returns:
-            Dictionary with user and leveling variables
+            Context with user and leveling variables
         """
-        return {
-            **VariableContext.from_user(user),
-            "level": str(level),
-            "xp": str(xp),
-            "xp_needed": str(xp_needed)
-        }
+        providers = _user_providers(user)
+        providers["level"] = lambda: str(level)
+        providers["xp"] = lambda: str(xp)
+        providers["xp_needed"] = lambda: str(xp_needed)
+        return LazyContext(providers=providers)
 
     @staticmethod
-    def add_timestamp(context: Dict[str, str]) -> Dict[str, str]:
+    def add_timestamp(context: Mapping[str, str]) -> LazyContext:
         """
         Add timestamp variables to existing context
 
         Args:
-            context: Existing context dictionary
+            context: Existing context (a LazyContext or a plain dict)
 
         Returns:
             Context with timestamp variables added
         """
-        now = datetime.now()
-        return {
-            **context,
-            "timestamp": now.strftime("%Y-%m-%d %H:%M:%S"),
-            "date": now.strftime("%Y-%m-%d"),
-            "time": now.strftime("%H:%M:%S")
-        }
+        # One clock reading shared by all three variables, taken only if one is used
+        now = functools.cache(datetime.now)
+        base = context if isinstance(context, LazyContext) else LazyContext(context)
+        return base.extend({
+            "timestamp": lambda: now().strftime("%Y-%m-%d %H:%M:%S"),
+            "date": lambda: now().strftime("%Y-%m-%d"),
+            "time": lambda: now().strftime("%H:%M:%S")
+        })
 
     @staticmethod
-    def from_moderation(user: Union[discord.User, discord.Member], moderator: Union[discord.User, discord.Member], reason: str, duration: str = None) -> Dict[str, str]:
+    def from_moderation(user: Union[discord.User, discord.Member], moderator: Union[discord.User, discord.Member], reason: str, duration: str = None) -> LazyContext:
         """
         Build context for moderation embeds
 
@@ -75,15 +145,13 @@ class VariableContext:
             duration: Optional duration string
 
         Returns:
-            Dictionary with moderation-related variables
+            Context with moderation-related variables
         """
-        context = {
-            **VariableContext.from_user(user),
-            "moderator.name": moderator.name,
-            "moderator.mention": moderator.mention,
-            "moderator.id": str(moderator.id),
-            "reason": reason
-        }
+        providers = _user_providers(user)
+        providers["moderator.name"] = lambda: moderator.name
+        providers["moderator.mention"] = lambda: moderator.mention
+        providers["moderator.id"] = lambda: str(moderator.id)
+        context = LazyContext({"reason": reason}, providers)
         if duration:
             context["duration"] = duration
         return context